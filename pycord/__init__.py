@@ -28,6 +28,7 @@ from .integration import *
 from .interaction import *
 from .interface import *
 from .invite import *
+from .lazy import *
 from .media import *
 from .member import *
 from .message import *
@@ -19,7 +19,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
 import asyncio
-from typing import Any, AsyncGenerator, Type, TypeVar
+from typing import Any, AsyncGenerator, Callable, Iterable, Type, TypeVar
 
 from aiohttp import BasicAuth
 
@@ -36,12 +36,18 @@ from .errors import BotException, NoIdentifiesLeft, OverfilledShardsException
 from .events.event_manager import Event
 from .file import File
 from .flags import Intents, SystemChannelFlags
-from .gateway import PassThrough, ShardCluster, ShardManager
+from .gateway import (
+    IdentifyScheduler,
+    Payload,
+    ShardCluster,
+    ShardManager,
+    ShardMetrics,
+)
 from .guild import Guild, GuildPreview
 from .interface import print_banner, start_logging
 from .missing import MISSING, Maybe, MissingEnum
 from .snowflake import Snowflake
-from .state import State
+from .state import CachePolicy, CacheServer, EvictionPolicy, State, Store
 from .types import AsyncFunc
 from .types.audit_log import AUDIT_LOG_EVENT_TYPE
 from .user import User
@@ -64,8 +70,66 @@ class Bot:
         The logging flavor this bot uses
 
         Defaults to `None`.
-    max_messages: :class:`int`
-        The maximum amount of Messages to cache
+    max_messages: :class:`int` | :class:`.state.EvictionPolicy`
+        The maximum amount of Messages to cache.
+        Passing an eviction policy, like :class:`.state.TTLPolicy`,
+        changes how old messages are removed.
+
+        Defaults to 1000, evicting the least recently used message.
+    max_messages_per_channel: :class:`int` | None
+        The maximum amount of Messages to cache per channel.
+        When set, every channel gets its own buffer and ``max_messages``
+        is used as a global cap, evicting from the busiest channels first.
+
+        Defaults to `None`.
+    stores: dict[:class:`str`, :class:`.state.Store`] | None
+        Custom Stores to cache with, by name (such as ``'guilds'`` or ``'members'``).
+        For example, ``{'guilds': SQLiteStore('cache.db', 'guilds')}``
+        keeps guilds cached across restarts.
+
+        Defaults to `None`.
+    snapshot: :class:`str` | None
+        The path of a cache snapshot file.
+        When set, the cache and shard sessions are saved to it on shutdown
+        and restored from it on startup, resuming the previous gateway sessions
+        instead of identifying again.
+        Only the shards of this process are snapshotted.
+
+        Defaults to `None`.
+    lazy_cache: :class:`bool`
+        Whether to cache raw payloads, only building models like
+        :class:`.Guild`, :class:`.Member` and :class:`.Message`
+        the first time they're accessed.
+
+        Defaults to `False`.
+    compact_members: :class:`bool`
+        Whether to cache members in a :class:`.state.MemberStore`,
+        which takes a fraction of the memory in exchange for
+        rebuilding members whenever they're accessed.
+        Recommended for bots caching very large guilds.
+
+        Defaults to `False`.
+    cache_indexes: :class:`bool`
+        Whether to index cached members by role, channels by type
+        and messages by author, for lookups like :meth:`.Guild.get_members_with_role`.
+
+        Defaults to `True`.
+    cache_policy: :class:`.state.CachePolicy` | None
+        Which entities to cache, and how many of each.
+        Entities it leaves unset are derived from ``intents`` and the
+        registered listeners when the bot starts, and again whenever
+        a listener is added, so bots which only handle interactions
+        don't cache anything.
+
+        Defaults to `None`, caching everything.
+    cache_server: :class:`str` | None
+        The path of a Unix socket to share the cache over.
+        Every process using the same path caches into one
+        :class:`.state.CacheServer`, which is started by the first of them,
+        so clusters don't each hold their own copy of the cache
+        and can look up objects received by each other.
+
+        Defaults to `None`.
     shards: :class:`int` | list[:class:`int`]
         The amount of shards this bot should launch with.
 
@@ -79,6 +143,51 @@ class Bot:
     global_shard_status: :class:`int`
         The amount of shards globally deployed.
         Only supported on bots not using `.cluster`.
+    encoding: :class:`str`
+        The encoding of gateway payloads, either ``'json'`` or ``'etf'``.
+        ETF payloads are smaller on the wire, but are decoded in pure Python,
+        which is slower than JSON, so ETF only pays off when bandwidth
+        rather than CPU is the bottleneck.
+
+        Defaults to ``'json'``.
+    compression: :class:`str`
+        The transport compression of the gateway, either ``'zlib-stream'``
+        or ``'zstd-stream'``, which decompresses much faster but
+        requires the ``zstandard`` package.
+
+        Defaults to ``'zlib-stream'``.
+    typed_payloads: :class:`bool`
+        Whether to decode the payloads of ``GUILD_CREATE``, ``GUILD_MEMBER_ADD``
+        and ``MESSAGE_CREATE`` into msgspec Structs instead of dicts,
+        building their models from the Structs' attributes.
+        This mostly speeds up ``GUILD_CREATE``, whose presences and voice
+        states aren't decoded at all, while ``MESSAGE_CREATE`` takes about
+        as long either way since building the Message dominates.
+        Requires msgspec, and only applies to the JSON encoding.
+
+        Defaults to `False`.
+    allowed_guilds: Iterable[:class:`int`] | None
+        The only guilds to dispatch and cache events of, for bots which
+        only serve some of their guilds from this process.
+        Events outside of guilds, like direct messages, are always dispatched.
+
+        Defaults to `None`, allowing every guild.
+    denied_guilds: Iterable[:class:`int`] | None
+        Guilds to never dispatch nor cache events of.
+
+        Defaults to `None`.
+    on_identify_progress: Callable[[:class:`.gateway.IdentifyScheduler`], Any] | None
+        Called whenever a shard identifies while starting up, with the scheduler
+        holding the amount of shards identified, pending and the ETA until
+        every shard identified. Progress is also logged once per wave.
+
+        Defaults to `None`.
+    on_shard_metrics: Callable[[:class:`.gateway.ShardMetrics`], Any] | None
+        Called with the metrics of a shard whenever it receives a heartbeat
+        acknowledgement, to export them to monitoring.
+        Metrics can also be read at any time through :attr:`shard_metrics`.
+
+        Defaults to `None`.
 
     Attributes
     ----------
@@ -93,23 +202,60 @@ class Bot:
         intents: Intents,
         print_banner_on_startup: bool = True,
         logging_flavor: int | str | dict[str, Any] | None = None,
-        max_messages: int = 1000,
+        max_messages: int | EvictionPolicy = 1000,
         shards: int | list[int] | None = None,
         global_shard_status: int | None = None,
         proxy: str | None = None,
         proxy_auth: BasicAuth | None = None,
         verbose: bool = False,
+        max_messages_per_channel: int | None = None,
+        stores: dict[str, Store] | None = None,
+        snapshot: str | None = None,
+        lazy_cache: bool = False,
+        compact_members: bool = False,
+        cache_indexes: bool = True,
+        cache_policy: CachePolicy | None = None,
+        cache_server: str | None = None,
+        encoding: str = 'json',
+        compression: str = 'zlib-stream',
+        typed_payloads: bool = False,
+        allowed_guilds: Iterable[int] | None = None,
+        denied_guilds: Iterable[int] | None = None,
+        on_identify_progress: Callable[[IdentifyScheduler], Any] | None = None,
+        on_shard_metrics: Callable[[ShardMetrics], Any] | None = None,
     ) -> None:
+        if typed_payloads and Payload is None:
+            raise ValueError('typed_payloads requires msgspec to be installed')
+
         self.intents: Intents = intents
-        self.max_messages: int = max_messages
+        self.max_messages: int | EvictionPolicy = max_messages
         self._state: State = State(
-            intents=self.intents, max_messages=self.max_messages, verbose=verbose
+            intents=self.intents,
+            max_messages=self.max_messages,
+            max_messages_per_channel=max_messages_per_channel,
+            stores=stores,
+            lazy_cache=lazy_cache,
+            typed_payloads=typed_payloads,
+            allowed_guilds=allowed_guilds,
+            denied_guilds=denied_guilds,
+            on_identify_progress=on_identify_progress,
+            on_shard_metrics=on_shard_metrics,
+            compact_members=compact_members,
+            cache_indexes=cache_indexes,
+            cache_policy=cache_policy,
+            cache_server=cache_server,
+            verbose=verbose,
         )
         self._shards = shards
         self._logging_flavor: int | str | dict[str, Any] = logging_flavor
         self._print_banner = print_banner_on_startup
         self._proxy = proxy
         self._proxy_auth = proxy_auth
+        self._snapshot = snapshot
+        self._encoding = encoding
+        self._compression = compression
+        self._cache_server = cache_server
+        self._cache_server_process: CacheServer | None = None
         if shards and not global_shard_status:
             if isinstance(shards, list):
                 self._global_shard_status = len(shards)
@@ -126,15 +272,20 @@ class Bot:
 
     async def _run_async(self, token: str) -> None:
         start_logging(flavor=self._logging_flavor)
+        self._start_cache_server()
         self._state.bot_init(
             token=token, clustered=False, proxy=self._proxy, proxy_auth=self._proxy_auth
         )
 
+        if self._snapshot:
+            await self._state.load_snapshot(self._snapshot)
+
         info = await self._state.http.get_gateway_bot()
         session_start_limit = info['session_start_limit']
 
-        self._state.shard_concurrency = PassThrough(
-            session_start_limit['max_concurrency'], 7
+        self._state.shard_concurrency = IdentifyScheduler(
+            session_start_limit['max_concurrency'],
+            on_progress=self._state.options.get('on_identify_progress'),
         )
         self._state._session_start_limit = session_start_limit
 
@@ -158,6 +309,8 @@ class Bot:
             self._global_shard_status or len(shards),
             proxy=self._proxy,
             proxy_auth=self._proxy_auth,
+            encoding=self._encoding,
+            compression=self._compression,
         )
         await sharder.start()
         self._state.shard_managers.append(sharder)
@@ -183,20 +336,52 @@ class Bot:
 
         await self._run_until_exited()
 
+    def _start_cache_server(self) -> None:
+        # only saves starting a process, servers started together
+        # are kept from replacing each other by their lock
+        if self._cache_server and not CacheServer.running(self._cache_server):
+            self._cache_server_process = CacheServer(
+                self._cache_server, messages_max_items=self.max_messages
+            )
+            self._cache_server_process.start()
+
     async def _run_until_exited(self) -> None:
         try:
             await asyncio.Future()
         except (asyncio.CancelledError, KeyboardInterrupt):
             # most things are already handled by the asyncio.run function
             # the only thing we have to worry about are aiohttp errors
+            if self._snapshot:
+                await self._save_snapshot()
+
             await self._state.http.close_session()
             for sm in self._state.shard_managers:
                 await sm.session.close()
 
+            for store in self._state.store.get_stores():
+                store.close()
+
+            if self._cache_server_process is not None:
+                self._cache_server_process.terminate()
+
             if self._state._clustered:
                 for sc in self._state.shard_clusters:
                     sc.keep_alive.set_result(None)
 
+    async def _save_snapshot(self) -> None:
+        self._state.save_snapshot(self._snapshot)
+
+        for sm in self._state.get_shard_managers():
+            for shard in sm.shards:
+                shard._receive_task.cancel()
+
+                if shard._hb_task:
+                    shard._hb_task.cancel()
+
+                # closing with 1000 or 1001 would invalidate the session
+                if shard._ws and not shard._ws.closed:
+                    await shard._ws.close(code=1012)
+
     def run(self, token: str) -> None:
         """
         Run the Bot without being clustered.
@@ -215,10 +400,14 @@ class Bot:
         self, token: str, clusters: int, amount: int, managers: int
     ) -> None:
         start_logging(flavor=self._logging_flavor)
+        self._start_cache_server()
         self._state.bot_init(
             token=token, clustered=True, proxy=self._proxy, proxy_auth=self._proxy_auth
         )
 
+        if self._snapshot:
+            await self._state.load_snapshot(self._snapshot)
+
         info = await self._state.http.get_gateway_bot()
         session_start_limit = info['session_start_limit']
 
@@ -236,8 +425,9 @@ class Bot:
         elif session_start_limit['remaining'] - len(shards) <= 0:
             raise NoIdentifiesLeft('session_start_limit will be exhausted')
 
-        self._state.shard_concurrency = PassThrough(
-            session_start_limit['max_concurrency'], 7
+        self._state.shard_concurrency = IdentifyScheduler(
+            session_start_limit['max_concurrency'],
+            on_progress=self._state.options.get('on_identify_progress'),
         )
         self._state._session_start_limit = session_start_limit
 
@@ -251,6 +441,8 @@ class Bot:
                 managers,
                 proxy=self._proxy,
                 proxy_auth=self._proxy_auth,
+                encoding=self._encoding,
+                compression=self._compression,
             )
             cluster_class.run()
             self._state.shard_clusters.append(cluster_class)
@@ -409,10 +601,93 @@ class Bot:
 
         return wrapper
 
+    @property
+    def shard_metrics(self) -> dict[int, ShardMetrics]:
+        """The metrics of every shard in this process, by shard id."""
+        return {
+            shard_id: metrics
+            for manager in self._state.get_shard_managers()
+            for shard_id, metrics in manager.metrics.items()
+        }
+
     @property
     async def guilds(self) -> AsyncGenerator[Guild, None]:
         return await (self._state.store.sift('guilds')).get_all()
 
+    async def change_presence(
+        self,
+        status: str = 'online',
+        activities: list[dict[str, Any]] | None = None,
+        afk: bool = False,
+        since: int | None = None,
+        shards: Iterable[int] | None = None,
+    ) -> None:
+        """
+        Changes the presence of the bot on every shard of this process.
+
+        Presence updates are sent after heartbeats, identifies, resumes and
+        member requests, and a shard only sends the latest of the presences
+        waiting on its rate limit.
+
+        Parameters
+        ----------
+        status: :class:`str`
+            The status, one of ``'online'``, ``'idle'``, ``'dnd'`` and ``'invisible'``.
+        activities: list[dict[:class:`str`, Any]] | None
+            The activity payloads, such as ``{'name': 'Pycord', 'type': 0}``.
+        afk: :class:`bool`
+            Whether the bot is AFK.
+        since: :class:`int` | None
+            When the bot went idle, as a Unix time in milliseconds.
+        shards: Iterable[:class:`int`] | None
+            Only change the presence on these shards.
+            The presence is then not kept for the other shards.
+        """
+        presence = {
+            'status': status,
+            'activities': activities or [],
+            'afk': afk,
+            'since': since,
+        }
+        shard_ids = None if shards is None else set(shards)
+
+        if shard_ids is None:
+            self._state.presence = presence
+
+        await asyncio.gather(
+            *(
+                shard.update_presence(presence)
+                for manager in self._state.get_shard_managers()
+                for shard in manager.shards
+                if shard_ids is None or shard.id in shard_ids
+            )
+        )
+
+    async def update_voice_state(
+        self,
+        guild_id: Snowflake,
+        channel_id: Snowflake | None,
+        self_mute: bool = False,
+        self_deaf: bool = False,
+    ) -> None:
+        """
+        Joins, moves between or leaves voice channels of a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`Snowflake`
+            The guild id.
+        channel_id: :class:`Snowflake` | None
+            The voice channel to join, or None to leave.
+        self_mute: :class:`bool`
+            Whether the bot is muted.
+        self_deaf: :class:`bool`
+            Whether the bot is deafened.
+        """
+        await self._state.get_shard(guild_id).update_voice_state(
+            guild_id, channel_id, self_mute=self_mute, self_deaf=self_deaf
+        )
+
     async def get_application_role_connection_metadata_records(
         self,
     ) -> list[ApplicationRoleConnectionMetadata]:
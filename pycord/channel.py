@@ -42,6 +42,7 @@ from .types import (
     ThreadMetadata as DiscordThreadMetadata,
 )
 from .typing import Typing
+from .utils import _nullable, apply_patch
 
 if TYPE_CHECKING:
     from .state import State
@@ -202,6 +203,13 @@ class Channel:
 
     __slots__ = ('_state', 'id', 'type', 'name', 'flags')
 
+    # payload key -> (attribute, converter[, raw attribute]), see apply_patch
+    _patchable = {
+        'type': ('type', ChannelType),
+        'name': ('name', None),
+        'flags': ('flags', _nullable(ChannelFlags.from_value, MISSING)),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         self._state = state
         self.id: Snowflake = Snowflake(data['id'])
@@ -213,6 +221,9 @@ class Channel:
             else MISSING
         )
 
+    def _patch(self, data: DiscordChannel) -> dict[str, Any]:
+        return apply_patch(self, data)
+
     async def _base_edit(self, **kwargs: Any) -> Channel:
         data = await self._state.http.modify_channel(self.id, **kwargs)
         return self.__class__(data, self._state)
@@ -273,6 +284,21 @@ class GuildChannel(Channel):
         'default_auto_archive_duration',
     )
 
+    _patchable = {
+        'guild_id': ('guild_id', _nullable(Snowflake, MISSING)),
+        'position': ('position', None),
+        'permission_overwrites': (
+            'permission_overwrites',
+            lambda overwrites: [_Overwrite.from_dict(d) for d in overwrites],
+        ),
+        'topic': ('topic', None),
+        'nsfw': ('nsfw', None),
+        'permissions': ('permissions', _nullable(Permissions.from_value, MISSING)),
+        'parent_id': ('parent_id', _nullable(Snowflake)),
+        'rate_limit_per_user': ('rate_limit_per_user', None),
+        'default_auto_archive_duration': ('default_auto_archive_duration', None),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.guild_id: Snowflake | MissingEnum = (
@@ -303,6 +329,14 @@ class GuildChannel(Channel):
 
 
 class MessageableChannel(Channel):
+    _patchable = {
+        'last_message_id': ('last_message_id', _nullable(Snowflake)),
+        'last_pin_timestamp': (
+            'last_pin_timestamp',
+            _nullable(datetime.fromisoformat),
+        ),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.last_message_id: int | None = (
@@ -376,6 +410,16 @@ class MessageableChannel(Channel):
 
 
 class AudioChannel(GuildChannel):
+    _patchable = {
+        'rtc_region': ('rtc_region', None),
+        'video_quality_mode': (
+            'video_quality_mode',
+            _nullable(VideoQualityMode, MISSING),
+        ),
+        'bitrate': ('bitrate', None),
+        'user_limit': ('user_limit', None),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.rtc_region: str | MissingEnum = data.get('rtc_region', MISSING)
@@ -588,6 +632,16 @@ class AnnouncementChannel(TextChannel):
 
 class Thread(MessageableChannel, GuildChannel):
     # Type 11 & 12
+    _patchable = {
+        'default_thread_rate_limit_per_user': (
+            'default_thread_rate_limit_per_user',
+            None,
+        ),
+        'message_count': ('message_count', None),
+        'thread_metadata': ('thread_metadata', _nullable(ThreadMetadata, MISSING)),
+        'owner_id': ('owner_id', _nullable(Snowflake, MISSING)),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.default_thread_rate_limit_per_user: int | MissingEnum = data.get(
@@ -718,6 +772,18 @@ class DirectoryChannel(Channel):
 
 class ForumChannel(Channel):
     # Type 15
+    _patchable = {
+        'default_sort_order': ('default_sort_order', None),
+        'default_reaction_emoji': (
+            'default_reaction_emoji',
+            _nullable(DefaultReaction, MISSING),
+        ),
+        'available_tags': (
+            'available_tags',
+            lambda tags: [ForumTag.from_dict(d) for d in tags],
+        ),
+    }
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.default_sort_order: int | None | MissingEnum = data.get(
@@ -668,8 +668,8 @@ class ApplicationCommand(Command):
             elif option.type in (3, 4, 5, 10):
                 binding[o._param] = o._inter_copy(option).value
             elif option.type == 6:
-                user = User(
-                    interaction.data['resolved']['users'][option.value], self._state
+                user = self._state.users.intern(
+                    interaction.data['resolved']['users'][option.value]
                 )
 
                 if interaction.guild_id:
@@ -697,8 +697,8 @@ class ApplicationCommand(Command):
                         interaction.data['resolved']['roles'][option.value], self._state
                     )
                 else:
-                    user = User(
-                        interaction.data['resolved']['users'][option.value], self._state
+                    user = self._state.users.intern(
+                        interaction.data['resolved']['users'][option.value]
                     )
 
                     if interaction.guild_id:
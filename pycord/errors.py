@@ -57,6 +57,10 @@ class InvalidAuth(GatewayException):
     pass
 
 
+class ETFError(GatewayException):
+    pass
+
+
 class HTTPException(PycordException):
     def __init__(self, resp: ClientResponse, data: dict[str, Any] | None) -> None:
         self._response = resp
@@ -22,36 +22,54 @@
 from typing import TYPE_CHECKING, Any
 
 from ..channel import CHANNEL_TYPE, identify_channel
+from ..gateway.payloads import is_payload
+from ..lazy import resolve
 from ..message import Message
 from ..snowflake import Snowflake
 from .event_manager import Event
 from .guilds import _GuildAttr
 
 if TYPE_CHECKING:
-    from ..state import State
+    from ..state import Lazy, State
 
 
 class ChannelCreate(Event):
     _name = 'CHANNEL_CREATE'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        channel = identify_channel(data, state)
+        self._channel: Lazy[CHANNEL_TYPE] | CHANNEL_TYPE = state.lazy(
+            identify_channel, data, state
+        )
 
-        deps = [channel.guild_id] if hasattr(channel, 'guild_id') else []
-        await (state.store.sift('channels')).save(deps, channel.id, channel)
-        self.channel = channel
+        deps = [Snowflake(data['guild_id'])] if data.get('guild_id') else []
+        await (state.store.sift('channels')).save(
+            deps, Snowflake(data['id']), self._channel
+        )
+
+    @property
+    def channel(self) -> CHANNEL_TYPE:
+        return resolve(self._channel)
 
 
 class ChannelUpdate(Event):
     _name = 'CHANNEL_UPDATE'
 
+    previous: dict[str, Any] | None
+
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        channel = identify_channel(data, state)
+        channel_id = Snowflake(data['id'])
+        deps = [Snowflake(data['guild_id'])] if data.get('guild_id') else []
+        store = state.store.sift('channels')
+        channel: CHANNEL_TYPE | None = await store.get_one(deps, channel_id)
+
+        # channels changing type, like text to announcement, change class
+        if channel is None or channel.type.value != data['type']:
+            channel = identify_channel(data, state)
+            self.previous = None
+        else:
+            self.previous = channel._patch(data)
 
-        deps = [channel.guild_id] if hasattr(channel, 'guild_id') else []
-        self.previous: CHANNEL_TYPE = await (state.store.sift('channels')).save(
-            deps, channel.id, channel
-        )
+        await store.save(deps, channel_id, channel)
         self.channel = channel
 
 
@@ -83,15 +101,19 @@ class MessageCreate(Event):
     _name = 'MESSAGE_CREATE'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        message = Message(data, state)
-        self.message = message
-        self.is_human = message.author.bot is False
-        self.content = self.message.content
+        build = Message._from_payload if is_payload(data) else Message
+        self._message: Lazy[Message] | Message = state.lazy(build, data, state)
+        self.is_human = not data['author'].get('bot', False)
+        self.content: str = data['content']
 
         await (state.store.sift('messages')).save(
-            [message.channel_id], message.id, message
+            [Snowflake(data['channel_id'])], Snowflake(data['id']), self._message
         )
 
+    @property
+    def message(self) -> Message:
+        return resolve(self._message)
+
 
 class MessageUpdate(Event):
     _name = 'MESSAGE_UPDATE'
@@ -111,6 +133,10 @@ class MessageUpdate(Event):
         else:
             message: Message = self.previous
             message._modify_from_cache(**data)
+            # stores which don't keep objects in memory need the changes saved
+            await state.store.sift('messages').save(
+                [message.channel_id], message.id, message
+            )
 
         self.message = message
 
@@ -135,10 +161,12 @@ class MessageBulkDelete(Event):
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
         channel_id = Snowflake(data['channel_id'])
+        message_ids = [Snowflake(id) for id in data['ids']]
+        cached = await (state.store.sift('messages')).discard_many(
+            [channel_id], message_ids
+        )
         bulk: list[Message | int] = [
-            (await (state.store.sift('messages')).discard([channel_id], message_id))
-            or message_id
-            for message_id in (Snowflake(id) for id in data['ids'])
+            message or message_id for message, message_id in zip(cached, message_ids)
         ]
         self.deleted_messages = bulk
         self.length = len(bulk)
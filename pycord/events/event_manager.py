@@ -58,6 +58,8 @@ class EventManager:
             self.events[event] = []
 
         self.wait_fors: dict[Type[Event], list[Future]] = {}
+        # names of the events anything needs, see wants
+        self._wanted: set[str] | None = None
 
     def add_event(self, event: Type[Event], func: AsyncFunc) -> None:
         try:
@@ -65,7 +67,10 @@ class EventManager:
         except KeyError:
             self.events[event] = [func]
 
+        self.refresh()
+
     def wait_for(self, event: Type[T]) -> Future[T]:
+        self._wanted = None
         fut = Future()
 
         try:
@@ -75,6 +80,32 @@ class EventManager:
 
         return fut
 
+    def wants(self, name: str) -> bool:
+        """
+        Whether any listener, waiter or cache needs an event,
+        letting Shards skip decoding the events nothing needs
+        """
+        if self._wanted is None:
+            wanted = {event._name for event in self.wait_fors}
+
+            for event, funcs in self.events.items():
+                if funcs or (
+                    event in self._base_events and self._state.needs_event(event)
+                ):
+                    wanted.add(event._name)
+
+            self._wanted = wanted
+
+        return name in self._wanted
+
+    def refresh(self) -> None:
+        """
+        Recomputes which events are needed, and which entities the cache
+        policy caches, after listeners or the cache's Stores change.
+        """
+        self._wanted = None
+        self._state.apply_cache_policy()
+
     async def publish(self, event_str: str, data: dict[str, Any]) -> None:
         # in certain cases, events may be inserted during runtime which breaks dispatching
         items = list(self.events.items())
@@ -24,17 +24,18 @@ import functools
 from typing import TYPE_CHECKING, Any
 
 from ..channel import Channel, Thread, identify_channel
+from ..gateway.payloads import is_payload
 from ..guild import Guild
+from ..lazy import resolve
 from ..member import Member
 from ..role import Role
 from ..scheduled_event import ScheduledEvent
 from ..snowflake import Snowflake
 from ..stage_instance import StageInstance
-from ..user import User
 from .event_manager import Event
 
 if TYPE_CHECKING:
-    from ..state import State
+    from ..state import Lazy, State
 
 
 class _GuildAttr(Event):
@@ -68,56 +69,113 @@ class _MemberAttr(Event):
         return member
 
 
+def _id(value: str | int | None) -> Snowflake | None:
+    return Snowflake(value) if value is not None else None
+
+
 class GuildCreate(Event):
     _name = 'GUILD_CREATE'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> bool:
-        self.guild = Guild(data, state=state)
-        self.channels: list[Channel] = [
-            identify_channel(c, state) for c in data['channels']
+        guild_id = Snowflake(data['id'])
+
+        # in lazy cache mode, models are only built once they're accessed
+        self._guild: Lazy[Guild] | Guild = state.lazy(Guild, data, state=state)
+        self._channels: list[Lazy[Channel] | Channel] = [
+            state.lazy(identify_channel, c, state) for c in data['channels']
         ]
-        self.threads: list[Thread] = [
-            identify_channel(c, state) for c in data['threads']
+        self._threads: list[Lazy[Thread] | Thread] = [
+            state.lazy(identify_channel, c, state) for c in data['threads']
         ]
-        self.stage_instances: list[StageInstance] = [
-            StageInstance(st, state) for st in data['stage_instances']
+        self._stage_instances: list[Lazy[StageInstance] | StageInstance] = [
+            state.lazy(StageInstance, st, state) for st in data['stage_instances']
         ]
-        self.guild_scheduled_events: list[ScheduledEvent] = [
-            ScheduledEvent(se, state) for se in data['guild_scheduled_events']
+        self._guild_scheduled_events: list[
+            Lazy[ScheduledEvent] | ScheduledEvent
+        ] = [
+            state.lazy(ScheduledEvent, se, state)
+            for se in data['guild_scheduled_events']
         ]
 
-        await (state.store.sift('guilds')).save(
-            [self.guild.id], self.guild.id, self.guild
+        await (state.store.sift('guilds')).save([guild_id], guild_id, self._guild)
+
+        await (state.store.sift('roles')).save_many(
+            ([guild_id], Snowflake(role['id']), state.lazy(Role, role, state))
+            for role in data.get('roles', [])
         )
 
-        for channel in self.channels:
-            await (state.store.sift('channels')).save(
-                [self.guild.id], channel.id, channel
-            )
+        await (state.store.sift('channels')).save_many(
+            ([guild_id], Snowflake(c['id']), channel)
+            for c, channel in zip(data['channels'], self._channels)
+        )
 
-        for thread in self.threads:
-            await (state.store.sift('threads')).save(
-                [self.guild.id, thread.parent_id], thread.id, thread
-            )
+        await (state.store.sift('threads')).save_many(
+            ([guild_id, _id(t.get('parent_id'))], Snowflake(t['id']), thread)
+            for t, thread in zip(data['threads'], self._threads)
+        )
 
-        for stage in self.stage_instances:
-            await (state.store.sift('stages')).save(
-                [stage.channel_id, self.guild.id, stage.guild_scheduled_event_id],
-                stage.id,
+        await (state.store.sift('stages')).save_many(
+            (
+                [
+                    Snowflake(st['channel_id']),
+                    guild_id,
+                    _id(st.get('guild_scheduled_event_id')),
+                ],
+                Snowflake(st['id']),
                 stage,
             )
+            for st, stage in zip(data['stage_instances'], self._stage_instances)
+        )
 
-        for scheduled_event in self.guild_scheduled_events:
-            await (state.store.sift('scheduled_events')).save(
+        await (state.store.sift('scheduled_events')).save_many(
+            (
                 [
-                    scheduled_event.channel_id,
-                    scheduled_event.creator_id,
-                    scheduled_event.entity_id,
-                    self.guild.id,
+                    _id(se.get('channel_id')),
+                    _id(se.get('creator_id')),
+                    _id(se.get('entity_id')),
+                    guild_id,
                 ],
-                scheduled_event.id,
+                Snowflake(se['id']),
                 scheduled_event,
             )
+            for se, scheduled_event in zip(
+                data['guild_scheduled_events'], self._guild_scheduled_events
+            )
+        )
+
+        if state.cache_guild_members:
+            members = data.get('members', [])
+            build = (
+                Member._from_payload if members and is_payload(members[0]) else Member
+            )
+            await (state.store.sift('members')).save_many(
+                (
+                    [guild_id],
+                    Snowflake(m['user']['id']),
+                    state.lazy(build, m, state, guild_id=guild_id),
+                )
+                for m in members
+            )
+
+    @property
+    def guild(self) -> Guild:
+        return resolve(self._guild)
+
+    @functools.cached_property
+    def channels(self) -> list[Channel]:
+        return [resolve(channel) for channel in self._channels]
+
+    @functools.cached_property
+    def threads(self) -> list[Thread]:
+        return [resolve(thread) for thread in self._threads]
+
+    @functools.cached_property
+    def stage_instances(self) -> list[StageInstance]:
+        return [resolve(stage) for stage in self._stage_instances]
+
+    @functools.cached_property
+    def guild_scheduled_events(self) -> list[ScheduledEvent]:
+        return [resolve(se) for se in self._guild_scheduled_events]
 
 
 class GuildAvailable(GuildCreate):
@@ -143,11 +201,21 @@ class GuildJoin(GuildCreate):
 class GuildUpdate(Event):
     _name = 'GUILD_UPDATE'
 
+    previous: dict[str, Any] | None
+
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        guild = Guild(data=data, state=state)
-        res = await (state.store.sift('guilds')).save([guild.id], guild.id, guild)
+        guild_id = Snowflake(data['id'])
+        store = state.store.sift('guilds')
+        guild: Guild | None = await store.get_one([guild_id], guild_id)
+
+        if guild is None or guild.unavailable:
+            guild = Guild(data=data, state=state)
+            self.previous = None
+        else:
+            self.previous = guild._patch(data)
 
-        self.previous = res
+        # saved back for stores which don't keep objects in memory
+        await store.save([guild_id], guild_id, guild)
 
         self.guild = guild
 
@@ -155,16 +223,20 @@ class GuildUpdate(Event):
 class GuildDelete(Event):
     _name = 'GUILD_DELETE'
 
-    async def _is_publishable(self, data: dict[str, Any], _state: 'State') -> bool:
-        if data.get('unavailable', None) is not None:
-            return True
-        else:
-            return False
-
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        guild_id = Snowflake(data['guild_id'])
+        guild_id = Snowflake(data['id'])
         res = await (state.store.sift('guilds')).discard([guild_id], guild_id, Guild)
 
+        self.unavailable: bool = data.get('unavailable', False)
+
+        if not self.unavailable:
+            # the bot left the guild, so nothing cached under it is needed anymore.
+            # outages keep it, since the guild is sent again once available
+            await state.invalidate_guilds([guild_id])
+
+            if int(guild_id) in state._available_guilds:
+                state._available_guilds.remove(int(guild_id))
+
         self.guild = res
         self.guild_id = guild_id
 
@@ -176,7 +248,7 @@ class GuildBanCreate(_GuildAttr):
         guild_id: Snowflake = Snowflake(data['guild_id'])
 
         self.guild_id = guild_id
-        self.user = User(data['user'])
+        self.user = state.users.intern(data['user'])
 
 
 GuildBanAdd = GuildBanCreate
@@ -190,7 +262,7 @@ class GuildBanDelete(_GuildAttr):
         guild_id: Snowflake = Snowflake(data['guild_id'])
 
         self.guild_id = guild_id
-        self.user = User(data['user'])
+        self.user = state.users.intern(data['user'])
 
 
 BanDelete = GuildBanDelete
@@ -201,14 +273,20 @@ class GuildMemberAdd(_GuildAttr):
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
         guild_id = Snowflake(data['guild_id'])
-        member = Member(data, state, guild_id=guild_id)
+        build = Member._from_payload if is_payload(data) else Member
+        self._member: Lazy[Member] | Member = state.lazy(
+            build, data, state, guild_id=guild_id
+        )
         if state.cache_guild_members:
             await (state.store.sift('members')).insert(
-                [guild_id], member.user.id, member
+                [guild_id], Snowflake(data['user']['id']), self._member
             )
 
         self.guild_id = guild_id
-        self.member: Member = member
+
+    @property
+    def member(self) -> Member:
+        return resolve(self._member)
 
 
 MemberJoin = GuildMemberAdd
@@ -217,17 +295,24 @@ MemberJoin = GuildMemberAdd
 class GuildMemberUpdate(_GuildAttr):
     _name = 'GUILD_MEMBER_UPDATE'
 
+    previous: dict[str, Any] | None
+
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
         guild_id = Snowflake(data['guild_id'])
-        member = Member(data, state, guild_id=guild_id)
+        user_id = Snowflake(data['user']['id'])
+        store = state.store.sift('members')
+        member: Member | None = await store.get_one([guild_id], user_id)
 
-        res = await (state.store.sift('members')).save(
-            [guild_id], member.user.id, member
-        )
+        if member is None:
+            member = Member(data, state, guild_id=guild_id)
+            self.previous = None
+        else:
+            self.previous = member._patch(data)
+
+        await store.save([guild_id], user_id, member)
 
-        self.member: Member = res
+        self.member: Member = member
         self.guild_id = guild_id
-        self.previous = res
 
 
 MemberEdit = GuildMemberUpdate
@@ -240,7 +325,7 @@ class GuildMemberRemove(_GuildAttr):
         self.guild_id: Snowflake = Snowflake(data['guild_id'])
         self.user_id: Snowflake = Snowflake(data['user']['id'])
 
-        self.user = User(data['user'], state)
+        self.user = state.users.intern(data['user'])
 
         await (state.store.sift('members')).discard([self.guild_id], self.user_id)
 
@@ -249,21 +334,33 @@ MemberRemove = GuildMemberRemove
 
 
 class GuildMemberChunk(Event):
-    _name = 'GUILD_MEMBER_CHUNK'
-
-    async def _is_publishable(self, _data: dict[str, Any], _state: 'State') -> bool:
-        return False
+    _name = 'GUILD_MEMBERS_CHUNK'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
         guild_id: Snowflake = Snowflake(data['guild_id'])
-        ms: list[Member] = [
-            await (state.store.sift('members')).save([guild_id], member.user.id, member)
-            for member in (
-                Member(member_data, state, guild_id=guild_id)
-                for member_data in data['members']
-            )
+        self.guild_id = guild_id
+        self.nonce: str | None = data.get('nonce')
+        self.chunk_index: int = data['chunk_index']
+        self.chunk_count: int = data['chunk_count']
+        self._members: list[Lazy[Member] | Member] = [
+            state.lazy(Member, member_data, state, guild_id=guild_id)
+            for member_data in data['members']
         ]
-        self.members = ms
+
+        if state.cache_guild_members:
+            await (state.store.sift('members')).save_many(
+                ([guild_id], Snowflake(member_data['user']['id']), member)
+                for member_data, member in zip(data['members'], self._members)
+            )
+
+        request = state._member_requests.get(self.nonce) if self.nonce else None
+
+        if request is not None:
+            request._feed(data, self.members)
+
+    @functools.cached_property
+    def members(self) -> list[Member]:
+        return [resolve(member) for member in self._members]
 
 
 MemberChunk = GuildMemberChunk
@@ -287,12 +384,23 @@ RoleCreate = GuildRoleCreate
 class GuildRoleUpdate(_GuildAttr):
     _name = 'GUILD_ROLE_UPDATE'
 
+    previous: dict[str, Any] | None
+
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
         guild_id: Snowflake = Snowflake(data['guild_id'])
-        role = Role(data['role'], self)
+        role_id = Snowflake(data['role']['id'])
+        store = state.store.sift('roles')
+        role: Role | None = await store.get_one([guild_id], role_id)
 
-        await (state.store.sift('roles')).save([guild_id], role.id, role)
+        if role is None:
+            role = Role(data['role'], state)
+            self.previous = None
+        else:
+            self.previous = role._patch(data['role'])
+
+        await store.save([guild_id], role_id, role)
 
+        self.guild_id = guild_id
         self.role = role
 
 
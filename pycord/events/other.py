@@ -26,51 +26,62 @@ from typing import TYPE_CHECKING, Any, Type
 import typing_extensions
 
 from ..interaction import Interaction
-from ..user import User
 from .event_manager import Event
 
 if TYPE_CHECKING:
     from ..state import State
 
 
+async def _prepare(state: 'State') -> None:
+    # ran once, on the first READY or RESUMED of this process
+    if hasattr(state, '_raw_user_fut'):
+        state._raw_user_fut.set_result(None)
+
+    state._ready = True
+
+    for gear in state.gears:
+        asyncio.create_task(gear.on_attach(), name=f'Attaching Gear: {gear.name}')
+
+    state.application_commands = []
+    state.application_commands.extend(
+        await state.http.get_global_application_commands(state.user.id, True)
+    )
+    state._application_command_names: list[str] = []
+
+    for command in state.commands:
+        await command.instantiate()
+        state.event_manager.add_event(command._processor_event, command._invoke)
+        if hasattr(command, 'name'):
+            state._application_command_names.append(command.name)
+
+    for app_command in state.application_commands:
+        if app_command['name'] not in state._application_command_names:
+            await state.http.delete_global_application_command(
+                state.user.id.real, app_command['id']
+            )
+
+
 class Ready(Event):
     _name = 'READY'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> bool:
         state._available_guilds: list[int] = [int(uag['id']) for uag in data['guilds']]
 
-        user = User(data['user'], state)
+        user = state.users.intern(data['user'])
         state.user = user
         self.user = user
 
         if not state._ready:
-            if hasattr(state, '_raw_user_fut'):
-                state._raw_user_fut.set_result(None)
-
-            state._ready = True
+            await _prepare(state)
 
-            for gear in state.gears:
-                asyncio.create_task(
-                    gear.on_attach(), name=f'Attaching Gear: {gear.name}'
-                )
 
-            state.application_commands = []
-            state.application_commands.extend(
-                await state.http.get_global_application_commands(state.user.id, True)
-            )
-            state._application_command_names: list[str] = []
-
-            for command in state.commands:
-                await command.instantiate()
-                state.event_manager.add_event(command._processor_event, command._invoke)
-                if hasattr(command, 'name'):
-                    state._application_command_names.append(command.name)
+class Resumed(Event):
+    _name = 'RESUMED'
 
-            for app_command in state.application_commands:
-                if app_command['name'] not in state._application_command_names:
-                    await state.http.delete_global_application_command(
-                        state.user.id.real, app_command['id']
-                    )
+    async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
+        # sessions restored from a snapshot never receive a READY
+        if not state._ready and state.user is not None:
+            await _prepare(state)
 
 
 class Hook(Event):
@@ -80,7 +91,7 @@ class Hook(Event):
         if state._ready is True:
             return False
 
-        user = User(data['user'], state)
+        user = state.users.intern(data['user'])
         self.user = user
 
 
@@ -88,7 +99,7 @@ class UserUpdate(Event):
     _name = 'USER_UPDATE'
 
     async def _async_load(self, data: dict[str, Any], state: 'State') -> None:
-        self.user = User(data, state)
+        self.user = state.users.intern(data)
         state.user = self.user
         state.raw_user = data
 
@@ -8,7 +8,11 @@ Advanced Implementation of the Discord Gateway
 """
 from ..events.event_manager import *
 from .cluster import *
+from .compression import *
+from .identify import *
 from .manager import *
+from .metrics import *
 from .notifier import *
 from .passthrough import *
+from .payloads import *
 from .shard import *
@@ -42,6 +42,8 @@ class ShardCluster(Process):
         managers: int,
         proxy: str | None = None,
         proxy_auth: BasicAuth | None = None,
+        encoding: str = 'json',
+        compression: str = 'zlib-stream',
     ) -> None:
         self.shard_managers: list[ShardManager] = []
         self._state = state
@@ -50,6 +52,8 @@ class ShardCluster(Process):
         self._managers = managers
         self._proxy = proxy
         self._proxy_auth = proxy_auth
+        self._encoding = encoding
+        self._compression = compression
         super().__init__()
 
     async def _run(self) -> None:
@@ -58,7 +62,13 @@ class ShardCluster(Process):
         tasks = []
         for sharder in list(chunk(self._shards, self._managers)):
             manager = ShardManager(
-                self._state, sharder, self._amount, self._proxy, self._proxy_auth
+                self._state,
+                sharder,
+                self._amount,
+                self._proxy,
+                self._proxy_auth,
+                encoding=self._encoding,
+                compression=self._compression,
             )
             tasks.append(manager.start())
             self.shard_managers.append(manager)
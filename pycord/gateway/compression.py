@@ -0,0 +1,177 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+from __future__ import annotations
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Sequence, Type
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__: Sequence[str] = (
+    'ZLIB_SUFFIX',
+    'Decompressor',
+    'ZlibStream',
+    'ZstdStream',
+    'COMPRESSIONS',
+    'get_decompressor',
+)
+
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+
+
+class Decompressor(ABC):
+    """
+    The transport compression of a gateway connection.
+
+    A new Decompressor is made for every connection, since
+    the stream's context is shared by every message of a connection.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the compression, as passed to the gateway.
+    """
+
+    __slots__ = ()
+
+    name: str
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes | None:
+        """
+        Decompresses a message, returning ``None`` if it isn't complete yet
+
+        Parameters
+        ----------
+        data: :class:`bytes`
+            The message, as received from the gateway.
+        """
+
+
+class ZlibStream(Decompressor):
+    """
+    zlib-stream, one zlib context shared by the whole connection.
+
+    Payloads can be split over several messages, only the last of which
+    ends with :data:`ZLIB_SUFFIX`, so messages are accumulated into a
+    buffer which is reused for the whole connection and only grows.
+
+    Parameters
+    ----------
+    buffer_size: :class:`int`
+        The amount of bytes to preallocate for split payloads.
+    """
+
+    __slots__ = ('_inflator', '_buffer', '_size')
+
+    name = 'zlib-stream'
+
+    def __init__(self, buffer_size: int = 1 << 16) -> None:
+        self._inflator = zlib.decompressobj()
+        self._buffer = bytearray(buffer_size)
+        # the amount of bytes of the buffer in use
+        self._size = 0
+
+    def _append(self, data: bytes) -> None:
+        end = self._size + len(data)
+
+        if end > len(self._buffer):
+            # grow geometrically, so large payloads don't resize on every message
+            grown = max(end, len(self._buffer) * 2)
+            self._buffer.extend(bytes(grown - len(self._buffer)))
+
+        self._buffer[self._size : end] = data
+        self._size = end
+
+    def decompress(self, data: bytes) -> bytes | None:
+        # the usual case, a whole payload in one message
+        if not self._size and data[-4:] == ZLIB_SUFFIX:
+            return self._inflator.decompress(data)
+
+        self._append(data)
+
+        # the suffix itself can be split over messages
+        if self._size < 4 or self._buffer[self._size - 4 : self._size] != ZLIB_SUFFIX:
+            return
+
+        with memoryview(self._buffer) as view, view[: self._size] as payload:
+            self._size = 0
+            return self._inflator.decompress(payload)
+
+
+class ZstdStream(Decompressor):
+    """
+    zstd-stream, one zstd frame spanning the whole connection.
+
+    Decompresses considerably faster than zlib-stream,
+    and requires the ``zstandard`` package.
+    """
+
+    __slots__ = ('_decompressor',)
+
+    name = 'zstd-stream'
+
+    def __init__(self) -> None:
+        if zstandard is None:
+            raise RuntimeError('zstd-stream requires the zstandard package')
+
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes | None:
+        # every message is flushed, so it decompresses into a whole payload
+        return self._decompressor.decompress(data)
+
+
+COMPRESSIONS: dict[str, Type[Decompressor]] = {
+    ZlibStream.name: ZlibStream,
+    ZstdStream.name: ZstdStream,
+}
+
+
+def get_decompressor(name: str) -> Type[Decompressor]:
+    """
+    Gets the Decompressor for a compression
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the compression, like ``'zlib-stream'``.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        The compression doesn't exist, or its module isn't installed.
+    """
+    try:
+        decompressor = COMPRESSIONS[name]
+    except KeyError:
+        raise ValueError(
+            f'compression must be one of {tuple(COMPRESSIONS)}, not {name!r}'
+        ) from None
+
+    if decompressor is ZstdStream and zstandard is None:
+        raise ValueError('zstd-stream requires the zstandard package')
+
+    return decompressor
@@ -0,0 +1,271 @@
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+"""
+An encoder and decoder for the Erlang External Term Format,
+producing the same shapes as the JSON encoding of the gateway.
+
+Strings, binaries and atoms other than ``nil``, ``true`` and ``false``
+are decoded into :class:`str`, and integers beyond 53 bits, like snowflakes,
+are decoded into :class:`str` as JSON represents them.
+
+This is pure Python, so while ETF payloads are smaller on the wire,
+they're slower to decode than JSON.
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, Callable, Sequence
+
+from ..errors import ETFError
+
+__all__: Sequence[str] = ('decode', 'encode')
+
+VERSION = 131
+
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+SMALL_ATOM_EXT = 115
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+
+_u16 = struct.Struct('>H')
+_u32 = struct.Struct('>I')
+_i32 = struct.Struct('>i')
+_f64 = struct.Struct('>d')
+
+_ATOMS: dict[str, Any] = {'nil': None, 'true': True, 'false': False}
+# JSON can't safely represent larger integers, so Discord sends them as strings
+_MAX_SAFE_INTEGER = 2**53 - 1
+
+
+class _Decoder:
+    __slots__ = ('data', 'pos')
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def _take(self, size: int) -> bytes:
+        end = self.pos + size
+
+        if end > len(self.data):
+            raise ETFError('unexpected end of data')
+
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def _u8(self) -> int:
+        try:
+            value = self.data[self.pos]
+        except IndexError:
+            raise ETFError('unexpected end of data') from None
+
+        self.pos += 1
+        return value
+
+    def _u16(self) -> int:
+        return _u16.unpack(self._take(2))[0]
+
+    def _u32(self) -> int:
+        return _u32.unpack(self._take(4))[0]
+
+    def term(self) -> Any:
+        tag = self._u8()
+
+        try:
+            decode = _DECODERS[tag]
+        except KeyError:
+            raise ETFError(f'unsupported term tag {tag}') from None
+
+        return decode(self)
+
+    def _atom(self, size: int) -> Any:
+        name = self._take(size).decode('utf-8')
+        return _ATOMS.get(name, name)
+
+    def _big(self, size: int) -> int | str:
+        sign = self._u8()
+        value = int.from_bytes(self._take(size), 'little')
+
+        if value > _MAX_SAFE_INTEGER:
+            return str(-value if sign else value)
+
+        return -value if sign else value
+
+    def _list(self, size: int) -> list[Any]:
+        return [self.term() for _ in range(size)]
+
+    def _map(self) -> dict[Any, Any]:
+        size = self._u32()
+        return {self.term(): self.term() for _ in range(size)}
+
+    def _list_ext(self) -> list[Any]:
+        items = self._list(self._u32())
+        tail = self.term()
+
+        # only proper lists, ending with an empty list, are sent by Discord
+        if tail != []:
+            items.append(tail)
+
+        return items
+
+    def _compressed(self) -> Any:
+        size = self._u32()
+        data = zlib.decompress(self.data[self.pos :])
+
+        if len(data) != size:
+            raise ETFError('compressed term has an unexpected size')
+
+        self.pos = len(self.data)
+        return _Decoder(data).term()
+
+
+_DECODERS: dict[int, Callable[[_Decoder], Any]] = {
+    NEW_FLOAT_EXT: lambda d: _f64.unpack(d._take(8))[0],
+    COMPRESSED: _Decoder._compressed,
+    SMALL_INTEGER_EXT: _Decoder._u8,
+    INTEGER_EXT: lambda d: _i32.unpack(d._take(4))[0],
+    FLOAT_EXT: lambda d: float(d._take(31).rstrip(b'\x00')),
+    ATOM_EXT: lambda d: d._atom(d._u16()),
+    SMALL_ATOM_EXT: lambda d: d._atom(d._u8()),
+    ATOM_UTF8_EXT: lambda d: d._atom(d._u16()),
+    SMALL_ATOM_UTF8_EXT: lambda d: d._atom(d._u8()),
+    SMALL_TUPLE_EXT: lambda d: d._list(d._u8()),
+    LARGE_TUPLE_EXT: lambda d: d._list(d._u32()),
+    NIL_EXT: lambda d: [],
+    STRING_EXT: lambda d: d._take(d._u16()).decode('utf-8'),
+    LIST_EXT: _Decoder._list_ext,
+    BINARY_EXT: lambda d: d._take(d._u32()).decode('utf-8'),
+    SMALL_BIG_EXT: lambda d: d._big(d._u8()),
+    LARGE_BIG_EXT: lambda d: d._big(d._u32()),
+    MAP_EXT: _Decoder._map,
+}
+
+
+def decode(data: bytes) -> Any:
+    """
+    Decodes an ETF term
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The term, starting with the format version.
+
+    Raises
+    ------
+    :exc:`.ETFError`
+        The data isn't a valid term.
+    """
+    if not data or data[0] != VERSION:
+        raise ETFError('unsupported format version')
+
+    decoder = _Decoder(data)
+    decoder.pos = 1
+
+    try:
+        return decoder.term()
+    except (UnicodeDecodeError, zlib.error) as exc:
+        raise ETFError(str(exc)) from exc
+
+
+def _encode(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        out += b'\x73\x03nil'
+    elif obj is True:
+        out += b'\x73\x04true'
+    elif obj is False:
+        out += b'\x73\x05false'
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            out += bytes((SMALL_INTEGER_EXT, obj))
+        elif -(2**31) <= obj < 2**31:
+            out.append(INTEGER_EXT)
+            out += _i32.pack(obj)
+        else:
+            magnitude = abs(obj)
+            digits = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, 'little')
+
+            if len(digits) > 255:
+                raise ETFError('integer is too large to encode')
+
+            out += bytes((SMALL_BIG_EXT, len(digits), obj < 0))
+            out += digits
+    elif isinstance(obj, float):
+        out.append(NEW_FLOAT_EXT)
+        out += _f64.pack(obj)
+    elif isinstance(obj, str):
+        _encode(obj.encode('utf-8'), out)
+    elif isinstance(obj, (bytes, bytearray)):
+        out.append(BINARY_EXT)
+        out += _u32.pack(len(obj))
+        out += obj
+    elif isinstance(obj, dict):
+        out.append(MAP_EXT)
+        out += _u32.pack(len(obj))
+
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    elif isinstance(obj, (list, tuple)):
+        if obj:
+            out.append(LIST_EXT)
+            out += _u32.pack(len(obj))
+
+            for item in obj:
+                _encode(item, out)
+
+        out.append(NIL_EXT)
+    else:
+        raise ETFError(f'cannot encode {type(obj).__name__}')
+
+
+def encode(obj: Any) -> bytes:
+    """
+    Encodes an object into an ETF term
+
+    Parameters
+    ----------
+    obj: Any
+        The object, made of dicts, lists, tuples, strings, bytes,
+        integers, floats, booleans and ``None``.
+
+    Raises
+    ------
+    :exc:`.ETFError`
+        The object has a type which can't be encoded.
+    """
+    out = bytearray((VERSION,))
+    _encode(obj, out)
+    return bytes(out)
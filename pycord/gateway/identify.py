@@ -0,0 +1,188 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Sequence
+
+__all__: Sequence[str] = ('IdentifyScheduler',)
+
+_log = logging.getLogger(__name__)
+
+
+class IdentifyScheduler:
+    """
+    Schedules the identifies of every Shard sharing a State.
+
+    Discord lets one shard per rate limit bucket identify every 5 seconds,
+    a shard's bucket being ``shard_id % max_concurrency``, so shards are
+    identified in waves of up to ``max_concurrency`` shards, one per bucket.
+    Every ShardManager and ShardCluster of a Bot share one scheduler.
+
+    Shards wait for their turn before connecting, and report back with
+    :meth:`sent` once their identify is actually sent, since connecting takes
+    a varying amount of time. The interval of a bucket only starts then.
+
+    Resuming doesn't count against the limit, and isn't scheduled.
+
+    Parameters
+    ----------
+    max_concurrency: :class:`int`
+        The amount of rate limit buckets, from ``session_start_limit``.
+    interval: :class:`float`
+        The amount of seconds between identifies of the same bucket.
+    on_progress: Callable[[:class:`IdentifyScheduler`], Any] | None
+        Called with this scheduler whenever a shard identifies,
+        to report :attr:`identified`, :attr:`pending` and :attr:`eta`.
+    timeout: :class:`float`
+        The maximum amount of seconds to wait for a shard to report its
+        identify as sent, before letting the next shard of its bucket go anyway.
+
+    Attributes
+    ----------
+    identified: :class:`int`
+        The amount of shards identified so far.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        interval: float = 5.0,
+        on_progress: Callable[[IdentifyScheduler], Any] | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.max_concurrency = max(max_concurrency, 1)
+        self.interval = interval
+        self.on_progress = on_progress
+        self.timeout = timeout
+        self.identified: int = 0
+        self._locks: dict[int, asyncio.Lock] = {}
+        # bucket -> the loop time its next shard can identify at
+        self._free_at: dict[int, float] = {}
+        # bucket -> the amount of shards waiting on it
+        self._waiting: dict[int, int] = {}
+        # bucket -> resolved once the shard let through sent its identify
+        self._sending: dict[int, asyncio.Future[None]] = {}
+
+    def bucket(self, shard_id: int) -> int:
+        """The rate limit bucket of a shard."""
+        return shard_id % self.max_concurrency
+
+    @property
+    def pending(self) -> int:
+        """The amount of shards waiting to identify."""
+        return sum(self._waiting.values())
+
+    @property
+    def eta(self) -> float:
+        """The approximate amount of seconds until every pending shard identified."""
+        now = asyncio.get_running_loop().time()
+
+        return max(
+            (
+                max(self._free_at.get(bucket, now) - now, 0)
+                + (waiting - 1) * self.interval
+                for bucket, waiting in self._waiting.items()
+                if waiting
+            ),
+            default=0.0,
+        )
+
+    async def wait(self, shard_id: int) -> None:
+        """
+        Waits until a shard is allowed to connect and identify,
+        after which it has to call :meth:`sent`
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        """
+        bucket = self.bucket(shard_id)
+
+        try:
+            lock = self._locks[bucket]
+        except KeyError:
+            lock = self._locks[bucket] = asyncio.Lock()
+
+        self._waiting[bucket] = self._waiting.get(bucket, 0) + 1
+
+        try:
+            async with lock:
+                loop = asyncio.get_running_loop()
+                sending = self._sending.get(bucket)
+
+                if sending is not None and not sending.done():
+                    try:
+                        await asyncio.wait_for(asyncio.shield(sending), self.timeout)
+                    except asyncio.TimeoutError:
+                        pass
+
+                delay = self._free_at.get(bucket, 0) - loop.time()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # until the identify is sent, in case it never is
+                self._free_at[bucket] = loop.time() + self.interval
+                self._sending[bucket] = loop.create_future()
+        finally:
+            self._waiting[bucket] -= 1
+
+    def sent(self, shard_id: int, identified: bool = True) -> None:
+        """
+        Marks the identify of a shard let through by :meth:`wait` as sent,
+        starting the interval of its bucket
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        identified: :class:`bool`
+            Whether the identify was sent, rather than given up on,
+            like when the connection failed.
+        """
+        bucket = self.bucket(shard_id)
+        sending = self._sending.get(bucket)
+
+        if sending is None or sending.done():
+            return
+
+        self._free_at[bucket] = asyncio.get_running_loop().time() + self.interval
+        sending.set_result(None)
+
+        if identified:
+            self.identified += 1
+            self._report()
+
+    def _report(self) -> None:
+        pending = self.pending
+
+        # once per wave, or when the last shard identified
+        if not pending or self.identified % self.max_concurrency == 0:
+            _log.info(
+                f'identified {self.identified} shards, {pending} pending, '
+                f'eta {self.eta:.0f}s'
+            )
+
+        if self.on_progress is not None:
+            self.on_progress(self)
@@ -29,9 +29,10 @@ from ..errors import NoIdentifiesLeft
 
 if TYPE_CHECKING:
     from ..state import State
+    from .metrics import ShardMetrics
 
+from .identify import IdentifyScheduler
 from .notifier import Notifier
-from .passthrough import PassThrough
 from .shard import Shard
 
 
@@ -43,13 +44,19 @@ class ShardManager:
         amount: int,
         proxy: str | None = None,
         proxy_auth: BasicAuth | None = None,
+        encoding: str = 'json',
+        compression: str = 'zlib-stream',
     ) -> None:
         self.shards: list[Shard] = []
         self.amount = amount
+        # shard id -> metrics, outliving restarted shards
+        self.metrics: dict[int, ShardMetrics] = {}
         self._shards = shards
         self._state = state
         self.proxy = proxy
         self.proxy_auth = proxy_auth
+        self.encoding = encoding
+        self.compression = compression
 
     def add_shard(self, shard: Shard) -> None:
         self.shards.insert(shard.id, shard)
@@ -82,8 +89,9 @@ class ShardManager:
             if session_start_limit['remaining'] == 0:
                 raise NoIdentifiesLeft('session_start_limit has been exhausted')
 
-            self._state.shard_concurrency = PassThrough(
-                session_start_limit['max_concurrency'], 7
+            self._state.shard_concurrency = IdentifyScheduler(
+                session_start_limit['max_concurrency'],
+                on_progress=self._state.options.get('on_identify_progress'),
             )
             self._state._session_start_limit = session_start_limit
 
@@ -91,10 +99,23 @@ class ShardManager:
 
         for shard_id in self._shards:
             shard = Shard(
-                id=shard_id, state=self._state, session=self.session, notifier=notifier
+                id=shard_id,
+                state=self._state,
+                session=self.session,
+                notifier=notifier,
+                encoding=self.encoding,
+                compression=self.compression,
             )
 
-            tasks.append(shard.connect(token=self._state.token))
+            session = self._state._resumable_sessions.pop(shard_id, None)
+
+            if session is not None and session['shard_count'] == self.amount:
+                shard.session_id = session['session_id']
+                shard._sequence = session['sequence']
+                shard._resume_gateway_url = session['resume_gateway_url']
+                tasks.append(shard.connect(token=self._state.token, resume=True))
+            else:
+                tasks.append(shard.connect(token=self._state.token))
 
             self.shards.append(shard)
 
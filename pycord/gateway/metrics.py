@@ -0,0 +1,177 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+from __future__ import annotations
+
+import time
+from typing import Any, Sequence
+
+__all__: Sequence[str] = ('ShardMetrics',)
+
+# weight of the newest heartbeat in the average latency
+_SMOOTHING = 0.2
+
+
+class ShardMetrics:
+    """
+    The latency, throughput and health of a Shard.
+
+    Counters are plain attributes bumped as payloads go through the Shard,
+    while rates are only computed when a heartbeat is acknowledged.
+    They're kept by the ShardManager, so they survive the Shard being restarted.
+
+    Parameters
+    ----------
+    shard_id: :class:`int`
+        The id of the shard.
+
+    Attributes
+    ----------
+    latency: :class:`float` | None
+        The seconds between the last heartbeat and its acknowledgement.
+    average_latency: :class:`float` | None
+        The exponentially smoothed heartbeat latency.
+    heartbeats: :class:`int`
+        The amount of heartbeats acknowledged.
+    missed_heartbeats: :class:`int`
+        The amount of heartbeats never acknowledged, each causing a reconnect.
+    reconnects: :class:`int`
+        The amount of times the shard connected again.
+    identifies: :class:`int`
+        The amount of new sessions started.
+    resumes: :class:`int`
+        The amount of sessions resumed.
+    invalid_sessions: :class:`int`
+        The amount of sessions invalidated by Discord.
+    last_close_code: :class:`int` | None
+        The close code of the last closed connection.
+    events: :class:`int`
+        The amount of dispatches received, including skipped ones.
+    skipped_events: :class:`int`
+        The amount of dispatches skipped since nothing needed them.
+    events_per_second: :class:`float`
+        The dispatches received per second, between the last two heartbeats.
+    messages_received: :class:`int`
+        The amount of websocket messages received.
+    bytes_received: :class:`int`
+        The bytes received, as compressed on the wire.
+    bytes_inflated: :class:`int`
+        The bytes of every payload once decompressed.
+    payloads_sent: :class:`int`
+        The amount of payloads sent, including heartbeats.
+    connected_at: :class:`float` | None
+        The Unix time the shard last connected at.
+    """
+
+    __slots__ = (
+        'shard_id',
+        'latency',
+        'average_latency',
+        'heartbeats',
+        'missed_heartbeats',
+        'reconnects',
+        'identifies',
+        'resumes',
+        'invalid_sessions',
+        'last_close_code',
+        'events',
+        'skipped_events',
+        'events_per_second',
+        'messages_received',
+        'bytes_received',
+        'bytes_inflated',
+        'payloads_sent',
+        'connected_at',
+        '_marked_events',
+        '_marked_at',
+    )
+
+    def __init__(self, shard_id: int) -> None:
+        self.shard_id = shard_id
+        self.latency: float | None = None
+        self.average_latency: float | None = None
+        self.heartbeats: int = 0
+        self.missed_heartbeats: int = 0
+        self.reconnects: int = 0
+        self.identifies: int = 0
+        self.resumes: int = 0
+        self.invalid_sessions: int = 0
+        self.last_close_code: int | None = None
+        self.events: int = 0
+        self.skipped_events: int = 0
+        self.events_per_second: float = 0.0
+        self.messages_received: int = 0
+        self.bytes_received: int = 0
+        self.bytes_inflated: int = 0
+        self.payloads_sent: int = 0
+        self.connected_at: float | None = None
+        self._marked_events: int = 0
+        self._marked_at: float = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f'<ShardMetrics shard_id={self.shard_id} latency={self.latency} '
+            f'events_per_second={self.events_per_second:.2f}>'
+        )
+
+    @property
+    def resume_ratio(self) -> float:
+        """The share of sessions which were resumed rather than identified again."""
+        sessions = self.resumes + self.identifies
+        return self.resumes / sessions if sessions else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """How many times larger payloads are once decompressed."""
+        return self.bytes_inflated / self.bytes_received if self.bytes_received else 0.0
+
+    def connected(self) -> None:
+        if self.connected_at is not None:
+            self.reconnects += 1
+
+        self.connected_at = time.time()
+
+    def heartbeat_acknowledged(self, latency: float) -> None:
+        self.heartbeats += 1
+        self.latency = latency
+        self.average_latency = (
+            latency
+            if self.average_latency is None
+            else self.average_latency + _SMOOTHING * (latency - self.average_latency)
+        )
+
+        now = time.monotonic()
+        elapsed = now - self._marked_at
+
+        if elapsed > 0:
+            self.events_per_second = (self.events - self._marked_events) / elapsed
+
+        self._marked_events = self.events
+        self._marked_at = now
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if not name.startswith('_')
+        }
+        data['resume_ratio'] = self.resume_ratio
+        data['compression_ratio'] = self.compression_ratio
+        return data
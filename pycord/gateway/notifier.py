@@ -39,6 +39,7 @@ class Notifier:
         _log.debug(f'Shard {shard.id} died, restarting it')
         shard_id = shard.id
         self.manager.remove_shard(shard)
+        await shard.invalidate_cache()
         del shard
 
         new_shard = Shard(
@@ -46,6 +47,8 @@ class Notifier:
             state=self.manager._state,
             session=self.manager.session,
             notifier=self,
+            encoding=self.manager.encoding,
+            compression=self.manager.compression,
         )
         await new_shard.connect(token=self.manager._state.token)
         self.manager.add_shard(new_shard)
@@ -19,7 +19,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
 import time
-from asyncio import AbstractEventLoop, Future, get_running_loop
+from asyncio import AbstractEventLoop, CancelledError, Future, get_running_loop
+from heapq import heappop, heappush
+from itertools import count
 
 
 class PassThrough:
@@ -28,40 +30,62 @@ class PassThrough:
         self.per: float | int = per
 
         self.current: int = self.concurrency
-        self._reserved: list[Future] = []
+        # (priority, order, future), lower priorities are let through first
+        self._reserved: list[tuple[int, int, Future]] = []
+        self._order = count()
         self.loop: AbstractEventLoop = get_running_loop()
         self.pending_reset: bool = False
 
     async def __aenter__(self) -> 'PassThrough':
-        while self.current == 0:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        ...
+
+    async def acquire(self, priority: int = 0) -> None:
+        """
+        Waits for a slot of the current window,
+        waiters with a lower priority being let through first.
+        """
+        if self.current == 0:
             future = self.loop.create_future()
-            self._reserved.append(future)
-            await future
+            heappush(self._reserved, (priority, next(self._order), future))
+            self._schedule_reset()
+
+            try:
+                await future
+            except CancelledError:
+                # the slot was handed over already, give it back
+                if future.done() and not future.cancelled():
+                    self.current += 1
+                raise
+
+            return
 
         self.current -= 1
+        self._schedule_reset()
 
+    def _schedule_reset(self) -> None:
         if not self.pending_reset:
             self.pending_reset = True
             self.loop.call_later(self.per, self.reset)
 
-        return self
-
-    async def __aexit__(self, *_) -> None:
-        ...
-
     def reset(self) -> None:
         current_time = time.time()
         self.reset_at = current_time + self.per
         self.current = self.concurrency
+        self.pending_reset = False
 
-        for _ in range(self.concurrency):
-            try:
-                self._reserved.pop().set_result(None)
-            except IndexError:
-                break
+        # slots are handed straight to waiters, so new callers can't jump the queue
+        while self.current and self._reserved:
+            future = heappop(self._reserved)[2]
 
-        if len(self._reserved):
-            self.pending_reset = True
-            self.loop.call_later(self.per, self.reset)
-        else:
-            self.pending_reset = False
+            if future.done():
+                continue
+
+            self.current -= 1
+            future.set_result(None)
+
+        if self.current < self.concurrency:
+            self._schedule_reset()
@@ -0,0 +1,263 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+"""
+Typed payloads for the busiest gateway events, decoded straight into
+msgspec Structs derived from :mod:`pycord.types` instead of dicts.
+
+Scalar fields are typed as documented, while nested objects which aren't
+payloads themselves are decoded into dicts as usual.
+Fields the Structs don't declare, like the presences of ``GUILD_CREATE``,
+are skipped without being decoded at all.
+Models on the hot path are built from the Structs' attributes, and
+Structs can still be read like dicts by everything else.
+"""
+from __future__ import annotations
+
+import re
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Iterator,
+    Literal,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from typing_extensions import NotRequired, Required
+
+from ..missing import MISSING
+from ..types import Guild, GuildMember, Message
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__: Sequence[str] = ('Payload', 'TYPED_EVENTS', 'is_payload')
+
+
+if msgspec is not None:
+
+    class Payload(msgspec.Struct, omit_defaults=True):
+        """
+        The base of typed payloads, which can be read like a dict.
+
+        Fields missing from the payload are :data:`.MISSING`,
+        like they are when models read dicts with ``data.get(key, MISSING)``,
+        and are treated as missing keys.
+        """
+
+        def __getitem__(self, key: str) -> Any:
+            value = getattr(self, key, MISSING)
+
+            if value is MISSING:
+                raise KeyError(key)
+
+            return value
+
+        def __setitem__(self, key: str, value: Any) -> None:
+            setattr(self, key, value)
+
+        def __contains__(self, key: object) -> bool:
+            return isinstance(key, str) and getattr(self, key, MISSING) is not MISSING
+
+        def __iter__(self) -> Iterator[str]:
+            return iter(self.keys())
+
+        def get(self, key: str, default: Any = None) -> Any:
+            value = getattr(self, key, MISSING)
+            return default if value is MISSING else value
+
+        def keys(self) -> list[str]:
+            return [
+                key
+                for key in self.__struct_fields__
+                if getattr(self, key) is not MISSING
+            ]
+
+        def items(self) -> list[tuple[str, Any]]:
+            return [(key, getattr(self, key)) for key in self.keys()]
+
+        def to_dict(self) -> dict[str, Any]:
+            """Converts this payload, and the payloads in it, into dicts."""
+            return {key: _to_builtins(value) for key, value in self.items()}
+
+else:
+    Payload = None
+
+
+def is_payload(data: Any) -> bool:
+    """Whether ``data`` is a typed payload, rather than a dict."""
+    return Payload is not None and isinstance(data, Payload)
+
+
+def _to_builtins(value: Any) -> Any:
+    if is_payload(value):
+        return value.to_dict()
+    elif isinstance(value, list):
+        return [_to_builtins(item) for item in value]
+
+    return value
+
+
+_SCALARS = (str, int, float, bool)
+
+
+def _field_type(hint: Any, structs: dict[Any, type]) -> Any:
+    origin = get_origin(hint)
+
+    if origin is NotRequired or origin is Required:
+        return _field_type(get_args(hint)[0], structs)
+    elif hint in structs:
+        # nullability isn't always documented, so every field is nullable
+        return structs[hint] | None
+    elif hint in _SCALARS:
+        return hint | None
+    elif origin is Literal:
+        # typed by the type of its values, so values Discord adds still decode
+        kinds = {type(arg) for arg in get_args(hint)}
+
+        if len(kinds) == 1 and kinds <= set(_SCALARS):
+            return kinds.pop() | None
+    elif origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(hint) if arg is not NoneType]
+
+        if len(args) == 1:
+            return _field_type(args[0], structs)
+        elif set(args) == {int, str}:
+            # snowflakes
+            return int | str | None
+    elif origin is list:
+        item = _field_type(get_args(hint)[0], structs)
+
+        if item is not Any:
+            return list[item] | None
+
+    # anything else is decoded as it would be into a dict
+    return Any
+
+
+def _derive(
+    name: str,
+    typed_dict: Any,
+    structs: dict[Any, type],
+    **extra: Any,
+) -> type:
+    # every field is optional, since gateway payloads are often partial
+    fields = [
+        (key, _field_type(hint, structs), MISSING)
+        for key, hint in {
+            **get_type_hints(typed_dict, include_extras=True),
+            **extra,
+        }.items()
+    ]
+    struct = msgspec.defstruct(name, fields, bases=(Payload,), module=__name__)
+    # pickling looks Structs up by name, for caches which serialize them
+    globals()[name] = struct
+    return struct
+
+
+# event name -> the Struct its payload is decoded into
+TYPED_EVENTS: dict[str, type] = {}
+
+if msgspec is not None:
+    _structs: dict[Any, type] = {}
+    # users are interned from dicts, so they're left as dicts
+    _structs[GuildMember] = _derive('GuildMemberPayload', GuildMember, _structs)
+    # referenced messages are left as dicts, rather than recursing
+    _structs[Message] = _derive('MessagePayload', Message, _structs)
+    _structs[Guild] = _derive(
+        'GuildCreatePayload',
+        Guild,
+        _structs,
+        joined_at=str,
+        large=bool,
+        unavailable=bool,
+        member_count=int,
+        members=list[GuildMember],
+        channels=Any,
+        threads=Any,
+        stage_instances=Any,
+        guild_scheduled_events=Any,
+    )
+
+    TYPED_EVENTS.update(
+        {
+            'MESSAGE_CREATE': _structs[Message],
+            'GUILD_CREATE': _structs[Guild],
+            'GUILD_MEMBER_ADD': _derive(
+                'GuildMemberEventPayload', GuildMember, _structs, guild_id=int | str
+            ),
+        }
+    )
+
+    _decoder = msgspec.json.Decoder()
+    # event name -> a decoder of the whole payload, with its data typed
+    _event_decoders = {
+        event: msgspec.json.Decoder(
+            msgspec.defstruct(
+                f'{struct.__name__}Envelope',
+                [('op', int), ('d', struct), ('s', int | None), ('t', str | None)],
+            )
+        )
+        for event, struct in TYPED_EVENTS.items()
+    }
+
+# Discord puts the event name first in JSON dispatches
+_EVENT = re.compile(rb'\{"t":"([A-Z_]+)"')
+
+
+def decode(data: bytes) -> dict[str, Any]:
+    """
+    Decodes a JSON gateway payload, decoding the data of events
+    in :data:`TYPED_EVENTS` into their Struct
+
+    The event is read from the start of the payload, so every payload
+    is decoded in one pass, events which aren't typed being decoded
+    into dicts like usual.
+    This requires msgspec to be installed.
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The payload.
+    """
+    event = _EVENT.match(data)
+    decoder = event and _event_decoders.get(event[1].decode())
+
+    if decoder is not None:
+        try:
+            envelope = decoder.decode(data)
+        except msgspec.ValidationError:
+            # payloads not matching their documented shape are left as dicts
+            pass
+        else:
+            return {
+                'op': envelope.op,
+                'd': envelope.d,
+                's': envelope.s,
+                't': envelope.t,
+            }
+
+    return _decoder.decode(data)
@@ -22,7 +22,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import zlib
+import re
+import time
 from platform import system
 from random import random
 from typing import TYPE_CHECKING, Any
@@ -37,14 +38,23 @@ from aiohttp import (
 
 from ..errors import DisallowedIntents, InvalidAuth, ShardingRequired
 from ..utils import dumps, loads
+from . import etf, payloads
+from .compression import Decompressor, get_decompressor
+from .metrics import ShardMetrics
 from .passthrough import PassThrough
 
 if TYPE_CHECKING:
     from ..state import State
     from .notifier import Notifier
 
-ZLIB_SUFFIX = b'\x00\x00\xff\xff'
-url = '{base}/?v={version}&encoding=json&compress=zlib-stream'
+url = '{base}/?v={version}&encoding={encoding}&compress={compression}'
+ENCODINGS = ('json', 'etf')
+_DISPATCH = re.compile(rb'\{"t":"([A-Z_]+)","s":(\d+),')
+# send priorities, lower ones going first once the rate limit is hit.
+# heartbeats skip the rate limiter entirely
+SESSION_PRIORITY = 0
+REQUEST_PRIORITY = 1
+PRESENCE_PRIORITY = 2
 _log = logging.getLogger(__name__)
 
 
@@ -68,8 +78,16 @@ class Shard:
         session: ClientSession,
         notifier: Notifier,
         version: int = 10,
+        encoding: str = 'json',
+        compression: str = 'zlib-stream',
     ) -> None:
+        if encoding not in ENCODINGS:
+            raise ValueError(f'encoding must be one of {ENCODINGS}, not {encoding!r}')
+
         self.id = id
+        self.encoding = encoding
+        self.compression = compression
+        self._decompressor_class = get_decompressor(compression)
         self.session_id: str | None = None
         self.version = version
         self._token: str | None = None
@@ -79,7 +97,7 @@ class Shard:
         self._notifier = notifier
         self._state = state
         self._session = session
-        self._inflator: zlib._Decompress | None = None
+        self._decompressor: Decompressor | None = None
         self._sequence: int | None = None
         self._ws: ClientWebSocketResponse | None = None
         self._resume_gateway_url: str | None = None
@@ -89,28 +107,48 @@ class Shard:
         self._connection_alive: asyncio.Future[None] = asyncio.Future()
         self._hello_received: asyncio.Future[None] | None = None
         self._hb_task: asyncio.Task[None] | None = None
+        # the latest presence waiting on the rate limit, newer updates replace it
+        self._presence: dict[str, Any] | None = None
+        self._hb_sent_at: float | None = None
+        # kept by the manager, so restarted shards carry on counting
+        self.metrics: ShardMetrics = notifier.manager.metrics.setdefault(
+            id, ShardMetrics(id)
+        )
 
     async def connect(self, token: str | None = None, resume: bool = False) -> None:
         self._hello_received = asyncio.Future()
-        self._inflator = zlib.decompressobj()
+        self._decompressor = self._decompressor_class()
+
+        identifying = bool(token) and not resume
+
+        if identifying:
+            # waiting after connecting could leave the connection idle for minutes
+            await self._state.shard_concurrency.wait(self.id)
 
         try:
-            async with self._state.shard_concurrency:
-                _log.debug(f'shard:{self.id}: connecting to gateway')
-                self._ws = await self._session.ws_connect(
-                    url=url.format(version=self.version, base=self._resume_gateway_url)
+            _log.debug(f'shard:{self.id}: connecting to gateway')
+            self._ws = await self._session.ws_connect(
+                url=url.format(
+                    version=self.version,
+                    encoding=self.encoding,
+                    compression=self.compression,
+                    base=self._resume_gateway_url
                     if resume and self._resume_gateway_url
-                    else url.format(
-                        version=self.version, base='wss://gateway.discord.gg'
-                    ),
-                    proxy=self._notifier.manager.proxy,
-                    proxy_auth=self._notifier.manager.proxy_auth,
-                )
-                _log.debug(f'shard:{self.id}: connected to gateway')
+                    else 'wss://gateway.discord.gg',
+                ),
+                proxy=self._notifier.manager.proxy,
+                proxy_auth=self._notifier.manager.proxy_auth,
+            )
+            _log.debug(f'shard:{self.id}: connected to gateway')
+            self.metrics.connected()
         except (ClientConnectionError, ClientConnectorError):
             _log.debug(
                 f'shard:{self.id}: failed to connect to discord due to connection errors, retrying in 10 seconds'
             )
+
+            if identifying:
+                self._state.shard_concurrency.sent(self.id, identified=False)
+
             await asyncio.sleep(10)
             await self.connect(token=token, resume=resume)
             return
@@ -124,44 +162,144 @@ class Shard:
                     await self.send_resume()
                 else:
                     await self.send_identify()
+                    # the bucket's interval starts from the identify itself
+                    self._state.shard_concurrency.sent(self.id)
 
-    async def send(self, data: dict[str, Any]) -> None:
-        async with self._rate_limiter:
-            d = dumps(data)
-            _log.debug(f'shard:{self.id}: sending {d}')
-            await self._ws.send_str(d)
+    def _decode(self, data: bytes) -> dict[str, Any]:
+        if self.encoding == 'etf':
+            return etf.decode(data)
+        elif self._state.typed_payloads:
+            return payloads.decode(data)
+
+        return loads(data)
+
+    def _skippable(self, payload: bytes) -> bool:
+        # Discord puts the event name and sequence first in JSON dispatches,
+        # so they can be read without decoding the rest
+        if self.encoding != 'json':
+            return False
+
+        dispatch = _DISPATCH.match(payload)
+
+        if dispatch is None or self._state.event_manager.wants(
+            dispatch[1].decode()
+        ):
+            return False
+
+        self._sequence = int(dispatch[2])
+        return True
+
+    async def _send_payload(self, data: dict[str, Any]) -> None:
+        self.metrics.payloads_sent += 1
+
+        if self.encoding == 'etf':
+            await self._ws.send_bytes(etf.encode(data))
+        else:
+            await self._ws.send_str(dumps(data))
+
+    async def send(
+        self, data: dict[str, Any], priority: int = REQUEST_PRIORITY
+    ) -> None:
+        await self._rate_limiter.acquire(priority)
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f'shard:{self.id}: sending {data}')
+
+        await self._send_payload(data)
 
     async def send_identify(self) -> None:
+        data = {
+            'token': self._token,
+            'properties': {
+                'os': system(),
+                'browser': 'pycord',
+                'device': 'pycord',
+            },
+            'compress': True,
+            'large_threshold': self._state.large_threshold,
+            'shard': [self.id, self._notifier.manager.amount],
+            'intents': self._state.intents.as_bit,
+        }
+
+        if self._state.presence is not None:
+            data['presence'] = self._state.presence
+
+        await self.send({'op': 2, 'd': data}, SESSION_PRIORITY)
+        self.metrics.identifies += 1
+
+    async def send_resume(self) -> None:
         await self.send(
             {
-                'op': 2,
+                'op': 6,
                 'd': {
                     'token': self._token,
-                    'properties': {
-                        'os': system(),
-                        'browser': 'pycord',
-                        'device': 'pycord',
-                    },
-                    'compress': True,
-                    'large_threshold': self._state.large_threshold,
-                    'shard': [self.id, self._notifier.manager.amount],
-                    'intents': self._state.intents.as_bit,
+                    'session_id': self.session_id,
+                    'seq': self._sequence,
                 },
-            }
+            },
+            SESSION_PRIORITY,
         )
+        self.metrics.resumes += 1
 
-    async def send_resume(self) -> None:
+    async def update_presence(self, presence: dict[str, Any]) -> None:
+        waiting = self._presence is not None
+        self._presence = presence
+
+        # the update already waiting sends this presence instead
+        if waiting:
+            return
+
+        try:
+            await self._rate_limiter.acquire(PRESENCE_PRIORITY)
+        except BaseException:
+            self._presence = None
+            raise
+
+        presence, self._presence = self._presence, None
+        await self._send_payload({'op': 3, 'd': presence})
+
+    async def update_voice_state(
+        self,
+        guild_id: int,
+        channel_id: int | None,
+        self_mute: bool = False,
+        self_deaf: bool = False,
+    ) -> None:
         await self.send(
             {
-                'op': 6,
+                'op': 4,
                 'd': {
-                    'token': self._token,
-                    'session_id': self.session_id,
-                    'seq': self._sequence,
+                    'guild_id': str(int(guild_id)),
+                    'channel_id': None if channel_id is None else str(int(channel_id)),
+                    'self_mute': self_mute,
+                    'self_deaf': self_deaf,
                 },
             }
         )
 
+    async def request_guild_members(
+        self,
+        guild_id: int,
+        nonce: str,
+        query: str | None = None,
+        user_ids: list[int] | None = None,
+        limit: int = 0,
+        presences: bool = False,
+    ) -> None:
+        data: dict[str, Any] = {
+            'guild_id': str(int(guild_id)),
+            'limit': limit,
+            'presences': presences,
+            'nonce': nonce,
+        }
+
+        if user_ids is not None:
+            data['user_ids'] = [str(int(user_id)) for user_id in user_ids]
+        else:
+            data['query'] = query or ''
+
+        await self.send({'op': 8, 'd': data})
+
     async def send_heartbeat(self, jitter: bool = False) -> None:
         if jitter:
             await asyncio.sleep(self._heartbeat_interval * random())
@@ -170,7 +308,8 @@ class Shard:
         self._hb_received = asyncio.Future()
         _log.debug(f'shard:{self.id}: sending heartbeat')
         try:
-            await self._ws.send_str(dumps({'op': 1, 'd': self._sequence}))
+            self._hb_sent_at = time.perf_counter()
+            await self._send_payload({'op': 1, 'd': self._sequence})
         except ConnectionResetError:
             _log.debug(
                 f'shard:{self.id}: failed to send heartbeat due to connection reset, reconnecting...'
@@ -184,6 +323,7 @@ class Shard:
             await asyncio.wait_for(self._hb_received, 5)
         except asyncio.TimeoutError:
             _log.debug(f'shard:{self.id}: heartbeat waiting timed out, reconnecting...')
+            self.metrics.missed_heartbeats += 1
             self._receive_task.cancel()
             if not self._ws.closed:
                 await self._ws.close(code=1008)
@@ -194,21 +334,33 @@ class Shard:
             if msg.type == WSMsgType.CLOSED:
                 break
             elif msg.type == WSMsgType.BINARY:
-                if len(msg.data) < 4 or msg.data[-4:] != ZLIB_SUFFIX:
-                    continue
+                metrics = self.metrics
+                metrics.messages_received += 1
+                metrics.bytes_received += len(msg.data)
 
                 try:
-                    text_coded = self._inflator.decompress(msg.data).decode('utf-8')
+                    payload = self._decompressor.decompress(msg.data)
+
+                    if payload is None:
+                        continue
+
+                    metrics.bytes_inflated += len(payload)
+
+                    if self._skippable(payload):
+                        metrics.events += 1
+                        metrics.skipped_events += 1
+                        continue
+
+                    data: dict[str, Any] = self._decode(payload)
                 except Exception as e:
                     # while being an edge case, the data could sometimes be corrupted.
                     _log.debug(
-                        f'shard:{self.id}: failed to decompress gateway data {msg.data}:{e}'
+                        f'shard:{self.id}: failed to decode gateway data {msg.data}:{e}'
                     )
                     continue
 
-                _log.debug(f'shard:{self.id}: received message {text_coded}')
-
-                data: dict[str, Any] = loads(text_coded)
+                if _log.isEnabledFor(logging.DEBUG):
+                    _log.debug(f'shard:{self.id}: received message {data}')
 
                 self._sequence = data.get('s')
 
@@ -217,19 +369,31 @@ class Shard:
                 t: str | None = data.get('t')
 
                 if op == 0:
+                    metrics.events += 1
+
                     if t == 'READY':
                         self.session_id = d['session_id']
                         self._resume_gateway_url = d['resume_gateway_url']
                         self._state.raw_user = d['user']
-                    asyncio.create_task(self._state.event_manager.publish(t, d))
+
+                    if self._state.guild_allowed(t, d):
+                        asyncio.create_task(self._state.event_manager.publish(t, d))
                 elif op == 1:
-                    await self._ws.send_str(dumps({'op': 1, 'd': self._sequence}))
+                    self._hb_sent_at = time.perf_counter()
+                    await self._send_payload({'op': 1, 'd': self._sequence})
                 elif op == 10:
                     self._heartbeat_interval = d['heartbeat_interval'] / 1000
 
                     asyncio.create_task(self.send_heartbeat(jitter=True))
                     self._hello_received.set_result(True)
                 elif op == 11:
+                    if self._hb_sent_at is not None:
+                        metrics.heartbeat_acknowledged(
+                            time.perf_counter() - self._hb_sent_at
+                        )
+                        self._hb_sent_at = None
+                        self._export_metrics()
+
                     if not self._hb_received.done():
                         self._hb_received.set_result(None)
 
@@ -239,13 +403,33 @@ class Shard:
                     await self.connect(token=self._token, resume=True)
                     return
                 elif op == 9:
+                    metrics.invalid_sessions += 1
                     await self._ws.close()
+                    await self.invalidate_cache()
                     await self.connect(token=self._token)
                     return
         await self.handle_close(self._ws.close_code)
 
+    def _export_metrics(self) -> None:
+        export = self._state.options.get('on_shard_metrics')
+
+        if export is None:
+            return
+
+        try:
+            export(self.metrics)
+        except Exception:
+            _log.exception(f'shard:{self.id}: failed to export metrics')
+
+    async def invalidate_cache(self) -> None:
+        # identifying again replays every guild of this shard, and anything
+        # which happened while disconnected was never received
+        _log.debug(f'shard:{self.id}: invalidating cached guilds')
+        await self._state.invalidate_shard(self.id, self._notifier.manager.amount)
+
     async def handle_close(self, code: int | None) -> None:
         _log.debug(f'shard:{self.id}: closed with code {code}')
+        self.metrics.last_close_code = code
         if self._hb_task and not self._hb_task.done():
             self._hb_task.cancel()
         if code in RESUMABLE:
@@ -73,11 +73,11 @@ from .types import (
     WidgetSettings as DiscordWidgetSettings,
 )
 from .user import User
-from .utils import remove_undefined
+from .utils import _nullable, apply_patch, remove_undefined
 from .welcome_screen import WelcomeScreen
 
 if TYPE_CHECKING:
-    from .state import State
+    from .state import MemberRequest, State
 
 
 class ChannelPosition:
@@ -161,6 +161,74 @@ class Guild:
         'system_channel_flags',
     )
 
+    # payload key -> (attribute, converter[, raw attribute]), see apply_patch
+    _patchable = {
+        'name': ('name', None),
+        'icon': ('_icon', None),
+        'icon_hash': ('_icon_hash', None),
+        'splash': ('_splash', None),
+        'discovery_splash': ('_discovery_splash', None),
+        'owner': ('owner', None),
+        'owner_id': ('owner_id', Snowflake),
+        'permissions': ('permissions', Permissions.from_value),
+        'afk_channel_id': ('afk_channel_id', _nullable(Snowflake), '_afk_channel_id'),
+        'afk_timeout': ('afk_timeout', None),
+        'widget_enabled': ('widget_enabled', None),
+        'widget_channel_id': (
+            'widget_channel_id',
+            _nullable(Snowflake),
+            '_widget_channel_id',
+        ),
+        'verification_level': ('verification_level', VerificationLevel),
+        'default_message_notifications': (
+            'default_message_notifications',
+            DefaultMessageNotificationLevel,
+        ),
+        'explicit_content_filter': (
+            'explicit_content_filter',
+            ExplicitContentFilterLevel,
+        ),
+        # roles and emojis are compared raw, and only rebuilt when changed
+        'roles': ('_roles', None),
+        'emojis': ('_emojis', None),
+        'features': ('features', None),
+        'mfa_level': ('mfa_level', MFALevel),
+        'application_id': ('application_id', _nullable(Snowflake), '_application_id'),
+        'system_channel_id': (
+            'system_channel_id',
+            _nullable(Snowflake),
+            '_system_channel_id',
+        ),
+        'system_channel_flags': (
+            'system_channel_flags',
+            SystemChannelFlags.from_value,
+        ),
+        'rules_channel_id': (
+            'rules_channel_id',
+            _nullable(Snowflake),
+            '_rules_channel_id',
+        ),
+        'max_presences': ('max_presences', None),
+        'max_members': ('max_members', None),
+        'vanity_url_code': ('vanity_url', None),
+        'description': ('description', None),
+        'banner': ('_banner', None),
+        'premium_tier': ('premium_tier', PremiumTier),
+        'premium_subscription_count': ('premium_subscription_count', None),
+        'preferred_locale': ('preferred_locale', None),
+        'public_updates_channel_id': (
+            'public_updates_channel_id',
+            _nullable(Snowflake),
+            '_public_updates_channel_id',
+        ),
+        'max_video_channel_users': ('max_video_channel_users', None),
+        'approximate_member_count': ('approximate_member_count', None),
+        'approximate_presence_count': ('approximate_presence_count', None),
+        'welcome_screen': ('welcome_screen', WelcomeScreen, '_welcome_screen'),
+        'nsfw_level': ('nsfw_level', NSFWLevel),
+        'premium_progress_bar_enabled': ('premium_progress_bar_enabled', None),
+    }
+
     def __init__(self, data: DiscordGuild | UnavailableGuild, state: State) -> None:
         self.id: Snowflake = Snowflake(data['id'])
         self._state = state
@@ -275,6 +343,26 @@ class Guild:
         else:
             self.unavailable: bool = True
 
+    def _patch(self, data: DiscordGuild) -> dict[str, Any]:
+        previous = apply_patch(self, data)
+
+        if '_roles' in previous or '_emojis' in previous:
+            # emojis reference roles, so both are rebuilt
+            previous.pop('_roles', None)
+            previous.pop('_emojis', None)
+            previous['roles'] = self.roles
+            previous['emojis'] = self.emojis
+            self._process_roles()
+            self._process_emojis()
+
+        if 'stickers' in data and [int(s.id) for s in self.stickers] != [
+            int(d['id']) for d in data['stickers']
+        ]:
+            previous['stickers'] = self.stickers
+            self.stickers = [Sticker(d, self._state) for d in data['stickers']]
+
+        return previous
+
     def _process_roles(self) -> None:
         self.roles: list[Role] = [Role(role, state=self._state) for role in self._roles]
 
@@ -704,6 +792,46 @@ class Guild:
         data = await self._state.http.get_member(self.id, id)
         return Member(data, self._state, guild_id=self.id)
 
+    async def get_members_with_role(self, role: Snowflake | Role) -> list[Member]:
+        """Gets the cached members of the guild holding a role.
+
+        Parameters
+        ----------
+        role: :class:`Snowflake` | :class:`Role`
+            The role, or its ID.
+
+        Returns
+        -------
+        list[:class:`Member`]
+            The cached members with the role.
+        """
+        role_id = role.id if isinstance(role, Role) else role
+        return await (self._state.store.sift('members')).find(
+            'roles', role_id, [self.id]
+        )
+
+    async def get_cached_channels(
+        self, type: ChannelType | None = None
+    ) -> list[CHANNEL_TYPE]:
+        """Gets the cached channels of the guild.
+
+        Parameters
+        ----------
+        type: :class:`ChannelType` | None
+            Only get channels of this type.
+
+        Returns
+        -------
+        list[:class:`Channel`]
+            The cached channels.
+        """
+        store = self._state.store.sift('channels')
+
+        if type is None:
+            return [channel async for channel in store.get_all_parent([self.id])]
+
+        return await store.find('type', type.value, [self.id])
+
     def list_members(
         self, limit: int = None, after: datetime.datetime | None = None
     ) -> MemberPaginator:
@@ -723,6 +851,51 @@ class Guild:
         """
         return MemberPaginator(self._state, self.id, limit=limit, after=after)
 
+    def request_members(
+        self,
+        query: str | None = None,
+        *,
+        user_ids: list[Snowflake] | None = None,
+        limit: int = 0,
+        presences: bool = False,
+        timeout: float | None = 30.0,
+    ) -> MemberRequest:
+        """Requests members of the guild through the gateway.
+
+        The request goes through the shard the guild is on, under its send rate limit.
+        Members are cached as their chunks arrive, unless guild members aren't cached.
+
+        Parameters
+        ----------
+        query: :class:`str` | None
+            Only request members whose username starts with this,
+            an empty string or None requesting every member.
+        user_ids: list[:class:`Snowflake`] | None
+            Only request the members with these IDs, can't be used with ``query``.
+        limit: :class:`int`
+            The maximum number of members to return, 0 for no limit.
+        presences: :class:`bool`
+            Whether to also request the presences of the members.
+        timeout: :class:`float` | None
+            How long to wait for each chunk, counting from when the request
+            is sent, before the request fails with :exc:`asyncio.TimeoutError`,
+            or None to wait forever.
+
+        Returns
+        -------
+        :class:`MemberRequest`
+            The request, which can be awaited for every member
+            or iterated over with ``async for`` as the chunks arrive.
+        """
+        return self._state.request_members(
+            self.id,
+            query=query,
+            user_ids=user_ids,
+            limit=limit,
+            presences=presences,
+            timeout=timeout,
+        )
+
     async def search_members(
         self,
         query: str,
@@ -31,7 +31,6 @@ from .message import Message
 from .missing import MISSING, Maybe, MissingEnum
 from .snowflake import Snowflake
 from .types import INTERACTION_DATA, Interaction as InteractionData
-from .user import User
 from .webhook import Webhook
 
 if TYPE_CHECKING:
@@ -119,7 +118,7 @@ class Interaction:
         if self.member is not MISSING:
             self.user = self.member.user
         else:
-            self.user = User(_user, state) if _user is not None else MISSING
+            self.user = state.users.intern(_user) if _user is not None else MISSING
         self.token = data['token']
         self.version = data['version']
         _message = data.get('message')
@@ -0,0 +1,66 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+__all__: Sequence[str] = ('Lazy',)
+
+T = TypeVar('T')
+
+
+class Lazy(Generic[T]):
+    """
+    A model which is only built the first time it's accessed.
+
+    Stores hold these in lazy cache mode, keeping the decoded payload
+    around until something actually needs the model.
+    Once built, the model is memoized and the payload released.
+
+    Parameters
+    ----------
+    factory: Callable[..., T]
+        The model class, or function, to build with.
+    args: Any
+        The arguments to build the model with, usually its payload and State.
+    """
+
+    __slots__ = ('_factory', '_args', '_kwargs', '_value')
+
+    def __init__(self, factory: Callable[..., T], *args: Any, **kwargs: Any) -> None:
+        self._factory: Callable[..., T] | None = factory
+        self._args: tuple[Any, ...] | None = args
+        self._kwargs: dict[str, Any] | None = kwargs
+        self._value: T | None = None
+
+    @property
+    def built(self) -> bool:
+        return self._factory is None
+
+    def resolve(self) -> T:
+        if self._factory is not None:
+            self._value = self._factory(*self._args, **self._kwargs)
+            self._factory = self._args = self._kwargs = None
+
+        return self._value
+
+
+def resolve(value: Lazy[T] | T) -> T:
+    return value.resolve() if isinstance(value, Lazy) else value
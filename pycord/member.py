@@ -21,7 +21,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .flags import MemberFlags, Permissions
 from .role import Role
@@ -35,6 +35,7 @@ from .pages import Page
 from .pages.paginator import Paginator
 from .types import GuildMember
 from .user import User
+from .utils import _nullable, apply_patch
 
 
 class Member:
@@ -54,13 +55,32 @@ class Member:
         'communication_disabled_until',
     )
 
+    # payload key -> (attribute, converter[, raw attribute]), see apply_patch
+    _patchable = {
+        'nick': ('nick', None),
+        'avatar': ('_avatar', None),
+        'roles': ('roles', lambda roles: [Snowflake(r) for r in roles]),
+        'joined_at': ('joined_at', _nullable(datetime.fromisoformat)),
+        'premium_since': ('premium_since', _nullable(datetime.fromisoformat)),
+        'deaf': ('deaf', None),
+        'mute': ('mute', None),
+        'pending': ('pending', None),
+        'permissions': ('permissions', _nullable(Permissions.from_value, MISSING)),
+        'communication_disabled_until': (
+            'communication_disabled_until',
+            _nullable(datetime.fromisoformat),
+        ),
+    }
+
     def __init__(
         self, data: GuildMember, state: State, *, guild_id: Snowflake | None = None
     ) -> None:
         self._state: State = state
         self._guild_id: Snowflake | None = guild_id or None
         self.user: User | MissingEnum = (
-            User(data.get('user'), state) if data.get('user') is not None else MISSING
+            state.users.intern(data['user'])
+            if data.get('user') is not None
+            else MISSING
         )
         self.nick: str | None | MissingEnum = data.get('nick', MISSING)
         self._avatar: str | None | MissingEnum = data.get('avatar', MISSING)
@@ -85,6 +105,49 @@ class Member:
             else data.get('communication_disabled_until', MISSING)
         )
 
+    @classmethod
+    def _from_payload(
+        cls, data: Any, state: State, *, guild_id: Snowflake | None = None
+    ) -> Member:
+        """
+        Builds a Member from a typed payload, reading its fields as attributes
+        rather than looking them up like in a dict
+        """
+        self = cls.__new__(cls)
+        self._state = state
+        self._guild_id = guild_id or None
+        self.user = state.users.intern(data.user) if data.user else MISSING
+        self.nick = data.nick
+        self._avatar = data.avatar
+        self.roles = [Snowflake(s) for s in data.roles]
+        self.joined_at = datetime.fromisoformat(data.joined_at)
+        self.premium_since = (
+            datetime.fromisoformat(data.premium_since)
+            if data.premium_since
+            else data.premium_since
+        )
+        self.deaf = data.deaf
+        self.mute = data.mute
+        self.pending = data.pending
+        self.permissions = (
+            Permissions.from_value(data.permissions)
+            if data.permissions is not MISSING
+            else MISSING
+        )
+        self.communication_disabled_until = (
+            datetime.fromisoformat(data.communication_disabled_until)
+            if data.communication_disabled_until
+            else data.communication_disabled_until
+        )
+        return self
+
+    def _patch(self, data: GuildMember) -> dict[str, Any]:
+        if data.get('user') is not None:
+            # users are shared, so they're updated in place
+            self._state.users.intern(data['user'])
+
+        return apply_patch(self, data)
+
     async def edit(
         self,
         *,
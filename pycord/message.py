@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .application import Application
 from .embed import Embed
@@ -153,7 +153,7 @@ class MessageInteraction:
         self.id: Snowflake = Snowflake(data['id'])
         self.type: InteractionType = InteractionType(data['type'])
         self.name: str = data['name']
-        self.user: User = User(data['user'], state)
+        self.user: User = state.users.intern(data['user'])
         self.member: Member | MissingEnum = (
             Member(data.get('member'), state)
             if data.get('member') is not None
@@ -209,6 +209,7 @@ class Message:
         'tts',
         'mentions',
         'mention_roles',
+        'mention_channels',
         'attachments',
         'embeds',
         'reactions',
@@ -234,7 +235,7 @@ class Message:
         self._state = state
         self.id: Snowflake = Snowflake(data['id'])
         self.channel_id: Snowflake = Snowflake(data['channel_id'])
-        self.author: User = User(data['author'], state=state)
+        self.author: User = state.users.intern(data['author'])
         self.content: str = data['content']
         self.timestamp: datetime = datetime.fromisoformat(data['timestamp'])
         self.edited_timestamp: datetime | None = (
@@ -243,7 +244,7 @@ class Message:
             else None
         )
         self.tts: bool = data['tts']
-        self.mentions: list[User] = [User(d, state) for d in data['mentions']]
+        self.mentions: list[User] = [state.users.intern(d) for d in data['mentions']]
         self.mention_roles: list[Snowflake] = [
             Snowflake(i) for i in data['mention_roles']
         ]
@@ -311,9 +312,77 @@ class Message:
             StickerItem(si) for si in data.get('sticker_items', [])
         ]
         self.stickers: list[Sticker] = [Sticker(s) for s in data.get('stickers', [])]
-        self.position: MissingEnum | int = data.get('position', MissingEnum)
+        self.position: MissingEnum | int = data.get('position', MISSING)
         asyncio.create_task(self._retreive_channel())
 
+    @classmethod
+    def _from_payload(cls, data: Any, state: State) -> Message:
+        """
+        Builds a Message from a typed payload, reading its fields as attributes
+        rather than looking them up like in a dict
+        """
+        self = cls.__new__(cls)
+        self._state = state
+        self.id = Snowflake(data.id)
+        self.channel_id = Snowflake(data.channel_id)
+        self.author = state.users.intern(data.author)
+        self.content = data.content
+        self.timestamp = datetime.fromisoformat(data.timestamp)
+        self.edited_timestamp = (
+            datetime.fromisoformat(data.edited_timestamp)
+            if data.edited_timestamp
+            else None
+        )
+        self.tts = data.tts
+        self.mentions = [state.users.intern(d) for d in data.mentions]
+        self.mention_roles = [Snowflake(i) for i in data.mention_roles]
+        self.mention_channels = [ChannelMention(d) for d in data.mention_channels or ()]
+        self.attachments = [Attachment(a, state) for a in data.attachments]
+        self.embeds = [Embed._from_data(e) for e in data.embeds]
+        self.reactions = [Reaction(r) for r in data.reactions or ()]
+        self.nonce = data.nonce
+        self.pinned = data.pinned
+        self.webhook_id = (
+            Snowflake(data.webhook_id)
+            if data.webhook_id not in [MISSING, None]
+            else MISSING
+        )
+        self.type = MessageType(data.type)
+        self.activity = MessageActivity(data.activity) if data.activity else MISSING
+        self.application = (
+            Application(data.application) if data.application else MISSING
+        )
+        self.application_id = (
+            Snowflake(data.application_id)
+            if data.application_id not in [MISSING, None]
+            else MISSING
+        )
+        self.reference = (
+            MessageReference.from_dict(data.message_reference)
+            if data.message_reference
+            else MISSING
+        )
+        self.flags = (
+            MessageFlags.from_value(data.flags)
+            if data.flags not in [MISSING, None]
+            else MISSING
+        )
+        # referenced messages are left as dicts by the payload
+        self.referenced_message = (
+            Message(data.referenced_message, state)
+            if data.referenced_message
+            else MISSING
+        )
+        self.interaction = (
+            MessageInteraction(data.interaction, state) if data.interaction else MISSING
+        )
+        self.thread = Thread(data.thread, state=state) if data.thread else MISSING
+        self.sticker_items = [StickerItem(si) for si in data.sticker_items or ()]
+        self.stickers = [Sticker(s) for s in data.stickers or ()]
+        self.position = data.position
+        asyncio.create_task(self._retreive_channel())
+        return self
+
     async def _retreive_channel(self) -> None:
         exists = await (self._state.store.sift('channels')).get_without_parents(
             self.channel_id
@@ -339,7 +408,9 @@ class Message:
                         # edited timestamp can't be none on edited messages, I think?
                         self.edited_timestamp = datetime.fromisoformat(v)
                     case 'mentions':
-                        self.mentions: list[User] = [User(d, self._state) for d in v]
+                        self.mentions: list[User] = [
+                            self._state.users.intern(d) for d in v
+                        ]
                     case 'mention_roles':
                         self.mention_roles: list[Snowflake] = [Snowflake(i) for i in v]
                     case 'mention_channels':
@@ -405,7 +476,7 @@ class Message:
             after=after,
             limit=limit,
         )
-        return [User(d, self._state) for d in data]
+        return [self._state.users.intern(d) for d in data]
 
     async def remove_all_reactions(self, *, emoji: Emoji | str | None = None) -> None:
         if emoji is not None:
@@ -20,11 +20,12 @@
 # SOFTWARE
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .color import Color
 from .flags import Permissions
 from .snowflake import Snowflake
+from .utils import apply_patch
 
 if TYPE_CHECKING:
     from .state import State
@@ -69,6 +70,20 @@ class Role:
         'tags',
     )
 
+    # payload key -> (attribute, converter[, raw attribute]), see apply_patch
+    _patchable = {
+        'name': ('name', None),
+        'color': ('color', Color),
+        'hoist': ('hoist', None),
+        'icon': ('icon', None),
+        'unicode_emoji': ('unicode_emoji', None),
+        'position': ('position', None),
+        'permissions': ('permissions', Permissions.from_value),
+        'managed': ('managed', None),
+        'mentionable': ('mentionable', None),
+        'tags': ('tags', RoleTags, '_tags'),
+    }
+
     def __init__(self, data: DiscordRole, state: State) -> None:
         self._state = state
         self.id: Snowflake = Snowflake(data['id'])
@@ -87,3 +102,6 @@ class Role:
         self.tags: RoleTags | MissingEnum = (
             RoleTags(self._tags) if self._tags is not MISSING else MISSING
         )
+
+    def _patch(self, data: DiscordRole) -> dict[str, Any]:
+        return apply_patch(self, data)
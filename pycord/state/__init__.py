@@ -6,6 +6,17 @@ Pycord's State, keeps track of everything.
 :copyright: 2021-present Pycord Development
 :license: MIT
 """
+from ..lazy import *
+from .cache_policy import *
 from .core import *
+from .eviction import *
 from .grouped_store import *
+from .indexes import *
+from .member_requests import *
+from .members import *
+from .messages import *
+from .remote import *
+from .sqlite import *
+from .stats import *
 from .store import *
+from .users import *
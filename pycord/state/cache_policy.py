@@ -0,0 +1,160 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence, Union
+
+from ..events.channels import (
+    MessageBulkDelete,
+    MessageCreate,
+    MessageDelete,
+    MessageUpdate,
+)
+from .eviction import EvictionPolicy
+
+if TYPE_CHECKING:
+    from ..events.event_manager import EventManager
+    from ..flags import Intents
+
+__all__: Sequence[str] = ('CachePolicy',)
+
+# whether to cache an entity, or the size to bound its Store to
+CacheSetting = Union[bool, int, EvictionPolicy, None]
+
+# entity -> the intents which deliver it, any of which enables caching it
+_INTENTS: dict[str, tuple[str, ...]] = {
+    'guilds': ('guilds',),
+    'channels': ('guilds',),
+    'threads': ('guilds',),
+    'roles': ('guilds',),
+    'stages': ('guilds',),
+    'scheduled_events': ('guild_scheduled_events',),
+    'members': ('guild_members',),
+    'messages': ('guild_messages', 'direct_messages'),
+}
+
+# entity -> events which have to be listened to for caching it to be useful,
+# on top of its intents
+_EVENTS: dict[str, tuple[type, ...]] = {
+    'messages': (MessageCreate, MessageUpdate, MessageDelete, MessageBulkDelete),
+}
+
+
+class CachePolicy:
+    """
+    Declares which entities are cached, and how many of each.
+
+    Each entity can be set to:
+
+    - ``True``, to cache it with the default bound
+    - ``False``, to not cache it at all
+    - an :class:`int` or :class:`.EvictionPolicy`, to cache it with that bound
+    - ``None``, to derive whether to cache it when the Bot starts
+
+    Derived entities are cached if an intent delivering them is enabled,
+    messages only being cached if message events are also listened to.
+    Bots without any listeners cache nothing, since nothing would read it.
+
+    Parameters
+    ----------
+    guilds: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    channels: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    threads: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    roles: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    members: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    messages: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+        ``True`` uses ``max_messages``.
+    stages: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    scheduled_events: :class:`bool` | :class:`int` | :class:`.EvictionPolicy` | None
+    """
+
+    __slots__ = tuple(_INTENTS)
+
+    def __init__(
+        self,
+        *,
+        guilds: CacheSetting = None,
+        channels: CacheSetting = None,
+        threads: CacheSetting = None,
+        roles: CacheSetting = None,
+        members: CacheSetting = None,
+        messages: CacheSetting = None,
+        stages: CacheSetting = None,
+        scheduled_events: CacheSetting = None,
+    ) -> None:
+        self.guilds = guilds
+        self.channels = channels
+        self.threads = threads
+        self.roles = roles
+        self.members = members
+        self.messages = messages
+        self.stages = stages
+        self.scheduled_events = scheduled_events
+
+    def __repr__(self) -> str:
+        settings = ' '.join(f'{name}={getattr(self, name)!r}' for name in _INTENTS)
+        return f'<CachePolicy {settings}>'
+
+    @classmethod
+    def all(cls) -> CachePolicy:
+        """A policy caching everything, regardless of intents and listeners."""
+        return cls(**dict.fromkeys(_INTENTS, True))
+
+    @classmethod
+    def none(cls) -> CachePolicy:
+        """A policy caching nothing, for stateless bots."""
+        return cls(**dict.fromkeys(_INTENTS, False))
+
+    def resolve(
+        self, intents: Intents, event_manager: EventManager
+    ) -> dict[str, Any]:
+        """
+        Derives the setting of every entity left as ``None``
+
+        Parameters
+        ----------
+        intents: :class:`.Intents`
+            The intents the Bot connects with.
+        event_manager: :class:`.EventManager`
+            The event manager holding the Bot's listeners.
+
+        Returns
+        -------
+        dict[:class:`str`, :class:`bool` | :class:`int` | :class:`.EvictionPolicy`]
+        """
+        listened = {event for event, funcs in event_manager.events.items() if funcs}
+        settings = {}
+
+        for name, names in _INTENTS.items():
+            setting = getattr(self, name)
+
+            if setting is None:
+                events = _EVENTS.get(name)
+                setting = (
+                    bool(listened)
+                    and any(getattr(intents, intent) for intent in names)
+                    and (events is None or not listened.isdisjoint(events))
+                )
+
+            settings[name] = setting
+
+        return settings
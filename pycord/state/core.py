@@ -22,12 +22,16 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, TypeVar
+import secrets
+import zlib
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
 
 from aiohttp import BasicAuth
 
 from ..api import HTTPClient
 from ..commands.application import ApplicationCommand
+from ..errors import GatewayException
 from ..events import GuildCreate
 from ..events.channels import (
     ChannelCreate,
@@ -39,7 +43,7 @@ from ..events.channels import (
     MessageDelete,
     MessageUpdate,
 )
-from ..events.event_manager import EventManager
+from ..events.event_manager import Event, EventManager
 from ..events.guilds import (
     GuildBanCreate,
     GuildBanDelete,
@@ -47,30 +51,45 @@ from ..events.guilds import (
     GuildMemberAdd,
     GuildMemberChunk,
     GuildMemberRemove,
+    GuildMemberUpdate,
     GuildRoleCreate,
     GuildRoleDelete,
     GuildRoleUpdate,
     GuildUpdate,
 )
-from ..events.other import InteractionCreate, Ready, UserUpdate
+from ..events.other import InteractionCreate, Ready, Resumed, UserUpdate
 from ..flags import Intents
+from ..lazy import Lazy
 from ..missing import MISSING
 from ..ui import Component
 from ..ui.house import House
 from ..ui.text_input import Modal
 from ..user import User
+from . import pickling
+from .cache_policy import CachePolicy
+from .eviction import EvictionPolicy
 from .grouped_store import GroupedStore
+from .member_requests import MemberRequest
+from .members import MemberStore
+from .messages import MessageStore
+from .remote import CacheClient, RemoteStore
+from .store import NullStore, Store
+from .users import UserRegistry
 
 T = TypeVar('T')
 
+SNAPSHOT_VERSION = 1
+
 BASE_EVENTS = [
     Ready,
+    Resumed,
     GuildCreate,
     GuildUpdate,
     GuildDelete,
     GuildBanCreate,
     GuildBanDelete,
     GuildMemberAdd,
+    GuildMemberUpdate,
     GuildMemberRemove,
     GuildMemberChunk,
     GuildRoleCreate,
@@ -88,23 +107,89 @@ BASE_EVENTS = [
     InteractionCreate,
 ]
 
+# base events which only keep the cache of one entity up to date,
+# or None for the ones which don't cache anything
+_CACHED_BY: dict[type, str | None] = {
+    GuildBanCreate: None,
+    GuildBanDelete: None,
+    ChannelPinsUpdate: None,
+    GuildMemberAdd: 'members',
+    GuildMemberUpdate: 'members',
+    GuildMemberRemove: 'members',
+    GuildRoleCreate: 'roles',
+    GuildRoleUpdate: 'roles',
+    GuildRoleDelete: 'roles',
+    ChannelCreate: 'channels',
+    ChannelUpdate: 'channels',
+    ChannelDelete: 'channels',
+    MessageCreate: 'messages',
+    MessageUpdate: 'messages',
+    MessageDelete: 'messages',
+    MessageBulkDelete: 'messages',
+}
+
+# events whose guild is their own id, rather than their guild_id
+_GUILD_EVENTS = frozenset(('GUILD_CREATE', 'GUILD_UPDATE', 'GUILD_DELETE'))
+
 if TYPE_CHECKING:
+    from ..channel import Channel
     from ..commands.command import Command
     from ..ext.gears import Gear
     from ..flags import Intents
-    from ..gateway import PassThrough, ShardCluster, ShardManager
+    from ..gateway import IdentifyScheduler, Shard, ShardCluster, ShardManager
+    from ..member import Member
+    from ..message import Message
+    from ..snowflake import Snowflake
+
+
+def _member_roles(member: Member) -> list[Snowflake]:
+    return member.roles
+
+
+def _channel_type(channel: Channel) -> int:
+    return channel.type.value
+
+
+def _message_author(message: Message) -> Snowflake:
+    return message.author.id
 
 
 class State:
     def __init__(self, **options: Any) -> None:
         self.options = options
-        self.max_messages: int | None = options.get('max_messages', 1000)
+        self.max_messages: int | EvictionPolicy | None = options.get(
+            'max_messages', 1000
+        )
         self.large_threshold: int = options.get('large_threshold', 250)
-        self.shard_concurrency: PassThrough | None = None
+        self.shard_concurrency: IdentifyScheduler | None = None
         self.intents: Intents = options.get('intents', Intents())
         self.user: User | None = None
         self.raw_user: dict[str, Any] | None = None
-        self.store = GroupedStore(messages_max_items=self.max_messages)
+        self.users = UserRegistry(self)
+        self.max_messages_per_channel: int | None = options.get(
+            'max_messages_per_channel'
+        )
+        self.store = GroupedStore()
+        self.store.bind(self)
+        self.store.add_store(
+            'messages',
+            MessageStore(self.max_messages, per_channel=self.max_messages_per_channel),
+        )
+
+        if options.get('compact_members', False):
+            self.store.add_store('members', MemberStore())
+
+        stores: dict[str, Store] = options.get('stores') or {}
+
+        for name, store in stores.items():
+            self.store.add_store(name, store)
+
+        self.cache_policy: CachePolicy | None = options.get('cache_policy')
+        # entity -> the setting the cache policy was last applied with,
+        # None until the Bot starts
+        self._cache_settings: dict[str, Any] | None = None
+        self.cache_client: CacheClient | None = None
+        self._add_indexes()
         self.event_manager = EventManager(BASE_EVENTS, self)
         self.shard_managers: list[ShardManager] = []
         self.shard_clusters: list[ShardCluster] = []
@@ -123,6 +208,130 @@ class State:
         self._components_via_custom_id: dict[str, Component] = {}
         self.modals: list[Modal] = []
         self.cache_guild_members: bool = options.get('cache_guild_members', True)
+        self.lazy_cache: bool = options.get('lazy_cache', False)
+        self.typed_payloads: bool = options.get('typed_payloads', False)
+        allowed_guilds = options.get('allowed_guilds')
+        self.allowed_guilds: set[int] | None = (
+            None if allowed_guilds is None else {int(id) for id in allowed_guilds}
+        )
+        self.denied_guilds: set[int] = {
+            int(id) for id in options.get('denied_guilds') or ()
+        }
+        # shard id -> session info restored from a snapshot, used to resume
+        self._resumable_sessions: dict[int, dict[str, Any]] = {}
+        # the presence set through the bot, also sent when identifying
+        self.presence: dict[str, Any] | None = None
+        # nonce -> member request waiting on its chunks
+        self._member_requests: dict[str, MemberRequest] = {}
+
+    def _add_indexes(self) -> None:
+        if self.options.get('cache_indexes', True):
+            self.store.sift('members').add_index('roles', _member_roles, multi=True)
+            self.store.sift('channels').add_index('type', _channel_type)
+            self.store.sift('messages').add_index('author', _message_author)
+
+    def apply_cache_policy(self) -> None:
+        """
+        Sets up the Stores of every entity according to :attr:`cache_policy`,
+        deriving unset entities from the intents and registered listeners.
+
+        This runs through :meth:`.EventManager.refresh` once the Bot started,
+        and again whenever a listener is added, so entities which weren't
+        cached start being cached once something listens for them.
+
+        Stores passed through the ``stores`` option are kept as they are.
+        """
+        if self.cache_policy is None or self._cache_settings is None:
+            return
+
+        custom = self.options.get('stores') or {}
+        settings = self.cache_policy.resolve(self.intents, self.event_manager)
+        # entities are cached by default until the policy says otherwise
+        applied = self._cache_settings
+        changed = False
+
+        for name, setting in settings.items():
+            if name in custom or setting == applied.get(name, True):
+                continue
+
+            self.store.add_store(name, self._policy_store(name, setting))
+            changed = True
+
+        self._cache_settings = settings
+        self.cache_guild_members = self.options.get('cache_guild_members', True) and (
+            settings['members'] is not False
+        )
+
+        if changed:
+            self._add_indexes()
+
+    def _policy_store(self, name: str, setting: Any) -> Store:
+        if setting is False:
+            return NullStore()
+        elif self.cache_client is not None:
+            return RemoteStore(self.cache_client, name)
+        elif name == 'messages':
+            return MessageStore(
+                self.max_messages if setting is True else setting,
+                per_channel=self.max_messages_per_channel,
+            )
+        elif self.options.get('compact_members', False) and name == 'members':
+            # compact members can't be bounded
+            return MemberStore()
+
+        return Store(None if setting is True else setting)
+
+    def needs_event(self, event: Type[Event]) -> bool:
+        """
+        Whether a base event is needed to keep the cache up to date,
+        regardless of whether anything listens to it
+        """
+        if event not in _CACHED_BY:
+            return True
+
+        entity = _CACHED_BY[event]
+        return entity is not None and not isinstance(
+            self.store.sift(entity), NullStore
+        )
+
+    def guild_allowed(self, event: str, data: Any) -> bool:
+        """
+        Whether a dispatch passes the ``allowed_guilds`` and ``denied_guilds``
+        options, events outside of guilds always passing
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event, like ``'MESSAGE_CREATE'``.
+        data: dict[:class:`str`, Any]
+            The data of the event.
+        """
+        if self.allowed_guilds is None and not self.denied_guilds:
+            return True
+
+        guild_id = data.get('id' if event in _GUILD_EVENTS else 'guild_id')
+
+        if guild_id is None:
+            return True
+
+        guild_id = int(guild_id)
+
+        if guild_id in self.denied_guilds:
+            return False
+
+        return self.allowed_guilds is None or guild_id in self.allowed_guilds
+
+    def lazy(
+        self, factory: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> Lazy[T] | T:
+        """
+        Wraps a model to be cached, only building it on first access
+        when lazy caching is enabled, and building it right away otherwise.
+        """
+        if not self.lazy_cache:
+            return factory(*args, **kwargs)
+
+        return Lazy(factory, *args, **kwargs)
 
     def sent_modal(self, modal: Modal) -> None:
         if modal not in self.modals:
@@ -159,3 +368,248 @@ class State:
             verbose=self.verbose,
         )
         self._clustered = clustered
+        self._cache_settings = {}
+        self.event_manager.refresh()
+
+        if self.options.get('cache_server'):
+            self.use_cache_server(self.options['cache_server'])
+
+    def use_cache_server(self, path: str) -> None:
+        """
+        Moves every Store into a :class:`.CacheServer`, shared with other processes
+
+        Stores passed through the ``stores`` option, and entities which
+        aren't cached, are kept as they are.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the Unix socket the server listens on.
+        """
+        custom = self.options.get('stores') or {}
+        self.cache_client = CacheClient(path)
+        self.store.factory = partial(RemoteStore, self.cache_client)
+
+        for name, store in list(self.store.get_stores_by_name().items()):
+            if name not in custom and not isinstance(store, NullStore):
+                self.store.add_store(name, RemoteStore(self.cache_client, name))
+
+        self._add_indexes()
+
+    async def invalidate_guilds(self, guild_ids: list[int]) -> None:
+        """
+        Removes everything cached under these guilds from every Store,
+        including the messages of their channels and threads
+
+        Parameters
+        ----------
+        guild_ids: list[:class:`int`]
+            The ids of the guilds.
+        """
+        if not guild_ids:
+            return
+
+        # messages are only parented by their channel
+        channel_ids = await self.store.sift('channels').get_ids(guild_ids)
+        channel_ids += await self.store.sift('threads').get_ids(guild_ids)
+
+        await self.store.delete_all_parent(guild_ids)
+
+        if channel_ids:
+            await self.store.sift('messages').delete_all_parent(channel_ids)
+
+    async def invalidate_shard(self, shard_id: int, shard_count: int) -> None:
+        """
+        Removes everything cached under the guilds of a shard,
+        used when its session can't be resumed
+
+        Parameters
+        ----------
+        shard_id: :class:`int`
+            The id of the shard.
+        shard_count: :class:`int`
+            The total amount of shards.
+        """
+        guild_ids = [
+            guild_id
+            for guild_id in await self.store.sift('guilds').get_ids()
+            if (int(guild_id) >> 22) % shard_count == shard_id
+        ]
+        await self.invalidate_guilds(guild_ids)
+
+    def get_shard_managers(self) -> list[ShardManager]:
+        """Gets the ShardManagers of this process, including those of its clusters."""
+        managers = list(self.shard_managers)
+
+        for cluster in self.shard_clusters:
+            managers.extend(cluster.shard_managers)
+
+        return managers
+
+    def get_shard(self, guild_id: int) -> Shard:
+        """
+        Gets the Shard a guild is on, out of the Shards in this process
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The id of the guild.
+
+        Raises
+        ------
+        GatewayException
+            No Shard of this process handles the guild.
+        """
+        for manager in self.get_shard_managers():
+            shard_id = (int(guild_id) >> 22) % manager.amount
+
+            for shard in manager.shards:
+                if shard.id == shard_id:
+                    return shard
+
+        raise GatewayException(f'no shard in this process handles guild {guild_id}')
+
+    def request_members(
+        self,
+        guild_id: int,
+        query: str | None = None,
+        user_ids: list[int] | None = None,
+        limit: int = 0,
+        presences: bool = False,
+        timeout: float | None = 30.0,
+    ) -> MemberRequest:
+        """
+        Requests the members of a guild through its Shard,
+        under the Shard's send rate limit.
+        See :meth:`.Guild.request_members` for the parameters.
+
+        Returns
+        -------
+        :class:`MemberRequest`
+            The request, gathering the chunks Discord sends back.
+        """
+        if query is not None and user_ids is not None:
+            raise ValueError('query and user_ids cannot be used together')
+
+        shard = self.get_shard(guild_id)
+        nonce = secrets.token_hex(16)
+        request = MemberRequest(self, guild_id, nonce, timeout)
+        self._member_requests[nonce] = request
+
+        request._sending = asyncio.create_task(
+            shard.request_guild_members(
+                guild_id,
+                nonce,
+                query=query,
+                user_ids=user_ids,
+                limit=limit,
+                presences=presences,
+            )
+        )
+        request._sending.add_done_callback(request._sent)
+        return request
+
+    def cache_stats(self, memory: bool = False) -> dict[str, dict[str, Any]]:
+        """
+        Gets the counters of every Store, by name
+
+        Parameters
+        ----------
+        memory: :class:`bool`
+            Whether to also approximate the bytes taken by each Store,
+            which samples their objects rather than only reading counters.
+
+        Returns
+        -------
+        dict[:class:`str`, dict[:class:`str`, Any]]
+            The hits, misses, inserts, updates, discards, evictions,
+            hit ratio and size of each Store, and their bytes if requested.
+        """
+        stats = {}
+
+        for name, store in self.store.get_stores_by_name().items():
+            stats[name] = store.stats.to_dict()
+            stats[name]['hit_ratio'] = store.stats.hit_ratio
+            stats[name]['size'] = len(store)
+
+            if memory:
+                stats[name]['bytes'] = store.memory_usage()
+
+        return stats
+
+    def snapshot(self) -> bytes:
+        """
+        Serializes the cache, alongside the sessions of every
+        Shard in this process, into a compressed snapshot.
+
+        Stores which are already persistent, like :class:`.SQLiteStore`, are skipped.
+        """
+        sessions = {}
+
+        for manager in self.get_shard_managers():
+            for shard in manager.shards:
+                if shard.session_id is None:
+                    continue
+
+                sessions[shard.id] = {
+                    'shard_count': manager.amount,
+                    'session_id': shard.session_id,
+                    'sequence': shard._sequence,
+                    'resume_gateway_url': shard._resume_gateway_url,
+                }
+
+        stores = {
+            name: list(store.entries())
+            for name, store in self.store.get_stores_by_name().items()
+            if not store.persistent
+        }
+
+        return zlib.compress(
+            pickling.dumps(
+                {
+                    'version': SNAPSHOT_VERSION,
+                    'raw_user': self.raw_user,
+                    'available_guilds': getattr(self, '_available_guilds', []),
+                    'sessions': sessions,
+                    'stores': stores,
+                },
+                self,
+            )
+        )
+
+    async def restore(self, snapshot: bytes) -> None:
+        """
+        Restores the cache and Shard sessions from a snapshot made by :meth:`snapshot`.
+        Shards with a restored session resume instead of identifying.
+        """
+        data = pickling.loads(zlib.decompress(snapshot), self)
+
+        if data.get('version') != SNAPSHOT_VERSION:
+            return
+
+        for name, entries in data['stores'].items():
+            await self.store.sift(name).save_many(
+                (list(parents), id, storing) for parents, id, storing in entries
+            )
+
+        self._available_guilds: list[int] = data['available_guilds']
+        self._resumable_sessions = data['sessions']
+
+        if data['raw_user'] is not None:
+            self.raw_user = data['raw_user']
+            self.user = self.users.intern(self.raw_user)
+
+    def save_snapshot(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.snapshot())
+
+    async def load_snapshot(self, path: str) -> bool:
+        """Restores a snapshot from ``path``, returning whether one existed."""
+        try:
+            with open(path, 'rb') as f:
+                snapshot = f.read()
+        except FileNotFoundError:
+            return False
+
+        await self.restore(snapshot)
+        return True
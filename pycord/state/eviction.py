@@ -0,0 +1,255 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+import time
+from collections import OrderedDict
+from typing import Any, Sequence
+
+__all__: Sequence[str] = (
+    'EvictionPolicy',
+    'FIFOPolicy',
+    'LRUPolicy',
+    'LFUPolicy',
+    'TTLPolicy',
+)
+
+
+class EvictionPolicy:
+    """
+    The base class for Store eviction policies.
+
+    Policies only decide *which* entry to drop; the :class:`.Store`
+    removes the entry and notifies the policy via :meth:`forget`.
+
+    Parameters
+    ----------
+    max_items: :class:`int` | None
+        The maximum amount of items a Store can hold before evicting.
+    """
+
+    __slots__ = ('max_items',)
+
+    def __init__(self, max_items: int | None = None) -> None:
+        self.max_items = max_items
+
+    def track(self, entry: Any) -> None:
+        """Called when a new entry has been inserted."""
+
+    def touch(self, entry: Any) -> None:
+        """Called when an entry has been read."""
+
+    def update(self, entry: Any) -> None:
+        """Called when an entry's data has been replaced."""
+        self.touch(entry)
+
+    def forget(self, entry: Any) -> None:
+        """Called when an entry has been removed from the Store."""
+
+    def evict(self) -> Any | None:
+        """Pick the next entry to be removed."""
+
+    def victim(self, incoming: Any, size: int) -> Any | None:
+        """
+        Pick an entry to remove before ``incoming`` is inserted,
+        or ``None`` if there's enough room for it.
+        """
+        if self.max_items and size >= self.max_items:
+            return self.evict()
+
+    def expired(self) -> list[Any]:
+        """Returns entries which have outlived their usefulness."""
+        return []
+
+    def is_expired(self, entry: Any) -> bool:
+        return False
+
+    def clear(self) -> None:
+        ...
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Evicts the oldest inserted entry first."""
+
+    __slots__ = ('_order',)
+
+    def __init__(self, max_items: int | None = None) -> None:
+        super().__init__(max_items)
+        self._order: OrderedDict[Any, None] = OrderedDict()
+
+    def track(self, entry: Any) -> None:
+        self._order[entry] = None
+
+    def update(self, entry: Any) -> None:
+        ...
+
+    def forget(self, entry: Any) -> None:
+        self._order.pop(entry, None)
+
+    def evict(self) -> Any | None:
+        for entry in self._order:
+            return entry
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LRUPolicy(FIFOPolicy):
+    """Evicts the least recently used entry first."""
+
+    __slots__ = ()
+
+    def touch(self, entry: Any) -> None:
+        try:
+            self._order.move_to_end(entry)
+        except KeyError:
+            pass
+
+    def update(self, entry: Any) -> None:
+        self.touch(entry)
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evicts the least frequently used entry first,
+    breaking ties by evicting the oldest of them.
+    """
+
+    __slots__ = ('_frequencies', '_buckets', '_min')
+
+    def __init__(self, max_items: int | None = None) -> None:
+        super().__init__(max_items)
+        self._frequencies: dict[Any, int] = {}
+        # frequency -> entries with that frequency, oldest first
+        self._buckets: dict[int, OrderedDict[Any, None]] = {}
+        self._min: int = 0
+
+    def _bucket(self, frequency: int) -> OrderedDict[Any, None]:
+        try:
+            return self._buckets[frequency]
+        except KeyError:
+            bucket = self._buckets[frequency] = OrderedDict()
+            return bucket
+
+    def _remove(self, entry: Any, frequency: int) -> None:
+        bucket = self._buckets[frequency]
+        del bucket[entry]
+
+        if not bucket:
+            del self._buckets[frequency]
+
+    def track(self, entry: Any) -> None:
+        self._frequencies[entry] = 1
+        self._bucket(1)[entry] = None
+        self._min = 1
+
+    def touch(self, entry: Any) -> None:
+        frequency = self._frequencies.get(entry)
+
+        if frequency is None:
+            return
+
+        self._remove(entry, frequency)
+
+        if self._min == frequency and frequency not in self._buckets:
+            self._min = frequency + 1
+
+        self._frequencies[entry] = frequency + 1
+        self._bucket(frequency + 1)[entry] = None
+
+    def forget(self, entry: Any) -> None:
+        frequency = self._frequencies.pop(entry, None)
+
+        if frequency is not None:
+            self._remove(entry, frequency)
+
+    def evict(self) -> Any | None:
+        if not self._buckets:
+            return
+
+        bucket = self._buckets.get(self._min)
+
+        if bucket is None:
+            # the least used entries were removed outside of eviction
+            self._min = min(self._buckets)
+            bucket = self._buckets[self._min]
+
+        for entry in bucket:
+            return entry
+
+    def clear(self) -> None:
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min = 0
+
+
+class TTLPolicy(EvictionPolicy):
+    """
+    Expires entries ``ttl`` seconds after they were last written,
+    evicting the entry closest to expiring when the Store is full.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The amount of seconds entries live for.
+    max_items: :class:`int` | None
+        The maximum amount of items a Store can hold before evicting.
+    """
+
+    __slots__ = ('ttl', '_deadlines')
+
+    def __init__(self, ttl: float, max_items: int | None = None) -> None:
+        super().__init__(max_items)
+        self.ttl = ttl
+        # since every entry lives for the same amount of time,
+        # insertion order is also expiration order
+        self._deadlines: OrderedDict[Any, float] = OrderedDict()
+
+    def track(self, entry: Any) -> None:
+        self._deadlines[entry] = time.monotonic() + self.ttl
+
+    def update(self, entry: Any) -> None:
+        self._deadlines.pop(entry, None)
+        self.track(entry)
+
+    def forget(self, entry: Any) -> None:
+        self._deadlines.pop(entry, None)
+
+    def evict(self) -> Any | None:
+        for entry in self._deadlines:
+            return entry
+
+    def expired(self) -> list[Any]:
+        now = time.monotonic()
+        expired = []
+
+        for entry, deadline in self._deadlines.items():
+            if deadline > now:
+                break
+            expired.append(entry)
+
+        return expired
+
+    def is_expired(self, entry: Any) -> bool:
+        deadline = self._deadlines.get(entry)
+        return deadline is not None and deadline <= time.monotonic()
+
+    def clear(self) -> None:
+        self._deadlines.clear()
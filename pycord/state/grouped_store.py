@@ -20,22 +20,53 @@
 # SOFTWARE
 
 
+from typing import Any, Callable
+
+from .eviction import EvictionPolicy
 from .store import Store
 
 
 class GroupedStore:
-    __slots__ = ('_stores', '_stores_dict', '_kwargs')
+    """
+    A collection of named Stores.
+
+    Stores are created lazily when first sifted.
+    Each Store can be bounded by passing ``<name>_max_items``,
+    either as an :class:`int` (evicting the least recently used entry)
+    or as an :class:`.EvictionPolicy` like ``messages_max_items=TTLPolicy(600)``.
+    Setting :attr:`factory` creates them with it instead, by name.
+    """
+
+    __slots__ = ('_stores', '_stores_dict', '_kwargs', '_state', 'factory')
 
-    def __init__(self, **max_items) -> None:
+    def __init__(self, **max_items: int | EvictionPolicy | None) -> None:
         self._stores = []
         self._stores_dict = {}
         self._kwargs = max_items
+        self._state: Any = None
+        self.factory: Callable[[str], Store] | None = None
+
+    def bind(self, state: Any) -> None:
+        self._state = state
+
+        for store in self._stores:
+            store.bind(state)
 
     def get_stores(self) -> list[Store]:
         return self._stores
 
+    def get_stores_by_name(self) -> dict[str, Store]:
+        return self._stores_dict
+
     def get_store(self, name: str) -> Store:
-        return self._stores[name]
+        return self._stores_dict[name]
+
+    def add_store(self, name: str, store: Store) -> None:
+        """Use a specific Store, such as a subclass of it, for ``name``."""
+        self.discard(name)
+        store.bind(self._state)
+        self._stores.append(store)
+        self._stores_dict[name] = store
 
     def discard(self, name: str) -> None:
         d = self._stores_dict.get(name)
@@ -43,16 +74,22 @@ class GroupedStore:
             self._stores_dict.pop(name)
             self._stores.remove(d)
 
+    async def delete_all_parent(self, parents: list[Any]) -> None:
+        """Deletes every object under ``parents`` from every Store."""
+        for store in self._stores:
+            await store.delete_all_parent(parents)
+
     def sift(self, name: str) -> Store:
         s = self._stores_dict.get(name)
         if s is not None:
             return s
 
-        for k, v in self._kwargs.items():
-            if k == (name + '_max_items'):
-                store = Store(v)
+        if self.factory is not None:
+            store = self.factory(name)
         else:
-            store = Store()
+            store = Store(self._kwargs.get(name + '_max_items'))
+
+        store.bind(self._state)
 
         self._stores.append(store)
         self._stores_dict[name] = store
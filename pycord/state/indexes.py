@@ -0,0 +1,139 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Sequence
+
+__all__: Sequence[str] = ('Index',)
+
+
+def _value(value: Any) -> Any:
+    # Snowflake hashes differently from int, so normalize values like Store keys
+    return int(value) if isinstance(value, int) else value
+
+
+class Index:
+    """
+    A secondary index over a Store, mapping values to the entries holding them.
+
+    Indexes are declared with :meth:`.Store.add_index`, and kept up to date
+    as objects are saved and discarded, so querying one with :meth:`.Store.find`
+    doesn't need to scan the Store.
+
+    Parameters
+    ----------
+    key: Callable[[Any], Any]
+        Gets the value to index an object by, or ``None`` to leave it out.
+    multi: :class:`bool`
+        Whether ``key`` returns an iterable of values, like a member's roles,
+        instead of a single value.
+    """
+
+    __slots__ = ('key', 'multi', '_refs', '_values')
+
+    def __init__(self, key: Callable[[Any], Any], *, multi: bool = False) -> None:
+        self.key = key
+        self.multi = multi
+        # value -> parent -> entries with that value under that parent
+        self._refs: dict[Any, dict[Any, dict[Any, None]]] = {}
+        # entry -> the values and parents it was indexed with, since objects
+        # can be modified in place before being saved back
+        self._values: dict[Any, tuple[tuple[Any, ...], tuple[Any, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def values_of(self, data: Any) -> tuple[Any, ...]:
+        value = self.key(data)
+
+        if value is None:
+            return ()
+        elif self.multi:
+            return tuple({_value(v) for v in value})
+
+        return (_value(value),)
+
+    def add(self, ref: Any, parents: Iterable[Any], data: Any) -> None:
+        values = self.values_of(data)
+
+        if not values:
+            return
+
+        ps = tuple(parents) or (None,)
+        self._values[ref] = (values, ps)
+
+        for value in values:
+            by_parent = self._refs.get(value)
+
+            if by_parent is None:
+                by_parent = self._refs[value] = {}
+
+            for parent in ps:
+                try:
+                    by_parent[parent][ref] = None
+                except KeyError:
+                    by_parent[parent] = {ref: None}
+
+    def remove(self, ref: Any) -> None:
+        indexed = self._values.pop(ref, None)
+
+        if indexed is None:
+            return
+
+        values, ps = indexed
+
+        for value in values:
+            by_parent = self._refs[value]
+
+            for parent in ps:
+                refs = by_parent[parent]
+                del refs[ref]
+
+                if not refs:
+                    del by_parent[parent]
+
+            if not by_parent:
+                del self._refs[value]
+
+    def get(self, value: Any, parents: Iterable[Any] | None = None) -> list[Any]:
+        """Gets the entries indexed under ``value``, optionally only under ``parents``."""
+        by_parent = self._refs.get(_value(value))
+
+        if by_parent is None:
+            return []
+
+        if parents is None:
+            groups = list(by_parent.values())
+        else:
+            groups = [
+                by_parent[p] for p in {_value(p) for p in parents} if p in by_parent
+            ]
+
+        if len(groups) == 1:
+            return list(groups[0])
+
+        # entries can be under several of the parents
+        return list(dict.fromkeys(ref for refs in groups for ref in refs))
+
+    def clear(self) -> None:
+        self._refs.clear()
+        self._values.clear()
@@ -0,0 +1,183 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Generator, Sequence
+
+from ..snowflake import Snowflake
+
+if TYPE_CHECKING:
+    from ..member import Member
+    from .core import State
+
+__all__: Sequence[str] = ('MemberRequest',)
+
+
+class MemberRequest:
+    """
+    The members of a guild requested through the gateway,
+    gathered from every chunk sent back for its nonce.
+
+    Awaiting it gives every member once the last chunk arrived,
+    while iterating over it with ``async for`` gives the members chunk by chunk.
+
+    Attributes
+    ----------
+    guild_id: :class:`Snowflake`
+        The id of the guild.
+    nonce: :class:`str`
+        The nonce the chunks of this request are sent back with.
+    members: list[:class:`Member`]
+        The members received so far.
+    not_found: list[:class:`Snowflake`]
+        The requested user ids which aren't members of the guild.
+    presences: list[dict[:class:`str`, Any]]
+        The presences received so far, if they were requested.
+    chunk_count: :class:`int` | None
+        The amount of chunks Discord sends back, known after the first one.
+    """
+
+    __slots__ = (
+        '_state',
+        '_timeout',
+        '_timer',
+        '_future',
+        '_chunks',
+        '_received',
+        '_sending',
+        'guild_id',
+        'nonce',
+        'members',
+        'not_found',
+        'presences',
+        'chunk_count',
+    )
+
+    def __init__(
+        self, state: State, guild_id: int, nonce: str, timeout: float | None = 30.0
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        self._state = state
+        self._timeout = timeout
+        self._timer: asyncio.TimerHandle | None = None
+        self._future: asyncio.Future[list[Member]] = loop.create_future()
+        self._chunks: asyncio.Queue[list[Member] | None] = asyncio.Queue()
+        self._received = 0
+        self._sending: asyncio.Task[None] | None = None
+        self.guild_id = Snowflake(guild_id)
+        self.nonce = nonce
+        self.members: list[Member] = []
+        self.not_found: list[Snowflake] = []
+        self.presences: list[dict[str, Any]] = []
+        self.chunk_count: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f'<MemberRequest guild_id={self.guild_id} nonce={self.nonce!r} '
+            f'chunks={self._received}/{self.chunk_count}>'
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether every chunk arrived, or the request failed."""
+        return self._future.done()
+
+    def __await__(self) -> Generator[Any, None, list[Member]]:
+        return self._future.__await__()
+
+    async def __aiter__(self) -> AsyncIterator[Member]:
+        while True:
+            chunk = await self._chunks.get()
+
+            if chunk is None:
+                # leave the end behind for any other iterator
+                self._chunks.put_nowait(None)
+                # raises if the request failed
+                self._future.result()
+                return
+
+            for member in chunk:
+                yield member
+
+    def _restart_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+        if self._timeout is not None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._timeout, self._expire
+            )
+
+    def _expire(self) -> None:
+        self._finish(
+            asyncio.TimeoutError(
+                f'members of guild {self.guild_id} weren\'t received in time, '
+                f'got {self._received} of {self.chunk_count or "?"} chunks'
+            )
+        )
+
+    def _feed(self, data: dict[str, Any], members: list[Member]) -> None:
+        if self.done:
+            return
+
+        self.members.extend(members)
+        self.not_found.extend(Snowflake(id) for id in data.get('not_found', ()))
+        self.presences.extend(data.get('presences', ()))
+        self.chunk_count = data['chunk_count']
+        self._received += 1
+        self._chunks.put_nowait(members)
+
+        if self._received >= self.chunk_count:
+            self._finish()
+        else:
+            self._restart_timer()
+
+    def _sent(self, task: asyncio.Task[None]) -> None:
+        if task.cancelled():
+            self._finish(asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(task.exception())
+        elif not self.done:
+            # the timeout only starts once the request left, so time spent
+            # waiting on the gateway's rate limit doesn't count against it
+            self._restart_timer()
+
+    def _finish(self, exc: BaseException | None = None) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._state._member_requests.pop(self.nonce, None)
+
+        if self._future.done():
+            return
+
+        if exc is None:
+            self._future.set_result(self.members)
+        else:
+            self._future.set_exception(exc)
+            # marks it retrieved, it's raised to whoever awaits or iterates
+            self._future.exception()
+
+        self._chunks.put_nowait(None)
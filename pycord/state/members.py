@@ -0,0 +1,478 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterator, Sequence
+
+from ..flags import Permissions
+from ..lazy import resolve
+from ..member import Member
+from ..missing import MISSING
+from ..snowflake import Snowflake
+from ..user import User
+from .indexes import Index
+from .store import Store, _key
+
+if TYPE_CHECKING:
+    from .core import State
+
+__all__: Sequence[str] = ('MemberStore',)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# sentinels for optional datetimes and permissions
+_NONE = -(2**63)
+_MISSING = _NONE + 1
+
+# deaf, mute and pending each take two bits: 0 is MISSING, 1 False, 2 True
+_BOOL_FIELDS = ('deaf', 'mute', 'pending')
+
+
+def _pack_time(value: datetime | None | Any) -> int:
+    if value is None:
+        return _NONE
+    elif value is MISSING:
+        return _MISSING
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: int) -> datetime | None | Any:
+    if value == _NONE:
+        return None
+    elif value == _MISSING:
+        return MISSING
+
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _pack_bools(member: Member) -> int:
+    bits = 0
+
+    for i, name in enumerate(_BOOL_FIELDS):
+        value = getattr(member, name)
+
+        if value is not MISSING:
+            bits |= (2 if value else 1) << (i * 2)
+
+    return bits
+
+
+class MemberStore(Store):
+    """
+    A compact, column-oriented Store for guild members.
+
+    Instead of keeping every :class:`.Member` (and its :class:`.User`) alive,
+    each field is kept in a column: ids, dates and permissions in typed arrays,
+    role ids in a pool of interned role sets shared between members,
+    and flags packed into bits. :class:`.Member` objects are
+    rebuilt from these columns whenever they're requested.
+
+    Each member takes about 325 bytes, most of which are its username and
+    avatar hash strings, compared to about 1000 bytes for a full Member.
+
+    .. NOTE::
+        Since members are rebuilt on every read, modifications to a
+        returned member have to be saved back to be kept.
+        User fields which aren't sent with members, like banners, are not kept.
+    """
+
+    __slots__ = (
+        '_state',
+        '_rows',
+        '_free',
+        '_guild_ids',
+        '_user_ids',
+        '_joined_at',
+        '_premium_since',
+        '_timeouts',
+        '_permissions',
+        '_role_refs',
+        '_bools',
+        '_nicks',
+        '_avatars',
+        '_usernames',
+        '_discriminators',
+        '_user_avatars',
+        '_public_flags',
+        '_role_sets',
+        '_role_set_ids',
+        '_role_set_counts',
+        '_free_role_sets',
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._state: State | None = None
+        # guild id -> user id -> row
+        self._rows: dict[int, dict[int, int]] = {}
+        self._free: list[int] = []
+
+        self._guild_ids = array('Q')
+        self._user_ids = array('Q')
+        self._joined_at = array('q')
+        self._premium_since = array('q')
+        self._timeouts = array('q')
+        self._permissions = array('q')
+        self._role_refs = array('I')
+        self._bools = bytearray()
+        self._nicks: list[Any] = []
+        self._avatars: list[Any] = []
+
+        self._usernames: list[str | None] = []
+        self._discriminators = array('H')
+        self._user_avatars: list[str | None] = []
+        # 0 is MISSING, otherwise 1 + the flags. bit 63 marks bots
+        self._public_flags = array('Q')
+
+        # members tend to share the same few combinations of roles
+        self._role_sets: list[tuple[int, ...]] = []
+        self._role_set_ids: dict[tuple[int, ...], int] = {}
+        self._role_set_counts = array('I')
+        self._free_role_sets: list[int] = []
+
+    def bind(self, state: State) -> None:
+        self._state = state
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _intern_roles(self, roles: list[Snowflake]) -> int:
+        key = tuple(sorted(int(r) for r in roles))
+        ref = self._role_set_ids.get(key)
+
+        if ref is None:
+            if self._free_role_sets:
+                ref = self._free_role_sets.pop()
+                self._role_sets[ref] = key
+                self._role_set_counts[ref] = 0
+            else:
+                ref = len(self._role_sets)
+                self._role_sets.append(key)
+                self._role_set_counts.append(0)
+
+            self._role_set_ids[key] = ref
+
+        self._role_set_counts[ref] += 1
+        return ref
+
+    def _release_roles(self, ref: int) -> None:
+        self._role_set_counts[ref] -= 1
+
+        if self._role_set_counts[ref] == 0:
+            del self._role_set_ids[self._role_sets[ref]]
+            self._role_sets[ref] = ()
+            self._free_role_sets.append(ref)
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+
+        row = len(self._user_ids)
+
+        for column in (
+            self._guild_ids,
+            self._user_ids,
+            self._joined_at,
+            self._premium_since,
+            self._timeouts,
+            self._permissions,
+            self._role_refs,
+            self._discriminators,
+            self._public_flags,
+        ):
+            column.append(0)
+
+        self._bools.append(0)
+
+        for column in (self._nicks, self._avatars, self._usernames, self._user_avatars):
+            column.append(None)
+
+        return row
+
+    def _write_row(self, row: int, guild_id: int, member: Member) -> None:
+        user = member.user
+
+        self._guild_ids[row] = guild_id
+        self._user_ids[row] = int(user.id)
+        self._joined_at[row] = _pack_time(member.joined_at)
+        self._premium_since[row] = _pack_time(member.premium_since)
+        self._timeouts[row] = _pack_time(member.communication_disabled_until)
+        self._permissions[row] = (
+            member.permissions.as_bit if member.permissions is not MISSING else -1
+        )
+        self._role_refs[row] = self._intern_roles(member.roles)
+        self._bools[row] = _pack_bools(member)
+        self._nicks[row] = member.nick
+        self._avatars[row] = member._avatar
+
+        self._usernames[row] = user.name
+        # users with unique usernames have a discriminator of '0'
+        self._discriminators[row] = int(user.discriminator or 0)
+        self._user_avatars[row] = user._avatar
+        flags = 0 if user._public_flags is MISSING else user._public_flags + 1
+        if user.bot:
+            flags |= 1 << 63
+        self._public_flags[row] = flags
+
+    def _read_row(self, row: int) -> Member:
+        flags = self._public_flags[row]
+        user_data: dict[str, Any] = {
+            'id': self._user_ids[row],
+            'username': self._usernames[row],
+            'discriminator': f'{self._discriminators[row]:04}'
+            if self._discriminators[row]
+            else '0',
+            'avatar': self._user_avatars[row],
+        }
+
+        if flags & (1 << 63):
+            user_data['bot'] = True
+            flags &= ~(1 << 63)
+
+        if flags:
+            user_data['public_flags'] = flags - 1
+
+        member = Member.__new__(Member)
+        member._state = self._state
+        member._guild_id = Snowflake(self._guild_ids[row])
+        member.user = (
+            self._state.users.intern(user_data)
+            if self._state is not None
+            else User(user_data, self._state)
+        )
+        member.nick = self._nicks[row]
+        member._avatar = self._avatars[row]
+        member.roles = [Snowflake(r) for r in self._role_sets[self._role_refs[row]]]
+        member.joined_at = _unpack_time(self._joined_at[row])
+        member.premium_since = _unpack_time(self._premium_since[row])
+        member.communication_disabled_until = _unpack_time(self._timeouts[row])
+
+        permissions = self._permissions[row]
+        member.permissions = (
+            Permissions.from_value(permissions) if permissions != -1 else MISSING
+        )
+
+        bits = self._bools[row]
+        for i, name in enumerate(_BOOL_FIELDS):
+            value = (bits >> (i * 2)) & 3
+            setattr(member, name, MISSING if value == 0 else value == 2)
+
+        return member
+
+    def _free_row(self, row: int) -> None:
+        self._release_roles(self._role_refs[row])
+        self._unindex(row)
+        self._nicks[row] = self._avatars[row] = None
+        self._usernames[row] = self._user_avatars[row] = None
+        self._free.append(row)
+
+    def _find_row(self, parents: set[Any], id: Any) -> tuple[int, int] | None:
+        user_id = _key(id)
+        guilds = parents or self._rows.keys()
+
+        for guild_id in guilds:
+            row = self._rows.get(guild_id, {}).get(user_id)
+
+            if row is not None:
+                return guild_id, row
+
+    def _add(self, parents: set[Any], id: Any, data: Any) -> None:
+        member: Member = resolve(data)
+
+        for guild_id in parents:
+            if guild_id is None:
+                continue
+
+            rows = self._rows.setdefault(guild_id, {})
+            user_id = _key(id)
+
+            if user_id in rows:
+                row = rows[user_id]
+                self._release_roles(self._role_refs[row])
+                self._unindex(row)
+                self.stats.updates += 1
+            else:
+                row = rows[user_id] = self._allocate()
+                self._size += 1
+                self.stats.inserts += 1
+
+            self._write_row(row, guild_id, member)
+            self._index(row, (guild_id,), member)
+
+    def _get(self, parents: set[Any], id: Any) -> Member | None:
+        found = self._find_row(parents, id)
+
+        if found is None:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        return self._read_row(found[1])
+
+    def _save(self, parents: set[Any], id: Any, data: Any) -> Member | None:
+        found = self._find_row(parents, id)
+
+        if found is None:
+            self._add(parents, id, data)
+            return
+
+        guild_id, row = found
+        old = self._read_row(row)
+        member = resolve(data)
+        self._release_roles(self._role_refs[row])
+        self._unindex(row)
+        self._write_row(row, guild_id, member)
+        self._index(row, (guild_id,), member)
+        self.stats.updates += 1
+        return old
+
+    def _discard(self, parents: set[Any], id: Any) -> Member | None:
+        found = self._find_row(parents, id)
+
+        if found is None:
+            return
+
+        guild_id, row = found
+        old = self._read_row(row)
+        rows = self._rows[guild_id]
+        del rows[_key(id)]
+
+        if not rows:
+            del self._rows[guild_id]
+
+        self._free_row(row)
+        self._size -= 1
+        self.stats.discards += 1
+        return old
+
+    async def get_without_parents(self, id: Any) -> tuple[set[Any], Any] | None:
+        found = self._find_row(set(), id)
+
+        if found is None:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        return {found[0]}, self._read_row(found[1])
+
+    def entries(self) -> Iterator[tuple[set[Any], Any, Any]]:
+        for guild_id, rows in list(self._rows.items()):
+            for user_id, row in list(rows.items()):
+                yield {guild_id}, user_id, self._read_row(row)
+
+    async def get_all(self) -> AsyncGenerator[Member, None]:
+        for _, _, member in self.entries():
+            yield member
+
+    async def get_all_parent(self, parents: list[Any]) -> AsyncGenerator[Member, None]:
+        for guild_id in {_key(p) for p in parents}:
+            for row in list(self._rows.get(guild_id, {}).values()):
+                yield self._read_row(row)
+
+    def memory_usage(self, sample: int = 100) -> int:
+        size = sys.getsizeof(self._rows) + sum(
+            sys.getsizeof(rows) for rows in self._rows.values()
+        )
+
+        for column in (
+            self._guild_ids,
+            self._user_ids,
+            self._joined_at,
+            self._premium_since,
+            self._timeouts,
+            self._permissions,
+            self._role_refs,
+            self._discriminators,
+            self._public_flags,
+            self._role_set_counts,
+            self._bools,
+        ):
+            size += sys.getsizeof(column)
+
+        for column in (self._nicks, self._avatars, self._usernames, self._user_avatars):
+            size += sys.getsizeof(column)
+            # the strings are sampled, since most are unique
+            head = column[:sample]
+
+            if head:
+                sampled = sum(sys.getsizeof(v) for v in head if isinstance(v, str))
+                size += sampled * len(column) // len(head)
+
+        size += sys.getsizeof(self._role_sets) + sum(
+            sys.getsizeof(roles) + 32 * len(roles) for roles in self._role_sets
+        )
+        return size
+
+    def add_index(
+        self, name: str, key: Callable[[Any], Any], *, multi: bool = False
+    ) -> None:
+        index = Index(key, multi=multi)
+        self._indexes[name] = index
+
+        for guild_id, rows in self._rows.items():
+            for row in rows.values():
+                index.add(row, (guild_id,), self._read_row(row))
+
+    async def find(
+        self, index: str, value: Any, parents: list[Any] | None = None
+    ) -> list[Member]:
+        return [self._read_row(row) for row in self._indexes[index].get(value, parents)]
+
+    async def get_ids(self, parents: list[Any] | None = None) -> list[Any]:
+        guilds = self._rows.keys() if parents is None else {_key(p) for p in parents}
+        ids: dict[int, None] = {}
+
+        for guild_id in guilds:
+            ids.update(dict.fromkeys(self._rows.get(guild_id, ())))
+
+        return list(ids)
+
+    async def delete_all(self) -> None:
+        state = self._state
+        indexes = self._indexes
+        stats = self.stats
+        self.__init__()
+        self._state = state
+        self._indexes = indexes
+        self.stats = stats
+
+        for index in indexes.values():
+            index.clear()
+
+    async def delete_all_parent(self, parents: list[Any]) -> None:
+        for guild_id in {_key(p) for p in parents}:
+            rows = self._rows.pop(guild_id, None)
+
+            if rows is None:
+                continue
+
+            for row in rows.values():
+                self._free_row(row)
+
+            self._size -= len(rows)
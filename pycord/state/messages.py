@@ -0,0 +1,187 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Sequence
+
+from ..lazy import resolve
+from .eviction import EvictionPolicy
+from .store import Store, _key, _stored
+
+__all__: Sequence[str] = ('ChannelBufferPolicy', 'MessageStore')
+
+
+def _channel(entry: _stored) -> Any:
+    # messages are only ever stored under their channel
+    for parent in entry.parents:
+        return parent
+
+
+class ChannelBufferPolicy(EvictionPolicy):
+    """
+    Keeps a fixed-size buffer of messages per channel.
+
+    Once a channel's buffer is full, its oldest message is evicted.
+    Once the Store reaches ``max_items``, the oldest message of the
+    channel with the most messages is evicted instead, so busy channels
+    can't push quieter channels' history out of the cache.
+
+    Parameters
+    ----------
+    per_channel: :class:`int`
+        The maximum amount of messages to keep per channel.
+    max_items: :class:`int` | None
+        The maximum amount of messages to keep globally.
+    """
+
+    __slots__ = ('per_channel', '_buffers', '_lengths', '_longest')
+
+    def __init__(self, per_channel: int, max_items: int | None = None) -> None:
+        super().__init__(max_items)
+        self.per_channel = per_channel
+        # channel -> entries, oldest first
+        self._buffers: dict[Any, OrderedDict[_stored, None]] = {}
+        # buffer length -> channels with that length
+        self._lengths: dict[int, dict[Any, None]] = {}
+        self._longest: int = 0
+
+    def _resize(self, channel: Any, old: int, new: int) -> None:
+        if old:
+            channels = self._lengths[old]
+            del channels[channel]
+
+            if not channels:
+                del self._lengths[old]
+
+                if self._longest == old:
+                    self._longest = new
+
+        if new:
+            try:
+                self._lengths[new][channel] = None
+            except KeyError:
+                self._lengths[new] = {channel: None}
+
+            if new > self._longest:
+                self._longest = new
+
+    def track(self, entry: _stored) -> None:
+        channel = _channel(entry)
+
+        try:
+            buffer = self._buffers[channel]
+        except KeyError:
+            buffer = self._buffers[channel] = OrderedDict()
+
+        buffer[entry] = None
+        self._resize(channel, len(buffer) - 1, len(buffer))
+
+    def forget(self, entry: _stored) -> None:
+        channel = _channel(entry)
+        buffer = self._buffers.get(channel)
+
+        if buffer is None or buffer.pop(entry, False) is False:
+            return
+
+        self._resize(channel, len(buffer) + 1, len(buffer))
+
+        if not buffer:
+            del self._buffers[channel]
+
+    def evict(self) -> _stored | None:
+        channels = self._lengths.get(self._longest)
+
+        if channels:
+            for channel in channels:
+                for entry in self._buffers[channel]:
+                    return entry
+
+    def victim(self, incoming: _stored, size: int) -> _stored | None:
+        buffer = self._buffers.get(_channel(incoming))
+
+        if buffer is not None and len(buffer) >= self.per_channel:
+            for entry in buffer:
+                return entry
+
+        return super().victim(incoming, size)
+
+    def clear(self) -> None:
+        self._buffers.clear()
+        self._lengths.clear()
+        self._longest = 0
+
+
+class MessageStore(Store):
+    """
+    A Store specialized for messages, which are parented by their channel.
+
+    Parameters
+    ----------
+    max_items: :class:`int` | :class:`.EvictionPolicy` | None
+        The maximum amount of messages to cache.
+    per_channel: :class:`int` | None
+        The maximum amount of messages to cache per channel.
+        Setting this enables per-channel buffers, see :class:`ChannelBufferPolicy`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        max_items: int | EvictionPolicy | None = None,
+        per_channel: int | None = None,
+    ) -> None:
+        if per_channel is not None:
+            if isinstance(max_items, EvictionPolicy):
+                raise TypeError(
+                    'per_channel cannot be used alongside a custom eviction policy'
+                )
+
+            max_items = ChannelBufferPolicy(per_channel, max_items)
+
+        super().__init__(max_items)
+
+    async def history(
+        self, channel_id: Any, limit: int | None = None
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Iterates over the cached messages of a channel, newest first.
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            The channel to get messages from.
+        limit: :class:`int` | None
+            The maximum amount of messages to yield.
+        """
+        children = self._parents.get(_key(channel_id))
+
+        if not children:
+            return
+
+        for entry in reversed(list(children)):
+            if limit is not None and limit <= 0:
+                return
+
+            if not self.policy.is_expired(entry):
+                if limit is not None:
+                    limit -= 1
+                yield resolve(entry.storing)
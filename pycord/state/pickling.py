@@ -0,0 +1,84 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+import io
+import pickle
+from typing import TYPE_CHECKING, Any
+
+from ..user import User
+
+if TYPE_CHECKING:
+    from .core import State
+
+# models hold a reference to the State which created them,
+# which should never be serialized alongside them.
+_STATE_ID = 'pycord.state'
+
+
+def _user(state: State | None, attrs: dict[str, Any]) -> User:
+    user = User.__new__(User)
+    user.__dict__.update(attrs)
+
+    if state is None:
+        return user
+
+    return state.users.adopt(user)
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, state: State | None) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.state = state
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if self.state is not None and obj is self.state:
+            return _STATE_ID
+
+    def reducer_override(self, obj: Any) -> Any:
+        # users are interned, so the ones read back from a cache
+        # are swapped for the user already in memory, if any
+        if type(obj) is User:
+            return _user, (self.state, obj.__dict__)
+
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, state: State | None) -> None:
+        super().__init__(file)
+        self.state = state
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _STATE_ID:
+            return self.state
+        raise pickle.UnpicklingError(f'unsupported persistent id: {pid!r}')
+
+
+def dumps(obj: Any, state: State | None) -> bytes:
+    file = io.BytesIO()
+    _Pickler(file, state).dump(obj)
+    return file.getvalue()
+
+
+def loads(data: bytes, state: State | None) -> Any:
+    return _Unpickler(io.BytesIO(data), state).load()
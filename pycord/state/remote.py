@@ -0,0 +1,554 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import itertools
+import logging
+import os
+import pickle
+import socket
+import struct
+from multiprocessing import Process
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterable, Sequence
+
+from ..lazy import resolve
+from .eviction import EvictionPolicy
+from .grouped_store import GroupedStore
+from .indexes import Index
+from .pickling import dumps, loads
+from .store import Store, _key
+
+if TYPE_CHECKING:
+    from .core import State
+
+__all__: Sequence[str] = ('CacheClient', 'CacheServer', 'RemoteStore')
+
+_log = logging.getLogger(__name__)
+
+# every frame is prefixed by the length of its pickled body
+_HEADER = struct.Struct('>I')
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Any:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(length))
+
+
+def _write_frame(writer: asyncio.StreamWriter, obj: Any) -> None:
+    body = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    writer.write(_HEADER.pack(len(body)) + body)
+
+
+class _IndexedBy:
+    # the server can't run the index keys of its clients,
+    # so clients send the values alongside the object instead
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, data: tuple[bytes, dict[str, tuple[Any, ...]]]) -> Any:
+        return data[1].get(self.name)
+
+
+def _blob(data: tuple[bytes, dict[str, tuple[Any, ...]]] | None) -> bytes | None:
+    return None if data is None else data[0]
+
+
+class CacheServer(Process):
+    """
+    A process holding a cache shared by every process connected to it.
+
+    Objects are kept as the pickled blobs sent by :class:`RemoteStore`,
+    so the server never builds models itself.
+    Each Store can be bounded by passing ``<name>_max_items``,
+    like with :class:`.GroupedStore`.
+
+    .. WARNING::
+        Anything able to connect to the socket can read and write the cache,
+        which is why it's only accessible by the user running the server.
+
+    Only one server can listen on a path at once, which is made sure of
+    by locking ``<path>.lock``, so servers started together don't replace
+    each other's socket.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix socket to listen on.
+    """
+
+    def __init__(self, path: str, **max_items: int | EvictionPolicy | None) -> None:
+        super().__init__(daemon=True)
+        self.path = path
+        self._max_items = max_items
+
+    @staticmethod
+    def running(path: str) -> bool:
+        """Whether a cache server is already listening on ``path``."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except OSError:
+                return False
+
+        return True
+
+    def run(self) -> None:
+        asyncio.run(self.serve())
+
+    async def serve(self) -> None:
+        """
+        Serves the cache until cancelled, returning right away
+        if another server already listens on :attr:`path`.
+        """
+        lock = os.open(f'{self.path}.lock', os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock)
+            _log.debug(f'a cache server already listens on {self.path}')
+            return
+
+        try:
+            self._stores = GroupedStore(**self._max_items)
+
+            # the lock is held, so this can only be left behind by a dead server
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            # the socket is created with its final permissions,
+            # so there's no moment at which other users can connect
+            umask = os.umask(0o177)
+
+            try:
+                sock.bind(self.path)
+            except OSError:
+                sock.close()
+                raise
+            finally:
+                os.umask(umask)
+
+            server = await asyncio.start_unix_server(self._handle, sock=sock)
+
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                if os.path.exists(self.path):
+                    os.unlink(self.path)
+        finally:
+            # closing the descriptor releases the lock
+            os.close(lock)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_id, op, name, args = await _read_frame(reader)
+                store = self._stores.sift(name)
+
+                try:
+                    result = await getattr(self, f'_op_{op}')(store, *args)
+                except Exception as exc:
+                    _write_frame(writer, (request_id, False, exc, len(store)))
+                else:
+                    _write_frame(writer, (request_id, True, result, len(store)))
+
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _index(self, store: Store, values: dict[str, tuple[Any, ...]]) -> None:
+        for name in values:
+            if name not in store._indexes:
+                store.add_index(name, _IndexedBy(name), multi=True)
+
+    async def _op_get_one(self, store: Store, parents: list[Any], id: Any) -> Any:
+        return _blob(await store.get_one(parents, id))
+
+    async def _op_get_many(
+        self, store: Store, parents: list[Any], ids: list[Any]
+    ) -> list[Any]:
+        return [_blob(data) for data in await store.get_many(parents, ids)]
+
+    async def _op_get_without_parents(self, store: Store, id: Any) -> Any:
+        found = await store.get_without_parents(id)
+
+        if found is not None:
+            return found[0], _blob(found[1])
+
+    async def _op_insert(
+        self, store: Store, parents: list[Any], id: Any, data: Any
+    ) -> None:
+        self._index(store, data[1])
+        await store.insert(parents, id, data)
+
+    async def _op_save_many(
+        self, store: Store, items: list[tuple[list[Any], Any, Any]]
+    ) -> list[Any]:
+        for _, _, data in items:
+            self._index(store, data[1])
+
+        return [_blob(data) for data in await store.save_many(items)]
+
+    async def _op_discard_many(
+        self, store: Store, parents: list[Any], ids: list[Any]
+    ) -> list[Any]:
+        return [_blob(data) for data in await store.discard_many(parents, ids)]
+
+    async def _op_find(
+        self, store: Store, index: str, value: Any, parents: list[Any] | None
+    ) -> list[Any]:
+        if index not in store._indexes:
+            return []
+
+        return [_blob(data) for data in await store.find(index, value, parents)]
+
+    async def _op_get_all(self, store: Store) -> list[Any]:
+        return [_blob(data) async for data in store.get_all()]
+
+    async def _op_get_all_parent(self, store: Store, parents: list[Any]) -> list[Any]:
+        return [_blob(data) async for data in store.get_all_parent(parents)]
+
+    async def _op_get_ids(self, store: Store, parents: list[Any] | None) -> list[Any]:
+        return await store.get_ids(parents)
+
+    async def _op_delete_all(self, store: Store) -> None:
+        await store.delete_all()
+
+    async def _op_delete_all_parent(self, store: Store, parents: list[Any]) -> None:
+        await store.delete_all_parent(parents)
+
+
+class CacheClient:
+    """
+    A connection to a :class:`CacheServer`, shared by the :class:`RemoteStore`\\s
+    of a process.
+
+    Requests are pipelined over one connection, which is opened
+    on the first request and waits for the server to start listening.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix socket the server listens on.
+    connect_timeout: :class:`float`
+        The amount of seconds to wait for the server to start listening.
+    """
+
+    __slots__ = (
+        'path',
+        'connect_timeout',
+        '_reader',
+        '_writer',
+        '_read_task',
+        '_connecting',
+        '_pending',
+        '_ids',
+        '_sizes',
+    )
+
+    def __init__(self, path: str, connect_timeout: float = 10.0) -> None:
+        self.path = path
+        self.connect_timeout = connect_timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task[None] | None = None
+        self._connecting: asyncio.Lock | None = None
+        # request id -> the store name and future of the request
+        self._pending: dict[int, tuple[str, asyncio.Future[Any]]] = {}
+        self._ids = itertools.count()
+        # store name -> the size last reported by the server
+        self._sizes: dict[str, int] = {}
+
+    async def _connect(self) -> None:
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+
+        async with self._connecting:
+            if self._writer is not None:
+                return
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.connect_timeout
+
+            while True:
+                try:
+                    self._reader, self._writer = await asyncio.open_unix_connection(
+                        self.path
+                    )
+                    break
+                except OSError:
+                    if loop.time() >= deadline:
+                        raise
+
+                    await asyncio.sleep(0.1)
+
+            self._read_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                request_id, ok, result, size = await _read_frame(self._reader)
+                name, future = self._pending.pop(request_id)
+                self._sizes[name] = size
+
+                if future.done():
+                    continue
+                elif ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self._fail(ConnectionError('lost connection to the cache server'))
+
+    def _fail(self, exc: Exception) -> None:
+        self._reader = self._writer = None
+
+        for _, future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+        self._pending.clear()
+
+    async def request(self, op: str, name: str, *args: Any) -> Any:
+        """Runs ``op`` on the Store named ``name`` in the server."""
+        if self._writer is None:
+            await self._connect()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (name, future)
+        _write_frame(self._writer, (request_id, op, name, args))
+        await self._writer.drain()
+        return await future
+
+    def size(self, name: str) -> int:
+        return self._sizes.get(name, 0)
+
+    def close(self) -> None:
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+
+        if self._writer is not None:
+            self._writer.close()
+
+        self._fail(ConnectionError('the cache client has been closed'))
+
+
+class RemoteStore(Store):
+    """
+    A Store kept by a :class:`CacheServer`, shared between processes.
+
+    Every process connected to the same server sees the same objects,
+    so a clustered bot only caches each guild once, and can look up
+    objects received by the shards of other processes.
+
+    Objects are pickled on every write and unpickled on every read,
+    and index values are computed by the writing process, so every
+    process should declare the same indexes.
+
+    .. NOTE::
+        Like :class:`.SQLiteStore`, modifications to a returned object
+        have to be saved back to be kept.
+
+    Parameters
+    ----------
+    client: :class:`CacheClient`
+        The connection to the server.
+    name: :class:`str`
+        The name of the Store in the server.
+    """
+
+    __slots__ = ('_client', '_name', '_state')
+
+    persistent = True
+
+    def __init__(self, client: CacheClient, name: str) -> None:
+        super().__init__()
+        self._client = client
+        self._name = name
+        self._state: State | None = None
+
+    def bind(self, state: State) -> None:
+        self._state = state
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __len__(self) -> int:
+        # asking the server would block, so this is the size
+        # reported by its last response
+        return self._client.size(self._name)
+
+    def memory_usage(self, sample: int = 100) -> int:
+        """Objects are kept by the server, so this is always ``0``."""
+        return 0
+
+    def add_index(
+        self, name: str, key: Callable[[Any], Any], *, multi: bool = False
+    ) -> None:
+        """
+        Declares a secondary index, queryable with :meth:`find`
+
+        Objects already kept by the server are only indexed
+        once they're saved again.
+        """
+        self._indexes[name] = Index(key, multi=multi)
+
+    def remove_index(self, name: str) -> None:
+        self._indexes.pop(name, None)
+
+    async def _request(self, op: str, *args: Any) -> Any:
+        return await self._client.request(op, self._name, *args)
+
+    def _dumps(self, data: Any) -> tuple[bytes, dict[str, tuple[Any, ...]]]:
+        values = {}
+
+        if self._indexes:
+            built = resolve(data)
+            values = {
+                name: index.values_of(built) for name, index in self._indexes.items()
+            }
+
+        return dumps(data, self._state), values
+
+    def _build(self, data: bytes) -> Any:
+        return resolve(loads(data, self._state))
+
+    def _loads(self, data: bytes | None) -> Any | None:
+        if data is None:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        return self._build(data)
+
+    def _replaced(self, data: bytes | None) -> Any | None:
+        if data is None:
+            self.stats.inserts += 1
+            return
+
+        self.stats.updates += 1
+        return self._build(data)
+
+    def _keys(self, parents: Iterable[Any]) -> list[Any]:
+        return [_key(p) for p in parents]
+
+    async def get_one(self, parents: list[Any], id: Any) -> Any | None:
+        return self._loads(
+            await self._request('get_one', self._keys(parents), _key(id))
+        )
+
+    async def get_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        blobs = await self._request(
+            'get_many', self._keys(parents), [_key(id) for id in ids]
+        )
+        return [self._loads(data) for data in blobs]
+
+    async def get_without_parents(self, id: Any) -> tuple[set[Any], Any] | None:
+        found = await self._request('get_without_parents', _key(id))
+
+        if found is None:
+            self.stats.misses += 1
+            return
+
+        return found[0], self._loads(found[1])
+
+    async def insert(self, parents: list[Any], id: Any, data: Any) -> None:
+        await self._request(
+            'insert', self._keys(parents), _key(id), self._dumps(data)
+        )
+        self.stats.inserts += 1
+
+    async def save(self, parents: list[Any], id: Any, data: Any) -> Any | None:
+        (old,) = await self.save_many([(parents, id, data)])
+        return old
+
+    async def save_many(
+        self, items: Iterable[tuple[list[Any], Any, Any]]
+    ) -> list[Any | None]:
+        blobs = await self._request(
+            'save_many',
+            [
+                (self._keys(parents), _key(id), self._dumps(data))
+                for parents, id, data in items
+            ],
+        )
+        return [self._replaced(data) for data in blobs]
+
+    async def discard(self, parents: list[Any], id: Any, type: Any = Any) -> Any | None:
+        (old,) = await self.discard_many(parents, [id])
+        return old
+
+    async def discard_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        blobs = await self._request(
+            'discard_many', self._keys(parents), [_key(id) for id in ids]
+        )
+        self.stats.discards += sum(data is not None for data in blobs)
+        return [None if data is None else self._build(data) for data in blobs]
+
+    async def find(
+        self, index: str, value: Any, parents: list[Any] | None = None
+    ) -> list[Any]:
+        if index not in self._indexes:
+            raise KeyError(index)
+
+        blobs = await self._request(
+            'find',
+            index,
+            value,
+            None if parents is None else self._keys(parents),
+        )
+        return [self._build(data) for data in blobs]
+
+    async def get_all(self) -> AsyncGenerator[Any, None]:
+        for data in await self._request('get_all'):
+            yield self._build(data)
+
+    async def get_all_parent(self, parents: list[Any]) -> AsyncGenerator[Any, None]:
+        for data in await self._request('get_all_parent', self._keys(parents)):
+            yield self._build(data)
+
+    async def get_ids(self, parents: list[Any] | None = None) -> list[Any]:
+        return await self._request(
+            'get_ids', None if parents is None else self._keys(parents)
+        )
+
+    async def delete_all(self) -> None:
+        await self._request('delete_all')
+
+    async def delete_all_parent(self, parents: list[Any]) -> None:
+        await self._request('delete_all_parent', self._keys(parents))
@@ -0,0 +1,571 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterable, Sequence
+
+from ..lazy import resolve
+from .indexes import Index, _value
+from .pickling import dumps, loads
+from .store import Store, _key
+
+if TYPE_CHECKING:
+    from .core import State
+
+__all__: Sequence[str] = ('SQLiteStore',)
+
+
+class _Database:
+    """
+    A connection shared by every SQLiteStore of a database file,
+    so their writes share transactions instead of locking each other out.
+
+    Every query runs on the connection's own thread, off the event loop.
+    """
+
+    __slots__ = ('path', 'connection', 'stores', 'writes', '_executor', '_flush_handle')
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.stores: int = 0
+        self.writes: int = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix='pycord-sqlite')
+        # transactions are managed manually to batch writes
+        self.connection: sqlite3.Connection = self.call(
+            sqlite3.connect, path, isolation_level=None, check_same_thread=False
+        )
+        self.call(self.connection.execute, 'PRAGMA journal_mode=WAL')
+        self.call(self.connection.execute, 'PRAGMA synchronous=NORMAL')
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs ``func`` on the connection's thread, blocking until it's done."""
+        return self._executor.submit(func, *args, **kwargs).result()
+
+    async def run(
+        self, flush_interval: float, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Runs ``func`` on the connection's thread, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            if self.connection.in_transaction and self._flush_handle is None:
+                self._flush_handle = loop.call_later(flush_interval, self._flush_soon)
+
+    def write(self, batch_size: int) -> None:
+        # only ever called on the connection's thread
+        if not self.connection.in_transaction:
+            self.connection.execute('BEGIN')
+
+        self.writes += 1
+
+        if self.writes >= batch_size:
+            self.commit()
+
+    def commit(self) -> None:
+        if self.connection.in_transaction:
+            self.connection.execute('COMMIT')
+
+        self.writes = 0
+
+    def _flush_soon(self) -> None:
+        self._flush_handle = None
+        self._executor.submit(self.commit)
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        self.call(self.commit)
+
+    def close(self) -> None:
+        self.flush()
+        self.call(self.connection.close)
+        self._executor.shutdown()
+
+
+# path -> the database every SQLiteStore of that path shares
+_databases: dict[str, _Database] = {}
+
+
+class SQLiteStore(Store):
+    """
+    A persistent Store backed by SQLite.
+
+    Objects are pickled into a table named after the Store,
+    with secondary tables indexing them by their parents
+    and by any index declared with :meth:`add_index`.
+    Writes are batched into transactions which are committed every
+    ``batch_size`` writes, or ``flush_interval`` seconds after the first
+    uncommitted write, whichever comes first.
+
+    Stores using the same database file share one connection and its
+    transactions, and queries run on that connection's thread rather than
+    blocking the event loop.
+
+    Since the cache outlives the process, using this for the likes of
+    guilds, channels and roles keeps them around between restarts.
+
+    .. NOTE::
+        Objects are deserialized on every read, so modifications to
+        a returned object have to be saved back to be kept.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the database file.
+    table: :class:`str`
+        The name of the table to store objects in.
+    batch_size: :class:`int`
+        The amount of writes to batch into one transaction.
+    flush_interval: :class:`float`
+        The maximum amount of seconds writes stay uncommitted.
+    """
+
+    __slots__ = (
+        '_database',
+        '_db',
+        '_table',
+        '_state',
+        'batch_size',
+        'flush_interval',
+    )
+
+    persistent = True
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f'{table!r} is not a valid table name')
+
+        super().__init__()
+        self._table = table
+        self._state: State | None = None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        database = _databases.get(path)
+
+        if database is None:
+            database = _databases[path] = _Database(path)
+
+        database.stores += 1
+        self._database = database
+        self._db = database.connection
+        database.call(
+            self._db.executescript,
+            f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                key INTEGER PRIMARY KEY,
+                id NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS {table}_id ON {table} (id);
+            CREATE TABLE IF NOT EXISTS {table}_parents (
+                parent NOT NULL,
+                key INTEGER NOT NULL,
+                PRIMARY KEY (parent, key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS {table}_parents_key ON {table}_parents (key);
+            CREATE TABLE IF NOT EXISTS {table}_index (
+                name TEXT NOT NULL,
+                value NOT NULL,
+                key INTEGER NOT NULL,
+                PRIMARY KEY (name, value, key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS {table}_index_key ON {table}_index (key);
+            ''',
+        )
+
+    def bind(self, state: State) -> None:
+        self._state = state
+
+    def __len__(self) -> int:
+        return self._database.call(self._count)
+
+    def _count(self) -> int:
+        return self._db.execute(f'SELECT COUNT(*) FROM {self._table}').fetchone()[0]
+
+    def memory_usage(self, sample: int = 100) -> int:
+        """The size of the database, which is kept on disk rather than in memory."""
+        return self._database.call(self._size_on_disk)
+
+    def _size_on_disk(self) -> int:
+        page_count = self._db.execute('PRAGMA page_count').fetchone()[0]
+        page_size = self._db.execute('PRAGMA page_size').fetchone()[0]
+        return page_count * page_size
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await self._database.run(self.flush_interval, func, *args)
+
+    def _dumps(self, data: Any) -> bytes:
+        return dumps(data, self._state)
+
+    def _loads(self, data: bytes) -> Any:
+        return resolve(loads(data, self._state))
+
+    def _write(self) -> None:
+        self._database.write(self.batch_size)
+
+    def flush(self) -> None:
+        """Commits any pending writes to disk."""
+        self._database.flush()
+
+    def close(self) -> None:
+        """
+        Commits any pending writes, closing the database
+        once every Store using it is closed.
+        """
+        database = self._database
+        database.stores -= 1
+
+        if database.stores > 0:
+            database.flush()
+            return
+
+        if _databases.get(database.path) is database:
+            del _databases[database.path]
+
+        database.close()
+
+    def add_index(
+        self, name: str, key: Callable[[Any], Any], *, multi: bool = False
+    ) -> None:
+        """
+        Declares a secondary index, queryable with :meth:`find`
+
+        Indexes are persisted alongside the objects, and are only built
+        from the existing objects if the database doesn't have them yet.
+        """
+        index = Index(key, multi=multi)
+        self._indexes[name] = index
+        self._database.call(self._build_index, name, index)
+
+    def _build_index(self, name: str, index: Index) -> None:
+        exists = self._db.execute(
+            f'SELECT 1 FROM {self._table}_index WHERE name = ? LIMIT 1', (name,)
+        ).fetchone()
+
+        if exists:
+            return
+
+        for key, data in self._db.execute(
+            f'SELECT key, data FROM {self._table}'
+        ).fetchall():
+            self._write()
+            self._insert_index(name, index, key, self._loads(data))
+
+    def remove_index(self, name: str) -> None:
+        self._indexes.pop(name, None)
+        self._database.call(self._drop_index, name)
+
+    def _drop_index(self, name: str) -> None:
+        self._write()
+        self._db.execute(f'DELETE FROM {self._table}_index WHERE name = ?', (name,))
+
+    def _insert_index(self, name: str, index: Index, key: int, data: Any) -> None:
+        self._db.executemany(
+            f'INSERT OR IGNORE INTO {self._table}_index (name, value, key) '
+            'VALUES (?, ?, ?)',
+            ((name, value, key) for value in index.values_of(data)),
+        )
+
+    def _index(self, ref: int, parents: set[Any], data: Any) -> None:
+        if not self._indexes:
+            return
+
+        data = resolve(data)
+
+        for name, index in self._indexes.items():
+            self._insert_index(name, index, ref, data)
+
+    def _unindex(self, ref: int) -> None:
+        # indexes persisted by previous runs may not have been declared yet
+        self._db.execute(f'DELETE FROM {self._table}_index WHERE key = ?', (ref,))
+
+    async def find(
+        self, index: str, value: Any, parents: list[Any] | None = None
+    ) -> list[Any]:
+        if index not in self._indexes:
+            raise KeyError(index)
+
+        return await self._run(self._select_indexed, index, value, parents)
+
+    def _select_indexed(
+        self, index: str, value: Any, parents: list[Any] | None
+    ) -> list[Any]:
+        query = f'''
+            SELECT s.data FROM {self._table} s
+            JOIN {self._table}_index i ON i.key = s.key
+            WHERE i.name = ? AND i.value = ?
+        '''
+        args: list[Any] = [index, _value(value)]
+
+        if parents is not None:
+            placeholders, ps = self._parent_filter({_key(p) for p in parents})
+            query += f'''
+            AND s.key IN (
+                SELECT key FROM {self._table}_parents WHERE parent IN ({placeholders})
+            )
+            '''
+            args.extend(ps)
+
+        return [self._loads(data) for data, in self._db.execute(query, args)]
+
+    def _parent_filter(self, parents: set[Any]) -> tuple[str, list[Any]]:
+        ps = [p for p in parents if p is not None]
+        return ', '.join('?' * len(ps)), ps
+
+    def _find(self, parents: set[Any], id: Any) -> tuple[int, bytes] | None:
+        placeholders, ps = self._parent_filter(parents)
+
+        if not ps:
+            return self._db.execute(
+                f'SELECT key, data FROM {self._table} WHERE id = ? LIMIT 1',
+                (_key(id),),
+            ).fetchone()
+
+        return self._db.execute(
+            f'''
+            SELECT s.key, s.data FROM {self._table} s
+            JOIN {self._table}_parents p ON p.key = s.key
+            WHERE s.id = ? AND p.parent IN ({placeholders})
+            LIMIT 1
+            ''',
+            (_key(id), *ps),
+        ).fetchone()
+
+    def _add(self, parents: set[Any], id: Any, data: Any) -> None:
+        self._write()
+        self.stats.inserts += 1
+        key = self._db.execute(
+            f'INSERT INTO {self._table} (id, data) VALUES (?, ?)',
+            (_key(id), self._dumps(data)),
+        ).lastrowid
+        self._db.executemany(
+            f'INSERT OR IGNORE INTO {self._table}_parents (parent, key) VALUES (?, ?)',
+            ((parent, key) for parent in parents if parent is not None),
+        )
+        self._index(key, parents, data)
+
+    def _get(self, parents: set[Any], id: Any) -> Any | None:
+        row = self._find(parents, id)
+
+        if row is None:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        return self._loads(row[1])
+
+    def _save(self, parents: set[Any], id: Any, data: Any) -> Any | None:
+        row = self._find(parents, id)
+
+        if row is None:
+            self._add(parents, id, data)
+            return
+
+        self._write()
+        self._db.execute(
+            f'UPDATE {self._table} SET data = ? WHERE key = ?',
+            (self._dumps(data), row[0]),
+        )
+        self._unindex(row[0])
+        self._index(row[0], parents, data)
+        self.stats.updates += 1
+        return self._loads(row[1])
+
+    def _discard(self, parents: set[Any], id: Any) -> Any | None:
+        row = self._find(parents, id)
+
+        if row is None:
+            return
+
+        self._write()
+        self._db.execute(f'DELETE FROM {self._table} WHERE key = ?', (row[0],))
+        self._db.execute(
+            f'DELETE FROM {self._table}_parents WHERE key = ?', (row[0],)
+        )
+        self._unindex(row[0])
+        self.stats.discards += 1
+        return self._loads(row[1])
+
+    async def get_one(self, parents: list[Any], id: Any) -> Any | None:
+        return await self._run(self._get, {_key(p) for p in parents}, id)
+
+    async def get_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        ps = {_key(p) for p in parents}
+        return await self._run(lambda: [self._get(ps, id) for id in ids])
+
+    async def insert(self, parents: list[Any], id: Any, data: Any) -> None:
+        await self._run(self._add, {_key(p) for p in parents}, id, data)
+
+    async def save(self, parents: list[Any], id: Any, data: Any) -> Any | None:
+        return await self._run(self._save, {_key(p) for p in parents}, id, data)
+
+    async def save_many(
+        self, items: Iterable[tuple[list[Any], Any, Any]]
+    ) -> list[Any | None]:
+        items = [({_key(p) for p in parents}, id, data) for parents, id, data in items]
+        return await self._run(
+            lambda: [self._save(parents, id, data) for parents, id, data in items]
+        )
+
+    async def discard(self, parents: list[Any], id: Any, type: Any = Any) -> Any | None:
+        return await self._run(self._discard, {_key(p) for p in parents}, id)
+
+    async def discard_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        ps = {_key(p) for p in parents}
+        return await self._run(lambda: [self._discard(ps, id) for id in ids])
+
+    async def get_without_parents(self, id: Any) -> tuple[set[Any], Any] | None:
+        return await self._run(self._get_without_parents, id)
+
+    def _get_without_parents(self, id: Any) -> tuple[set[Any], Any] | None:
+        row = self._find(set(), id)
+
+        if row is None:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        parents = {
+            parent
+            for parent, in self._db.execute(
+                f'SELECT parent FROM {self._table}_parents WHERE key = ?', (row[0],)
+            )
+        }
+        return parents, self._loads(row[1])
+
+    async def get_all(self) -> AsyncGenerator[Any, None]:
+        for data in await self._run(self._select_all):
+            yield data
+
+    def _select_all(self) -> list[Any]:
+        return [
+            self._loads(data)
+            for data, in self._db.execute(f'SELECT data FROM {self._table}')
+        ]
+
+    async def get_all_parent(self, parents: list[Any]) -> AsyncGenerator[Any, None]:
+        for data in await self._run(self._select_all_parent, parents):
+            yield data
+
+    def _select_all_parent(self, parents: list[Any]) -> list[Any]:
+        placeholders, ps = self._parent_filter({_key(p) for p in parents})
+
+        if not ps:
+            return []
+
+        rows = self._db.execute(
+            f'''
+            SELECT data FROM {self._table} WHERE key IN (
+                SELECT key FROM {self._table}_parents WHERE parent IN ({placeholders})
+            )
+            ''',
+            ps,
+        ).fetchall()
+
+        return [self._loads(data) for data, in rows]
+
+    async def get_ids(self, parents: list[Any] | None = None) -> list[Any]:
+        return await self._run(self._select_ids, parents)
+
+    def _select_ids(self, parents: list[Any] | None) -> list[Any]:
+        if parents is None:
+            rows = self._db.execute(f'SELECT DISTINCT id FROM {self._table}')
+            return [id for id, in rows]
+
+        placeholders, ps = self._parent_filter({_key(p) for p in parents})
+
+        if not ps:
+            return []
+
+        rows = self._db.execute(
+            f'''
+            SELECT DISTINCT s.id FROM {self._table} s
+            JOIN {self._table}_parents p ON p.key = s.key
+            WHERE p.parent IN ({placeholders})
+            ''',
+            ps,
+        )
+        return [id for id, in rows]
+
+    async def delete_all(self) -> None:
+        await self._run(self._delete_all)
+
+    def _delete_all(self) -> None:
+        self._write()
+        self._db.execute(f'DELETE FROM {self._table}')
+        self._db.execute(f'DELETE FROM {self._table}_parents')
+        self._db.execute(f'DELETE FROM {self._table}_index')
+
+    async def delete_all_parent(self, parents: list[Any]) -> None:
+        await self._run(self._delete_all_parent, parents)
+
+    def _delete_all_parent(self, parents: list[Any]) -> None:
+        placeholders, ps = self._parent_filter({_key(p) for p in parents})
+
+        if not ps:
+            return
+
+        self._write()
+        self._db.execute(
+            f'''
+            DELETE FROM {self._table}_index WHERE key IN (
+                SELECT key FROM {self._table}_parents WHERE parent IN ({placeholders})
+            )
+            ''',
+            ps,
+        )
+        self._db.execute(
+            f'''
+            DELETE FROM {self._table} WHERE key IN (
+                SELECT key FROM {self._table}_parents WHERE parent IN ({placeholders})
+            )
+            ''',
+            ps,
+        )
+        self._db.execute(
+            f'''
+            DELETE FROM {self._table}_parents WHERE key IN (
+                SELECT key FROM {self._table}_parents WHERE parent IN ({placeholders})
+            )
+            ''',
+            ps,
+        )
@@ -0,0 +1,119 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Sequence
+
+from ..lazy import Lazy
+
+__all__: Sequence[str] = ('StoreStats',)
+
+
+class StoreStats:
+    """
+    Counters of how a Store is being used.
+
+    These are plain integer increments, cheap enough to always be kept.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of lookups which found an object.
+    misses: :class:`int`
+        The amount of lookups which didn't find an object.
+    inserts: :class:`int`
+        The amount of objects added.
+    updates: :class:`int`
+        The amount of objects replaced by a save.
+    discards: :class:`int`
+        The amount of objects explicitly discarded.
+    evictions: :class:`int`
+        The amount of objects evicted by the Store's policy, including expired ones.
+    """
+
+    __slots__ = ('hits', 'misses', 'inserts', 'updates', 'discards', 'evictions')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f'<StoreStats hits={self.hits} misses={self.misses} '
+            f'inserts={self.inserts} evictions={self.evictions}>'
+        )
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.updates = 0
+        self.discards = 0
+        self.evictions = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _sizeof(obj: Any) -> int:
+    """
+    Approximates the memory taken by an object and its attributes,
+    without following them any further.
+    """
+    if isinstance(obj, Lazy):
+        if not obj.built:
+            return sys.getsizeof(obj) + sum(_sizeof(arg) for arg in obj._args[:1])
+
+        obj = obj.resolve()
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        return size + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(sys.getsizeof(v) for v in obj)
+
+    attrs = getattr(obj, '__dict__', None)
+
+    if attrs is not None:
+        size += sys.getsizeof(attrs) + sum(sys.getsizeof(v) for v in attrs.values())
+
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, '__slots__', ())
+
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name.startswith('__'):
+                continue
+
+            value = getattr(obj, name, None)
+
+            if value is not None:
+                size += sys.getsizeof(value)
+
+    return size
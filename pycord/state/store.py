@@ -19,7 +19,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
 
-from typing import Any, Type, TypeVar
+import sys
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Type, TypeVar
+
+from ..lazy import Lazy, resolve
+from .eviction import EvictionPolicy, LRUPolicy
+from .indexes import Index
+from .stats import StoreStats, _sizeof
+
+
+def _key(value: Any) -> Any:
+    # Snowflake hashes differently from int, so normalize ids and parents
+    # before they're used as dictionary keys
+    return int(value) if isinstance(value, int) else value
 
 
 class _stored:
@@ -30,81 +43,427 @@ class _stored:
         self.id = self_id
         self.storing = storing
 
+    def matches(self, parents: set[Any]) -> bool:
+        # no parents means the lookup is done purely by id
+        return not parents or not self.parents.isdisjoint(parents)
+
 
 T = TypeVar('T')
 
 
 class Store:
-    __slots__ = ('_store', 'max_items')
+    __slots__ = (
+        '_store',
+        '_parents',
+        '_size',
+        '_indexes',
+        '_unindexed',
+        'policy',
+        'stats',
+    )
+
+    # whether this Store keeps its data outside of the process by itself
+    persistent: bool = False
+
+    # id -> entries with that id, usually only one unless the same object
+    # is saved under separate parents (like a member in multiple guilds)
+    _store: dict[Any, list[_stored]]
+    # parent -> entries which have that parent, kept in insertion order
+    _parents: dict[Any, dict[_stored, None]]
+    # secondary indexes by name, see add_index
+    _indexes: dict[str, Index]
+    # lazily cached entries which haven't been indexed yet,
+    # since indexing them would build them
+    _unindexed: dict[Any, None]
+
+    def __init__(self, max_items: int | EvictionPolicy | None = None) -> None:
+        self._store = {}
+        self._parents = {}
+        self._size = 0
+        self._indexes = {}
+        self._unindexed = {}
+        self.stats = StoreStats()
+
+        if isinstance(max_items, EvictionPolicy):
+            self.policy = max_items
+        elif max_items:
+            self.policy = LRUPolicy(max_items)
+        else:
+            self.policy = EvictionPolicy()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def memory_usage(self, sample: int = 100) -> int:
+        """
+        Approximates the bytes taken by this Store
+
+        The size of objects is estimated from a sample of them,
+        so this stays cheap for large Stores.
+
+        Parameters
+        ----------
+        sample: :class:`int`
+            The amount of objects to measure.
+
+        Returns
+        -------
+        :class:`int`
+        """
+        size = sys.getsizeof(self._store) + sys.getsizeof(self._parents)
+        size += sum(sys.getsizeof(children) for children in self._parents.values())
+
+        if not self._size:
+            return size
+
+        sampled = [
+            entry
+            for entries in islice(self._store.values(), sample)
+            for entry in entries
+        ]
+        per_entry = sum(
+            sys.getsizeof(entry) + sys.getsizeof(entry.parents) + _sizeof(entry.storing)
+            for entry in sampled
+        ) / len(sampled)
+        return size + int(per_entry * self._size)
+
+    def bind(self, state: Any) -> None:
+        """Called with the State this Store is attached to."""
+
+    def close(self) -> None:
+        """Called when the Bot shuts down."""
+
+    @property
+    def max_items(self) -> int | None:
+        return self.policy.max_items
+
+    @max_items.setter
+    def max_items(self, value: int | None) -> None:
+        self.policy.max_items = value
+
+    def add_index(
+        self, name: str, key: Callable[[Any], Any], *, multi: bool = False
+    ) -> None:
+        """
+        Declares a secondary index, queryable with :meth:`find`
+
+        Objects already in this Store are indexed immediately,
+        and the index is kept up to date as objects are saved and discarded.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the index.
+        key: Callable[[Any], Any]
+            Gets the value to index an object by, or ``None`` to leave it out.
+        multi: :class:`bool`
+            Whether ``key`` returns an iterable of values, like a member's roles.
+        """
+        index = Index(key, multi=multi)
+        self._indexes[name] = index
+
+        for entries in self._store.values():
+            for entry in entries:
+                if entry not in self._unindexed:
+                    index.add(entry, entry.parents, resolve(entry.storing))
+
+    def remove_index(self, name: str) -> None:
+        self._indexes.pop(name, None)
+
+        if not self._indexes:
+            self._unindexed.clear()
+
+    def _index(self, ref: Any, parents: set[Any], data: Any) -> None:
+        if not self._indexes:
+            return
+
+        if isinstance(data, Lazy):
+            if not data.built:
+                self._unindexed[ref] = None
+                return
+
+            data = data.resolve()
+
+        for index in self._indexes.values():
+            index.add(ref, parents, data)
+
+    def _unindex(self, ref: Any) -> None:
+        if not self._indexes:
+            return
+
+        if ref in self._unindexed:
+            del self._unindexed[ref]
+            return
+
+        for index in self._indexes.values():
+            index.remove(ref)
+
+    def _index_pending(self) -> None:
+        for entry in list(self._unindexed):
+            del self._unindexed[entry]
+            self._index(entry, entry.parents, resolve(entry.storing))
+
+    def _find(self, parents: set[Any], id: Any) -> _stored | None:
+        entries = self._store.get(_key(id))
+
+        if entries is None:
+            return
+
+        for entry in entries:
+            if entry.matches(parents):
+                return entry
+
+    def _link(self, entry: _stored) -> None:
+        try:
+            self._store[entry.id].append(entry)
+        except KeyError:
+            self._store[entry.id] = [entry]
+
+        for parent in entry.parents:
+            try:
+                self._parents[parent][entry] = None
+            except KeyError:
+                self._parents[parent] = {entry: None}
+
+        self._size += 1
+        self.policy.track(entry)
+        self._index(entry, entry.parents, entry.storing)
+
+    def _unlink(self, entry: _stored) -> None:
+        entries = self._store.get(entry.id)
 
-    _store: set[_stored]
+        if entries is None or entry not in entries:
+            self.policy.forget(entry)
+            return
 
-    def __init__(self, max_items: int | None = None) -> None:
-        self._store = set()
-        self.max_items = max_items
+        entries.remove(entry)
+
+        if not entries:
+            del self._store[entry.id]
+
+        for parent in entry.parents:
+            children = self._parents.get(parent)
+
+            if children is not None:
+                children.pop(entry, None)
+
+                if not children:
+                    del self._parents[parent]
+
+        self._size -= 1
+        self.policy.forget(entry)
+        self._unindex(entry)
+
+    def _evict(self, incoming: _stored) -> None:
+        for entry in self.policy.expired():
+            self._unlink(entry)
+            self.stats.evictions += 1
+
+        while (entry := self.policy.victim(incoming, self._size)) is not None:
+            self._unlink(entry)
+            self.stats.evictions += 1
+
+    def _alive(self, entry: _stored | None) -> bool:
+        if entry is None:
+            return False
+
+        if self.policy.is_expired(entry):
+            self._unlink(entry)
+            self.stats.evictions += 1
+            return False
+
+        return True
+
+    def _add(self, parents: set[Any], id: Any, data: Any) -> None:
+        entry = _stored(parents, _key(id), data)
+        self._evict(entry)
+        self._link(entry)
+        self.stats.inserts += 1
+
+    def _get(self, parents: set[Any], id: Any) -> Any | None:
+        entry = self._find(parents, id)
+
+        if self._alive(entry):
+            self.stats.hits += 1
+            self.policy.touch(entry)
+            return resolve(entry.storing)
+
+        self.stats.misses += 1
+
+    def _save(self, parents: set[Any], id: Any, data: Any) -> Any | None:
+        entry = self._find(parents, id)
+
+        if self._alive(entry):
+            old_data = entry.storing
+            self._unindex(entry)
+            entry.storing = data
+            self.policy.update(entry)
+            self._index(entry, entry.parents, data)
+            self.stats.updates += 1
+            return resolve(old_data)
+
+        self._add(parents, id, data)
+
+    def _discard(self, parents: set[Any], id: Any) -> Any | None:
+        entry = self._find(parents, id)
+
+        if entry is not None:
+            self._unlink(entry)
+            self.stats.discards += 1
+            return resolve(entry.storing)
 
     async def get_one(self, parents: list[Any], id: Any) -> Any | None:
-        ps = set(parents)
+        return self._get({_key(p) for p in parents}, id)
 
-        for store in self._store:
-            if store.parents & ps and store.id == id:
-                return store.storing
+    async def get_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        """Gets multiple objects under the same parents, ``None`` for missing ones."""
+        ps = {_key(p) for p in parents}
+        return [self._get(ps, id) for id in ids]
 
     async def get_without_parents(self, id: Any) -> tuple[set[Any], Any] | None:
-        for store in self._store:
-            if store.id == id:
-                return store.parents, store.storing
+        entries = self._store.get(_key(id))
 
-    async def insert(self, parents: list[Any], id: Any, data: Any) -> None:
-        if self.max_items and len(self._store) == self.max_items:
-            self._store = set()
+        if entries and self._alive(entries[0]):
+            entry = entries[0]
+            self.stats.hits += 1
+            self.policy.touch(entry)
+            return entry.parents, resolve(entry.storing)
 
-        self._store.add(_stored(set(parents), id, data))
+        self.stats.misses += 1
+
+    async def insert(self, parents: list[Any], id: Any, data: Any) -> None:
+        self._add({_key(p) for p in parents}, id, data)
 
     async def save(self, parents: list[Any], id: Any, data: Any) -> Any | None:
-        ps = set(parents)
-
-        for store in self._store:
-            if store.parents & ps and store.id == id:
-                old_data = store.storing
-                self._store.discard(store)
-                store.storing = data
-                self._store.add(store)
-                return old_data
-        else:
-            if self.max_items and len(self._store) == self.max_items:
-                self._store = {}
+        return self._save({_key(p) for p in parents}, id, data)
 
-            store = _stored(set(parents), id, data)
-            self._store.add(store)
+    async def save_many(
+        self, items: Iterable[tuple[list[Any], Any, Any]]
+    ) -> list[Any | None]:
+        """
+        Saves multiple ``(parents, id, data)`` items at once,
+        returning the data each one replaced.
+        """
+        return [
+            self._save({_key(p) for p in parents}, id, data)
+            for parents, id, data in items
+        ]
 
     async def discard(
         self, parents: list[Any], id: Any, type: Type[T] | T = Any
     ) -> T | None:
-        ps = set(parents)
+        return self._discard({_key(p) for p in parents}, id)
+
+    async def discard_many(
+        self, parents: list[Any], ids: Iterable[Any]
+    ) -> list[Any | None]:
+        """Discards multiple objects under the same parents, returning them."""
+        ps = {_key(p) for p in parents}
+        return [self._discard(ps, id) for id in ids]
+
+    async def find(
+        self, index: str, value: Any, parents: list[Any] | None = None
+    ) -> list[Any]:
+        """
+        Gets every object indexed under ``value``, without scanning the Store
+
+        Parameters
+        ----------
+        index: :class:`str`
+            The name of the index, given to :meth:`add_index`.
+        value: Any
+            The value to look up, like a role id.
+        parents: list[Any] | None
+            Only get objects under these parents, like a guild id.
 
-        for store in self._store:
-            if store.parents & ps or store.id == id:
-                self._store.remove(store)
-                return store
+        Returns
+        -------
+        list[Any]
+        """
+        self._index_pending()
+        return [
+            resolve(entry.storing)
+            for entry in self._indexes[index].get(value, parents)
+            if not self.policy.is_expired(entry)
+        ]
+
+    def entries(self) -> Iterator[tuple[set[Any], Any, Any]]:
+        """Iterates over every ``(parents, id, data)`` in this Store."""
+        for entries in list(self._store.values()):
+            for entry in entries:
+                if not self.policy.is_expired(entry):
+                    yield entry.parents, entry.id, entry.storing
 
     async def get_all(self):
-        for store in self._store:
-            yield store.storing
+        for entries in list(self._store.values()):
+            for entry in entries:
+                if not self.policy.is_expired(entry):
+                    yield resolve(entry.storing)
 
     async def get_all_parent(self, parents: list[Any]):
-        ps = set(parents)
+        seen: set[_stored] = set()
+
+        for parent in parents:
+            children = self._parents.get(_key(parent))
+
+            if children is None:
+                continue
+
+            for entry in list(children):
+                if entry not in seen and not self.policy.is_expired(entry):
+                    seen.add(entry)
+                    yield resolve(entry.storing)
+
+    async def get_ids(self, parents: list[Any] | None = None) -> list[Any]:
+        """
+        Gets the ids of every object, or only those under ``parents``,
+        without building them.
+        """
+        if parents is None:
+            return list(self._store)
 
-        for store in self._store:
-            if store.parents & ps:
-                yield store.storing
+        ids: dict[Any, None] = {}
+
+        for parent in parents:
+            for entry in self._parents.get(_key(parent), ()):
+                ids[entry.id] = None
+
+        return list(ids)
 
     async def delete_all(self) -> None:
         self._store.clear()
+        self._parents.clear()
+        self._size = 0
+        self.policy.clear()
+        self._unindexed.clear()
+
+        for index in self._indexes.values():
+            index.clear()
 
     async def delete_all_parent(self, parents: list[Any]) -> None:
-        ps = set(parents)
+        for parent in parents:
+            children = self._parents.get(_key(parent))
+
+            if children is None:
+                continue
+
+            for entry in list(children):
+                self._unlink(entry)
+
+
+class NullStore(Store):
+    """
+    A Store which never keeps anything, used for entities which aren't cached.
+
+    Lookups always miss, and saves return ``None`` as if nothing was replaced.
+    """
+
+    __slots__ = ()
+
+    def _add(self, parents: set[Any], id: Any, data: Any) -> None:
+        pass
 
-        for store in self._store:
-            if store.parents & ps:
-                self._store.remove(store)
+    def _save(self, parents: set[Any], id: Any, data: Any) -> None:
+        pass
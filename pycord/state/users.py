@@ -0,0 +1,125 @@
+# cython: language_level=3
+# Copyright (c) 2021-present Pycord Development
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+from weakref import WeakValueDictionary
+
+from ..user import User
+
+if TYPE_CHECKING:
+    from ..types import User as DiscordUser
+    from .core import State
+
+__all__: Sequence[str] = ('UserRegistry',)
+
+
+class UserRegistry:
+    """
+    Interns Users by id, so every model referencing a user shares one object.
+
+    Users are held weakly, and are dropped once nothing else references them.
+    New payloads for an interned user update it in place.
+
+    Parameters
+    ----------
+    state: :class:`State`
+        The State to build Users with.
+    """
+
+    __slots__ = ('_state', '_users')
+
+    def __init__(self, state: State) -> None:
+        self._state = state
+        self._users: WeakValueDictionary[int, User] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, id: Any) -> bool:
+        return int(id) in self._users
+
+    def get(self, id: Any) -> User | None:
+        """
+        Gets an interned User
+
+        Parameters
+        ----------
+        id: :class:`int`
+            The id of the User.
+
+        Returns
+        -------
+        :class:`User` | None
+        """
+        return self._users.get(int(id))
+
+    def intern(self, data: DiscordUser) -> User:
+        """
+        Gets the User for a payload, updating it in place or creating it
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The User payload.
+
+        Returns
+        -------
+        :class:`User`
+        """
+        id = int(data['id'])
+        user = self._users.get(id)
+
+        if user is None:
+            user = User(data, self._state)
+            self._users[id] = user
+        else:
+            user._update(data)
+
+        return user
+
+    def adopt(self, user: User) -> User:
+        """
+        Interns a User which wasn't built from a payload, like one read back
+        from a snapshot or another cache, unless its id already is
+
+        Parameters
+        ----------
+        user: :class:`User`
+            The User to intern.
+
+        Returns
+        -------
+        :class:`User`
+            The interned User.
+        """
+        id = int(user.id)
+        interned = self._users.get(id)
+
+        if interned is None:
+            self._users[id] = user
+            return user
+
+        return interned
+
+    def clear(self) -> None:
+        self._users.clear()
@@ -97,6 +97,8 @@ class MessageInteraction(TypedDict):
 class Message(TypedDict):
     id: Snowflake
     channel_id: Snowflake
+    guild_id: NotRequired[Snowflake]
+    member: NotRequired[GuildMember]
     author: NotRequired[User]
     content: NotRequired[str]
     timestamp: str
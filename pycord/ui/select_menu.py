@@ -30,7 +30,6 @@ from ..media import Emoji
 from ..missing import MISSING, MissingEnum
 from ..role import Role
 from ..types import AsyncFunc
-from ..user import User
 from ..utils import get_arg_defaults, remove_undefined
 from .interactive_component import InteractiveComponent
 
@@ -168,7 +167,7 @@ class SelectMenu(InteractiveComponent):
             users = []
             for user_id in inter.values:
                 users.append(
-                    User(inter.data['resolved']['users'][user_id], self._state)
+                    self._state.users.intern(inter.data['resolved']['users'][user_id])
                 )
 
             await self._callback(
@@ -189,8 +188,8 @@ class SelectMenu(InteractiveComponent):
             for mentionable_id in inter.values:
                 try:
                     mentionables.append(
-                        User(
-                            inter.data['resolved']['users'][mentionable_id], self._state
+                        self._state.users.intern(
+                            inter.data['resolved']['users'][mentionable_id]
                         )
                     )
                 except KeyError:
@@ -40,35 +40,62 @@ class User:
         self.name: str = data['username']
         self.discriminator: str = data['discriminator']
         self._avatar: str | None = data['avatar']
-        self.bot: bool | MissingEnum = data.get('bot', MISSING)
-        self.system: bool | MissingEnum = data.get('system', MISSING)
-        self.mfa_enabled: bool | MissingEnum = data.get('mfa_enabled', MISSING)
-        self._banner: MissingEnum | str | None = data.get('banner', MISSING)
-        self._accent_color: MissingEnum | int | None = data.get('accent_color', MISSING)
-        self.accent_color: MissingEnum | Color | None = (
-            Color(self._accent_color)
-            if self._accent_color not in [MISSING, None]
-            else self._accent_color
-        )
-        self.locale: MissingEnum | LOCALE = data.get('locale', MISSING)
-        self.verified: MissingEnum | bool = data.get('verified', MISSING)
-        self.email: str | None | MissingEnum = data.get('email', MISSING)
-        self._flags: MissingEnum | int = data.get('flags', MISSING)
-        self.flags: MissingEnum | UserFlags = (
-            UserFlags.from_value(self._flags) if self._flags is not MISSING else MISSING
-        )
-        self._premium_type: MissingEnum | int = data.get('premium_type', MISSING)
-        self.premium_type: PremiumType | MissingEnum = (
-            PremiumType(self._premium_type)
-            if self._premium_type is not MISSING
-            else MISSING
-        )
-        self._public_flags: MissingEnum | int = data.get('public_flags', MISSING)
-        self.public_flags: MissingEnum | UserFlags = (
-            UserFlags.from_value(self._public_flags)
-            if self._public_flags is not MISSING
-            else MISSING
-        )
+        self.bot: bool | MissingEnum = MISSING
+        self.system: bool | MissingEnum = MISSING
+        self.mfa_enabled: bool | MissingEnum = MISSING
+        self._banner: MissingEnum | str | None = MISSING
+        self._accent_color: MissingEnum | int | None = MISSING
+        self.accent_color: MissingEnum | Color | None = MISSING
+        self.locale: MissingEnum | LOCALE = MISSING
+        self.verified: MissingEnum | bool = MISSING
+        self.email: str | None | MissingEnum = MISSING
+        self._flags: MissingEnum | int = MISSING
+        self.flags: MissingEnum | UserFlags = MISSING
+        self._premium_type: MissingEnum | int = MISSING
+        self.premium_type: PremiumType | MissingEnum = MISSING
+        self._public_flags: MissingEnum | int = MISSING
+        self.public_flags: MissingEnum | UserFlags = MISSING
+        self._update(data)
+
+    def _update(self, data: DiscordUser) -> None:
+        # only fields present in the payload are updated,
+        # since most payloads only carry part of a user
+        if 'username' in data:
+            self.name = data['username']
+        if 'discriminator' in data:
+            self.discriminator = data['discriminator']
+        if 'avatar' in data:
+            self._avatar = data['avatar']
+        if 'bot' in data:
+            self.bot = data['bot']
+        if 'system' in data:
+            self.system = data['system']
+        if 'mfa_enabled' in data:
+            self.mfa_enabled = data['mfa_enabled']
+        if 'banner' in data:
+            self._banner = data['banner']
+        if 'accent_color' in data and data['accent_color'] != self._accent_color:
+            self._accent_color = data['accent_color']
+            self.accent_color = (
+                Color(self._accent_color)
+                if self._accent_color is not None
+                else self._accent_color
+            )
+        if 'locale' in data:
+            self.locale = data['locale']
+        if 'verified' in data:
+            self.verified = data['verified']
+        if 'email' in data:
+            self.email = data['email']
+        if 'flags' in data and data['flags'] != self._flags:
+            self._flags = data['flags']
+            self.flags = UserFlags.from_value(self._flags)
+        if 'premium_type' in data and data['premium_type'] != self._premium_type:
+            self._premium_type = data['premium_type']
+            self.premium_type = PremiumType(self._premium_type)
+        if 'public_flags' in data and data['public_flags'] != self._public_flags:
+            self._public_flags = data['public_flags']
+            self.public_flags = UserFlags.from_value(self._public_flags)
 
     @cached_property
     def mention(self) -> str:
@@ -65,8 +65,20 @@ async def _text_or_json(cr: ClientResponse) -> str | dict[str, Any]:
     return await cr.text('utf-8')
 
 
-def loads(data: Any) -> Any:
-    return msgspec.json.decode(data.encode()) if msgspec else json.loads(data)
+if msgspec:
+    # decoders keep caches between calls, so one is reused for every payload
+    _json_decoder = msgspec.json.Decoder()
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decodes JSON, taking bytes directly to avoid copying them into a str."""
+    if msgspec:
+        return _json_decoder.decode(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    return json.loads(data)
 
 
 def dumps(data: Any) -> str:
@@ -302,6 +314,100 @@ def get_args(annotation: Any) -> tuple[Any, ...]:
     return anns
 
 
+# class -> the patchable fields of it and its bases
+_patchable_fields: dict[type, dict[str, tuple[Any, ...]]] = {}
+
+
+def _fields_of(cls: type) -> dict[str, tuple[Any, ...]]:
+    fields = _patchable_fields.get(cls)
+
+    if fields is None:
+        fields = {}
+
+        # bases first, so subclasses can override their fields
+        for base in reversed(cls.__mro__):
+            fields.update(base.__dict__.get('_patchable', {}))
+
+        _patchable_fields[cls] = fields
+
+    return fields
+
+
+def _same(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    elif type(a) is not type(b):
+        return False
+    elif isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    elif type(a).__eq__ is not object.__eq__:
+        return a == b
+
+    # models like flags and overwrites don't define equality
+    attrs = getattr(a, '__dict__', None)
+
+    if attrs is not None:
+        return attrs.keys() == b.__dict__.keys() and all(
+            _same(v, b.__dict__[k]) for k, v in attrs.items()
+        )
+
+    slots = [
+        name
+        for cls in type(a).__mro__
+        for name in getattr(cls, '__slots__', ())
+        if not name.startswith('__')
+    ]
+    return bool(slots) and all(
+        _same(getattr(a, name, MISSING), getattr(b, name, MISSING)) for name in slots
+    )
+
+
+def _nullable(convert: Callable[[Any], Any], null: Any = None) -> Callable[[Any], Any]:
+    # a patch converter which gives ``null`` for null values
+    def converter(value: Any) -> Any:
+        return convert(value) if value is not None else null
+
+    return converter
+
+
+def apply_patch(obj: Any, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Applies a full or partial payload onto an existing model,
+    only touching the attributes whose value changed.
+
+    The fields are declared by ``_patchable`` on the model's class and its bases,
+    mapping payload keys to ``(attribute, converter)``, or to
+    ``(attribute, converter, raw attribute)`` for attributes which also keep
+    their raw value. Converters may be ``None`` to use the raw value.
+
+    Returns
+    -------
+    dict[:class:`str`, Any]
+        The previous values of the changed attributes.
+    """
+    previous = {}
+
+    for key, field in _fields_of(type(obj)).items():
+        if key not in data:
+            continue
+
+        raw = data[key]
+        attr, convert = field[0], field[1]
+        value = convert(raw) if convert is not None else raw
+        current = getattr(obj, attr, MISSING)
+
+        if _same(current, value):
+            continue
+
+        previous[attr] = current
+        setattr(obj, attr, value)
+
+        if len(field) > 2:
+            setattr(obj, field[2], raw)
+
+    return previous
+
+
 def dict_compare(d1: dict, d2: dict) -> bool:
     for n, v in d1.items():
         if d2.get(n) != v:
@@ -45,11 +45,12 @@ packages = [
 
 extra_requires = {
     'speed': [
-        'msgspec~=0.9.1',  # Faster alternative to the normal json module.
+        'msgspec~=0.18',  # Faster alternative to the normal json module.
         'aiodns~=3.0',  # included in aiohttp speed.
         'Brotli~=1.0.9',  # included in aiohttp speed.
         'ciso8601~=2.2.0',  # Faster datetime parsing.
         'faust-cchardet~=2.1.16',  # cchardet for python 3.11+
+        'zstandard~=0.22',  # Faster gateway decompression with zstd-stream.
     ],
     'docs': [
         'sphinx==6.1.3',
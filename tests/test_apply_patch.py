@@ -0,0 +1,64 @@
+from pycord.missing import MISSING
+from pycord.utils import apply_patch
+
+
+class _Colour:
+    # like flags, doesn't define equality
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class _Role:
+    _patchable = {
+        'name': ('name', None),
+        'color': ('color', _Colour, '_color'),
+        'tags': ('tags', list),
+    }
+
+    def __init__(self) -> None:
+        self.name = 'role'
+        self.color = _Colour(1)
+        self._color = 1
+        self.tags = ['a']
+
+
+class _HoistedRole(_Role):
+    _patchable = {'hoist': ('hoisted', bool)}
+
+
+def test_no_op_patch_returns_nothing():
+    role = _Role()
+    color = role.color
+
+    assert apply_patch(role, {'name': 'role', 'color': 1, 'tags': ['a']}) == {}
+    assert role.color is color
+
+
+def test_patch_returns_previous_values_of_changed_fields():
+    role = _Role()
+    color = role.color
+
+    previous = apply_patch(role, {'name': 'renamed', 'color': 2, 'tags': ['a']})
+
+    assert previous == {'name': 'role', 'color': color}
+    assert role.name == 'renamed'
+    assert role.color.value == 2
+    assert role._color == 2
+
+
+def test_partial_patch_only_touches_given_fields():
+    role = _Role()
+
+    assert apply_patch(role, {'tags': ['a', 'b']}) == {'tags': ['a']}
+    assert role.name == 'role'
+    assert role.tags == ['a', 'b']
+
+
+def test_patch_uses_fields_of_bases():
+    role = _HoistedRole()
+
+    assert apply_patch(role, {'name': 'renamed', 'hoist': True}) == {
+        'name': 'role',
+        'hoisted': MISSING,
+    }
+    assert role.hoisted is True
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.events import GuildMemberAdd, MessageCreate
+from pycord.flags import Intents
+from pycord.state import CachePolicy, MessageStore, NullStore, State, Store
+
+
+async def _listener(event) -> None:
+    ...
+
+
+def _state(**options) -> State:
+    state = State(
+        cache_policy=CachePolicy(),
+        intents=Intents(guilds=True, guild_members=True, guild_messages=True),
+        **options,
+    )
+    state.bot_init(token='token', clustered=False)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_cached_without_listeners():
+    state = _state()
+
+    assert isinstance(state.store.sift('guilds'), NullStore)
+    assert isinstance(state.store.sift('members'), NullStore)
+    assert not state.cache_guild_members
+
+
+@pytest.mark.asyncio
+async def test_listeners_added_after_startup_apply_the_policy_again():
+    state = _state()
+    state.event_manager.add_event(GuildMemberAdd, _listener)
+
+    members = state.store.sift('members')
+    assert type(members) is Store
+    assert state.cache_guild_members
+    assert state.event_manager.wants('GUILD_MEMBER_ADD')
+    # messages are only cached once message events are listened to
+    assert isinstance(state.store.sift('messages'), NullStore)
+
+    member = SimpleNamespace(roles=[])
+    await members.save([1], 2, member)
+    state.event_manager.add_event(MessageCreate, _listener)
+
+    # Stores which were already caching are kept
+    assert state.store.sift('members') is members
+    assert await members.get_one([1], 2) is member
+    assert isinstance(state.store.sift('messages'), MessageStore)
+
+
+@pytest.mark.asyncio
+async def test_disabled_entities_stay_disabled():
+    state = _state()
+    state.cache_policy.members = False
+    state.event_manager.add_event(GuildMemberAdd, _listener)
+
+    assert isinstance(state.store.sift('members'), NullStore)
+    assert not state.cache_guild_members
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import stat
+from contextlib import suppress
+
+import pytest
+
+from pycord.state import CacheClient, CacheServer, RemoteStore, State
+
+
+async def _serve(server: CacheServer) -> asyncio.Task:
+    task = asyncio.create_task(server.serve())
+
+    while not CacheServer.running(server.path):
+        await asyncio.sleep(0.01)
+
+    return task
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_round_trip(tmp_path):
+    path = str(tmp_path / 'cache.sock')
+    task = await _serve(CacheServer(path))
+    client = CacheClient(path)
+    store = RemoteStore(client, 'guilds')
+
+    try:
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+
+        assert await store.save([], 1, {'name': 'guild'}) is None
+        assert await store.get_one([], 1) == {'name': 'guild'}
+        assert await store.get_ids() == [1]
+        assert await store.discard([], 1) == {'name': 'guild'}
+        assert await store.get_one([], 1) is None
+    finally:
+        store.close()
+        await _stop(task)
+
+
+@pytest.mark.asyncio
+async def test_second_server_keeps_the_first(tmp_path):
+    path = str(tmp_path / 'cache.sock')
+    task = await _serve(CacheServer(path))
+    client = CacheClient(path)
+    store = RemoteStore(client, 'guilds')
+
+    try:
+        await store.save([], 1, {'name': 'guild'})
+
+        # returns right away rather than replacing the socket
+        await asyncio.wait_for(CacheServer(path).serve(), 1)
+
+        assert await store.get_one([], 1) == {'name': 'guild'}
+        other = RemoteStore(CacheClient(path), 'guilds')
+        assert await other.get_ids() == [1]
+        other.close()
+    finally:
+        store.close()
+        await _stop(task)
+
+
+@pytest.mark.asyncio
+async def test_users_are_interned_by_the_reading_state(tmp_path):
+    path = str(tmp_path / 'cache.sock')
+    task = await _serve(CacheServer(path))
+    writer = RemoteStore(CacheClient(path), 'members')
+    writer.bind(State())
+    reader = RemoteStore(CacheClient(path), 'members')
+    state = State()
+    reader.bind(state)
+
+    try:
+        user = writer._state.users.intern(
+            {'id': '2', 'username': 'user', 'discriminator': '0', 'avatar': None}
+        )
+        await writer.save([10], 2, {'user': user})
+
+        member = await reader.get_one([10], 2)
+        assert member['user'] is state.users.get(2)
+        assert member['user'] is not user
+        assert (await reader.get_one([10], 2))['user'] is member['user']
+    finally:
+        writer.close()
+        reader.close()
+        await _stop(task)
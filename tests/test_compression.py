@@ -0,0 +1,33 @@
+import zlib
+
+from pycord.gateway.compression import ZLIB_SUFFIX, ZlibStream
+
+
+def _compress(compressor, data: bytes) -> bytes:
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def test_zlib_stream_whole_payloads():
+    compressor = zlib.compressobj()
+    stream = ZlibStream()
+
+    for payload in (b'{"op":10}', b'{"op":11}'):
+        assert stream.decompress(_compress(compressor, payload)) == payload
+
+
+def test_zlib_stream_split_payloads():
+    compressor = zlib.compressobj()
+    stream = ZlibStream(buffer_size=4)
+    payload = b'{"op":0,"d":"' + b'x' * 1000 + b'"}'
+    data = _compress(compressor, payload)
+    assert data.endswith(ZLIB_SUFFIX)
+
+    # the suffix itself is split over the last two messages
+    parts = [data[:10], data[10:-2], data[-2:]]
+
+    assert stream.decompress(parts[0]) is None
+    assert stream.decompress(parts[1]) is None
+    assert stream.decompress(parts[2]) == payload
+
+    # the buffer is reset for the next payload
+    assert stream.decompress(_compress(compressor, b'{"op":11}')) == b'{"op":11}'
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.events import GuildBanCreate, MessageCreate
+from pycord.flags import Intents
+from pycord.gateway.shard import Shard
+from pycord.state import CachePolicy, State
+
+
+async def _listener(event) -> None:
+    ...
+
+
+def _state() -> State:
+    state = State(
+        cache_policy=CachePolicy(),
+        intents=Intents(guilds=True, guild_messages=True, guild_bans=True),
+    )
+    state.bot_init(token='token', clustered=False)
+    return state
+
+
+def _shard(state: State, encoding: str = 'json') -> Shard:
+    notifier = SimpleNamespace(manager=SimpleNamespace(metrics={}))
+    return Shard(0, state, None, notifier, encoding=encoding)
+
+
+def _dispatch(event: str, sequence: int) -> bytes:
+    return f'{{"t":"{event}","s":{sequence},"op":0,"d":{{}}}}'.encode()
+
+
+@pytest.mark.asyncio
+async def test_wants_events_which_are_listened_to_or_keep_the_cache():
+    state = _state()
+    manager = state.event_manager
+
+    # guilds are always cached, and nothing caches bans
+    assert manager.wants('GUILD_CREATE')
+    assert not manager.wants('GUILD_BAN_ADD')
+    # messages aren't cached without message listeners
+    assert not manager.wants('MESSAGE_CREATE')
+
+    manager.add_event(GuildBanCreate, _listener)
+    manager.add_event(MessageCreate, _listener)
+
+    assert manager.wants('GUILD_BAN_ADD')
+    assert manager.wants('MESSAGE_CREATE')
+
+
+@pytest.mark.asyncio
+async def test_wants_events_which_are_waited_for():
+    state = _state()
+    manager = state.event_manager
+
+    assert not manager.wants('GUILD_BAN_ADD')
+
+    manager.wait_for(GuildBanCreate)
+
+    assert manager.wants('GUILD_BAN_ADD')
+
+
+@pytest.mark.asyncio
+async def test_shards_skip_unwanted_dispatches_but_keep_their_sequence():
+    state = _state()
+    shard = _shard(state)
+
+    assert shard._skippable(_dispatch('MESSAGE_CREATE', 5))
+    assert shard._sequence == 5
+
+    assert not shard._skippable(_dispatch('GUILD_CREATE', 6))
+    # decoding the dispatch is what sets the sequence then
+    assert shard._sequence == 5
+
+    state.event_manager.add_event(MessageCreate, _listener)
+
+    assert not shard._skippable(_dispatch('MESSAGE_CREATE', 7))
+
+
+@pytest.mark.asyncio
+async def test_shards_never_skip_other_payloads():
+    state = _state()
+    shard = _shard(state)
+
+    assert not shard._skippable(b'{"t":null,"s":null,"op":11,"d":null}')
+    # only JSON can be peeked into
+    assert not _shard(state, 'etf')._skippable(_dispatch('MESSAGE_CREATE', 1))
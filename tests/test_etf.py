@@ -0,0 +1,30 @@
+from pycord.gateway import etf
+
+
+def test_round_trip():
+    payload = {
+        'op': 0,
+        's': None,
+        't': 'MESSAGE_CREATE',
+        'd': {
+            'content': 'hello',
+            'tts': False,
+            'mentions': [],
+            'embeds': [{'title': 'embed', 'fields': [1, 2.5, -3]}],
+        },
+    }
+
+    assert etf.decode(etf.encode(payload)) == payload
+
+
+def test_snowflakes_decode_to_strings():
+    snowflake = 1076596453640278066
+
+    assert etf.decode(etf.encode({'id': snowflake})) == {'id': str(snowflake)}
+
+
+def test_safe_big_integers_stay_integers():
+    # above the small integer range, but not a snowflake
+    timestamp = 1_700_000_000_000
+
+    assert etf.decode(etf.encode(timestamp)) == timestamp
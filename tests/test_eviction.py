@@ -0,0 +1,98 @@
+import pytest
+
+from pycord.state import FIFOPolicy, LFUPolicy, LRUPolicy, Store, TTLPolicy, eviction
+
+
+async def _fill(store: Store, *ids: int) -> None:
+    for id in ids:
+        await store.save([], id, id)
+
+
+async def _ids(store: Store) -> list[int]:
+    return sorted(await store.get_ids())
+
+
+@pytest.mark.asyncio
+async def test_int_bound_evicts_least_recently_used():
+    store = Store(2)
+    await _fill(store, 1, 2)
+    await store.get_one([], 1)
+    await _fill(store, 3)
+
+    assert await _ids(store) == [1, 3]
+    assert store.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_writes_count_as_uses():
+    store = Store(LRUPolicy(2))
+    await _fill(store, 1, 2)
+    await store.save([], 1, 'updated')
+    await _fill(store, 3)
+
+    assert await _ids(store) == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_fifo_ignores_uses():
+    store = Store(FIFOPolicy(2))
+    await _fill(store, 1, 2)
+    await store.get_one([], 1)
+    await store.save([], 1, 'updated')
+    await _fill(store, 3)
+
+    assert await _ids(store) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_lfu_evicts_least_frequently_used():
+    store = Store(LFUPolicy(3))
+    await _fill(store, 1, 2, 3)
+
+    for _ in range(2):
+        await store.get_one([], 1)
+
+    await store.get_one([], 3)
+    await _fill(store, 4)
+
+    assert await _ids(store) == [1, 3, 4]
+
+    # ties are broken by evicting the oldest entry
+    await _fill(store, 5)
+
+    assert await _ids(store) == [1, 3, 5]
+
+
+@pytest.mark.asyncio
+async def test_ttl_expires_and_evicts_closest_to_expiring(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr(eviction.time, 'monotonic', lambda: now)
+
+    store = Store(TTLPolicy(10, max_items=2))
+    await _fill(store, 1)
+    now = 5.0
+    await _fill(store, 2)
+    await store.get_one([], 1)
+    await _fill(store, 3)
+
+    # reads don't extend an entry's life, so 1 is the closest to expiring
+    assert await _ids(store) == [2, 3]
+
+    # writes do
+    now = 12.0
+    await store.save([], 2, 'updated')
+    now = 16.0
+
+    assert await store.get_one([], 3) is None
+    assert await store.get_one([], 2) == 'updated'
+
+    assert store.stats.evictions == 2
+
+
+@pytest.mark.asyncio
+async def test_unbounded_stores_never_evict():
+    store = Store()
+    await _fill(store, *range(100))
+
+    assert len(store) == 100
+    assert store.stats.evictions == 0
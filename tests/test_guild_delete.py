@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.enums import ChannelType
+from pycord.state import State
+
+GUILD_ID = 10
+CHANNEL_ID = 20
+
+
+async def _state() -> State:
+    state = State()
+    state._available_guilds = [GUILD_ID]
+    await state.store.sift('guilds').save([GUILD_ID], GUILD_ID, {'name': 'guild'})
+    await state.store.sift('channels').save(
+        [GUILD_ID],
+        CHANNEL_ID,
+        SimpleNamespace(id=CHANNEL_ID, type=ChannelType.GUILD_TEXT),
+    )
+    await state.store.sift('members').save([GUILD_ID], 1, SimpleNamespace(roles=[]))
+    message = SimpleNamespace(author=SimpleNamespace(id=1))
+    await state.store.sift('messages').save([CHANNEL_ID], 2, message)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_unavailable_guilds_keep_their_cache():
+    state = await _state()
+    await state.event_manager.publish(
+        'GUILD_DELETE', {'id': str(GUILD_ID), 'unavailable': True}
+    )
+
+    assert await state.store.sift('channels').get_ids([GUILD_ID]) == [CHANNEL_ID]
+    assert await state.store.sift('members').get_ids([GUILD_ID]) == [1]
+    assert await state.store.sift('messages').get_ids([CHANNEL_ID]) == [2]
+    assert state._available_guilds == [GUILD_ID]
+
+
+@pytest.mark.asyncio
+async def test_left_guilds_invalidate_their_cache():
+    state = await _state()
+    await state.event_manager.publish('GUILD_DELETE', {'id': str(GUILD_ID)})
+
+    assert await state.store.sift('guilds').get_one([GUILD_ID], GUILD_ID) is None
+    assert await state.store.sift('channels').get_ids([GUILD_ID]) == []
+    assert await state.store.sift('members').get_ids([GUILD_ID]) == []
+    assert await state.store.sift('messages').get_ids([CHANNEL_ID]) == []
+    assert state._available_guilds == []
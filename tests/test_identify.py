@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from pycord.gateway.identify import IdentifyScheduler
+
+
+@pytest.mark.asyncio
+async def test_buckets():
+    scheduler = IdentifyScheduler(4)
+
+    assert [scheduler.bucket(shard_id) for shard_id in range(6)] == [0, 1, 2, 3, 0, 1]
+    assert IdentifyScheduler(0).bucket(5) == 0
+
+
+@pytest.mark.asyncio
+async def test_shards_identify_in_waves():
+    scheduler = IdentifyScheduler(2, interval=0.1)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    identified_at: dict[int, float] = {}
+
+    async def identify(shard_id: int) -> None:
+        await scheduler.wait(shard_id)
+        identified_at[shard_id] = loop.time() - start
+        scheduler.sent(shard_id)
+
+    await asyncio.gather(*(identify(shard_id) for shard_id in range(4)))
+
+    assert scheduler.identified == 4
+    assert scheduler.pending == 0
+    # the first wave goes at once, the second an interval later
+    assert identified_at[0] < 0.05 and identified_at[1] < 0.05
+    assert identified_at[2] >= 0.1 and identified_at[3] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_interval_starts_once_the_identify_is_sent():
+    scheduler = IdentifyScheduler(2, interval=0.1)
+    loop = asyncio.get_running_loop()
+    identified_at: dict[int, float] = {}
+
+    async def identify(shard_id: int, connect_time: float) -> None:
+        await scheduler.wait(shard_id)
+        await asyncio.sleep(connect_time)
+        identified_at[shard_id] = loop.time()
+        scheduler.sent(shard_id)
+
+    # shard 0 takes longer to connect than the interval, shard 2 shares its bucket
+    await asyncio.gather(identify(0, 0.2), identify(2, 0))
+
+    assert identified_at[2] - identified_at[0] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_unsent_identifies_time_out():
+    scheduler = IdentifyScheduler(1, interval=0, timeout=0.05)
+
+    await scheduler.wait(0)
+    # shard 0 never calls sent
+    await asyncio.wait_for(scheduler.wait(1), 1)
+
+    assert scheduler.identified == 0
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from pycord.state import State
+
+GUILD_ID = 123 << 22
+
+
+class _Shard:
+    id = 0
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    async def request_guild_members(self, guild_id, nonce, **options) -> None:
+        self.requests.append((guild_id, nonce, options))
+
+
+class _RateLimitedShard(_Shard):
+    def __init__(self) -> None:
+        super().__init__()
+        self.rate_limit = asyncio.Event()
+
+    async def request_guild_members(self, guild_id, nonce, **options) -> None:
+        await self.rate_limit.wait()
+        await super().request_guild_members(guild_id, nonce, **options)
+
+
+class _FailingShard(_Shard):
+    async def request_guild_members(self, guild_id, nonce, **options) -> None:
+        raise ConnectionResetError
+
+
+class _ShardManager:
+    amount = 1
+
+    def __init__(self, shard: _Shard) -> None:
+        self.shards = [shard]
+
+
+def _member(id: int) -> dict:
+    return {
+        'user': {
+            'id': str(id),
+            'username': f'user{id}',
+            'discriminator': '0',
+            'avatar': None,
+        },
+        'roles': [],
+        'joined_at': '2021-01-01T00:00:00+00:00',
+        'deaf': False,
+        'mute': False,
+    }
+
+
+def _chunk(nonce: str, index: int, count: int, members: list[dict]) -> dict:
+    return {
+        'guild_id': str(GUILD_ID),
+        'members': members,
+        'chunk_index': index,
+        'chunk_count': count,
+        'not_found': [],
+        'nonce': nonce,
+    }
+
+
+def _state(shard: _Shard | None = None) -> tuple[State, _Shard]:
+    state = State()
+    manager = _ShardManager(shard or _Shard())
+    state.shard_managers.append(manager)
+    return state, manager.shards[0]
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_wanted():
+    state, _ = _state()
+    assert state.event_manager.wants('GUILD_MEMBERS_CHUNK')
+
+
+@pytest.mark.asyncio
+async def test_request_members_gathers_published_chunks():
+    state, shard = _state()
+    request = state.request_members(GUILD_ID, query='user', limit=10, timeout=5)
+    await asyncio.sleep(0)
+
+    assert shard.requests == [
+        (
+            GUILD_ID,
+            request.nonce,
+            {'query': 'user', 'user_ids': None, 'limit': 10, 'presences': False},
+        )
+    ]
+
+    await state.event_manager.publish(
+        'GUILD_MEMBERS_CHUNK', _chunk(request.nonce, 0, 2, [_member(1)])
+    )
+    await state.event_manager.publish(
+        'GUILD_MEMBERS_CHUNK', _chunk(request.nonce, 1, 2, [_member(2)])
+    )
+
+    members = await asyncio.wait_for(request, 1)
+
+    assert [member.user.id for member in members] == [1, 2]
+    assert request.nonce not in state._member_requests
+    assert await state.store.sift('members').get_one([GUILD_ID], 2) is not None
+
+
+@pytest.mark.asyncio
+async def test_request_members_iterates_over_chunks():
+    state, _ = _state()
+    request = state.request_members(GUILD_ID, user_ids=[1], timeout=5)
+
+    await state.event_manager.publish(
+        'GUILD_MEMBERS_CHUNK', _chunk(request.nonce, 0, 1, [_member(1)])
+    )
+
+    assert [member.user.id async for member in request] == [1]
+
+
+@pytest.mark.asyncio
+async def test_request_members_times_out_between_chunks():
+    state, _ = _state()
+    request = state.request_members(GUILD_ID, timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await request
+
+    assert request.nonce not in state._member_requests
+
+
+@pytest.mark.asyncio
+async def test_request_members_times_out_once_sent():
+    state, shard = _state(_RateLimitedShard())
+    request = state.request_members(GUILD_ID, timeout=0.05)
+    await asyncio.sleep(0.1)
+
+    # waiting on the rate limit doesn't count against the timeout
+    assert not request.done
+
+    shard.rate_limit.set()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(request, 1)
+
+    assert shard.requests
+
+
+@pytest.mark.asyncio
+async def test_request_members_fails_with_its_send():
+    state, _ = _state(_FailingShard())
+    request = state.request_members(GUILD_ID, timeout=None)
+
+    with pytest.raises(ConnectionResetError):
+        await asyncio.wait_for(request, 1)
+
+    assert request.nonce not in state._member_requests
@@ -0,0 +1,65 @@
+import pytest
+
+from pycord.state import LRUPolicy, MessageStore
+
+
+async def _send(store: MessageStore, channel: int, *ids: int) -> None:
+    for id in ids:
+        await store.save([channel], id, id)
+
+
+async def _history(store: MessageStore, channel: int) -> list[int]:
+    return [message async for message in store.history(channel)]
+
+
+@pytest.mark.asyncio
+async def test_full_channel_evicts_its_own_oldest_message():
+    store = MessageStore(per_channel=2)
+    await _send(store, 10, 1, 2, 3)
+    await _send(store, 20, 4)
+
+    assert await _history(store, 10) == [3, 2]
+    assert await _history(store, 20) == [4]
+    assert store.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_global_cap_evicts_from_the_busiest_channel():
+    store = MessageStore(4, per_channel=3)
+    await _send(store, 10, 1, 2, 3)
+    await _send(store, 20, 4)
+    await _send(store, 30, 5)
+
+    # the busy channel loses its oldest message, not the quieter ones
+    assert len(store) == 4
+    assert await _history(store, 10) == [3, 2]
+    assert await _history(store, 20) == [4]
+    assert await _history(store, 30) == [5]
+
+    await _send(store, 20, 6)
+
+    assert await _history(store, 10) == [3]
+    assert await _history(store, 20) == [6, 4]
+
+    await _send(store, 30, 7)
+
+    assert len(store) == 4
+    assert await _history(store, 10) == [3]
+    assert await _history(store, 20) == [6]
+    assert await _history(store, 30) == [7, 5]
+
+
+@pytest.mark.asyncio
+async def test_discarded_messages_free_their_channel_buffer():
+    store = MessageStore(per_channel=2)
+    await _send(store, 10, 1, 2)
+    await store.discard([10], 1)
+    await _send(store, 10, 3)
+
+    assert await _history(store, 10) == [3, 2]
+    assert store.stats.evictions == 0
+
+
+def test_per_channel_rejects_custom_policies():
+    with pytest.raises(TypeError):
+        MessageStore(LRUPolicy(10), per_channel=2)
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from pycord.gateway.passthrough import PassThrough
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_let_through_by_priority():
+    passthrough = PassThrough(2, 0.05)
+    order: list[str] = []
+
+    await passthrough.acquire()
+    await passthrough.acquire()
+
+    async def waiter(name: str, priority: int) -> None:
+        await passthrough.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(waiter('presence 1', 2)),
+        asyncio.create_task(waiter('request', 1)),
+        asyncio.create_task(waiter('presence 2', 2)),
+        asyncio.create_task(waiter('session', 0)),
+    ]
+    await asyncio.gather(*tasks)
+
+    assert order == ['session', 'request', 'presence 1', 'presence 2']
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_are_skipped():
+    passthrough = PassThrough(1, 0.05)
+    await passthrough.acquire()
+
+    cancelled = asyncio.create_task(passthrough.acquire(0))
+    waiting = asyncio.create_task(passthrough.acquire(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 1)
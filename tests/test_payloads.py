@@ -0,0 +1,152 @@
+import json
+
+import pytest
+
+from pycord.gateway import payloads
+from pycord.member import Member
+from pycord.message import Message
+from pycord.missing import MISSING
+from pycord.state import State
+
+pytest.importorskip('msgspec')
+
+GUILD_ID = 290926798626357250
+
+
+def _user(id: int) -> dict:
+    return {
+        'id': str(id),
+        'username': f'user{id}',
+        'discriminator': '0',
+        'avatar': None,
+    }
+
+
+def _member(id: int) -> dict:
+    return {
+        'user': _user(id),
+        'roles': ['41771983423143936'],
+        'joined_at': '2015-04-26T06:26:56.936000+00:00',
+        'premium_since': None,
+        'deaf': False,
+        'mute': False,
+    }
+
+
+def _message() -> dict:
+    return {
+        'id': '334385199974967042',
+        'channel_id': '290926798999357250',
+        'guild_id': str(GUILD_ID),
+        'author': _user(1),
+        'member': _member(1),
+        'content': 'Supa Hot',
+        'timestamp': '2017-07-11T17:27:07.299000+00:00',
+        'edited_timestamp': None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [_user(2)],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [],
+        'pinned': False,
+        'type': 0,
+        'flags': 0,
+    }
+
+
+def _guild(members: int) -> dict:
+    return {
+        'id': str(GUILD_ID),
+        'name': 'guild',
+        'icon': None,
+        'splash': None,
+        'discovery_splash': None,
+        'owner_id': '1',
+        'verification_level': 0,
+        'default_message_notifications': 0,
+        'explicit_content_filter': 0,
+        'mfa_level': 0,
+        'system_channel_flags': 0,
+        'premium_tier': 0,
+        'preferred_locale': 'en-US',
+        'public_updates_channel_id': None,
+        'stickers': [],
+        'premium_progress_bar_enabled': False,
+        'roles': [],
+        'emojis': [],
+        'features': ['COMMUNITY'],
+        'channels': [],
+        'threads': [],
+        'stage_instances': [],
+        'guild_scheduled_events': [],
+        'members': [_member(id) for id in range(1, members + 1)],
+        'presences': [{'user': {'id': '1'}, 'status': 'online', 'activities': []}],
+        'voice_states': [],
+    }
+
+
+def _dispatch(event: str, data: dict) -> bytes:
+    # Discord sends compact JSON, with the event name first
+    return json.dumps(
+        {'t': event, 's': 1, 'op': 0, 'd': data}, separators=(',', ':')
+    ).encode()
+
+
+def test_untyped_events_decode_into_dicts():
+    payload = payloads.decode(_dispatch('TYPING_START', {'channel_id': '1'}))
+
+    assert payload == {'t': 'TYPING_START', 's': 1, 'op': 0, 'd': {'channel_id': '1'}}
+
+
+def test_mismatched_payloads_fall_back_to_dicts():
+    data = {**_message(), 'tts': 'not a bool'}
+    payload = payloads.decode(_dispatch('MESSAGE_CREATE', data))
+
+    assert payload['d'] == data
+
+
+def test_payloads_read_like_dicts():
+    d = payloads.decode(_dispatch('MESSAGE_CREATE', _message()))['d']
+
+    assert payloads.is_payload(d)
+    assert d.content == d['content'] == 'Supa Hot'
+    assert d.get('nonce', 'default') == 'default'
+    assert 'nonce' not in d and 'content' in d
+    assert d.to_dict() == _message()
+
+
+@pytest.mark.asyncio
+async def test_messages_build_from_attributes():
+    state = State()
+    d = payloads.decode(_dispatch('MESSAGE_CREATE', _message()))['d']
+
+    typed = Message._from_payload(d, state)
+    built = Message(_message(), state)
+
+    for attribute in Message.__slots__:
+        if attribute not in ('channel', 'flags'):
+            assert getattr(typed, attribute) == getattr(built, attribute), attribute
+
+    assert typed.flags.as_bit == built.flags.as_bit
+    assert typed.author is built.author
+    assert typed.nonce is MISSING
+
+
+@pytest.mark.asyncio
+async def test_guild_create_skips_presences_and_caches_members():
+    state = State()
+    state._available_guilds = []
+    d = payloads.decode(_dispatch('GUILD_CREATE', _guild(3)))['d']
+
+    assert 'presences' not in d
+    assert all(payloads.is_payload(member) for member in d.members)
+
+    await state.event_manager.publish('GUILD_CREATE', d)
+
+    members = state.store.sift('members').get_all_parent([GUILD_ID])
+    assert sorted([member.user.id async for member in members]) == [1, 2, 3]
+    member = await state.store.sift('members').get_one([GUILD_ID], 1)
+    assert isinstance(member, Member)
+    assert member.premium_since is None
+    assert member.pending is MISSING
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.gateway import metrics as metrics_module
+from pycord.gateway.metrics import ShardMetrics
+from pycord.gateway.shard import Shard
+
+
+def test_reconnects_only_count_later_connections():
+    metrics = ShardMetrics(0)
+    metrics.connected()
+
+    assert metrics.reconnects == 0
+    assert metrics.connected_at is not None
+
+    metrics.connected()
+
+    assert metrics.reconnects == 1
+
+
+def test_heartbeats_smooth_latency_and_rate_events(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(metrics_module.time, 'monotonic', lambda: now)
+
+    metrics = ShardMetrics(0)
+    metrics.events = 50
+    now = 110.0
+    metrics.heartbeat_acknowledged(0.1)
+
+    assert metrics.heartbeats == 1
+    assert metrics.latency == metrics.average_latency == 0.1
+    assert metrics.events_per_second == 5.0
+
+    metrics.events = 60
+    now = 120.0
+    metrics.heartbeat_acknowledged(0.6)
+
+    assert metrics.latency == 0.6
+    assert metrics.average_latency == pytest.approx(0.2)
+    assert metrics.events_per_second == 1.0
+
+
+def test_ratios_and_export():
+    metrics = ShardMetrics(3)
+
+    assert metrics.resume_ratio == 0.0
+    assert metrics.compression_ratio == 0.0
+
+    metrics.identifies = 1
+    metrics.resumes = 3
+    metrics.bytes_received = 100
+    metrics.bytes_inflated = 400
+    data = metrics.to_dict()
+
+    assert data['shard_id'] == 3
+    assert data['resume_ratio'] == 0.75
+    assert data['compression_ratio'] == 4.0
+    assert not any(name.startswith('_') for name in data)
+
+
+@pytest.mark.asyncio
+async def test_metrics_outlive_restarted_shards():
+    exported = []
+    state = SimpleNamespace(options={'on_shard_metrics': exported.append})
+    notifier = SimpleNamespace(manager=SimpleNamespace(metrics={}))
+
+    shard = Shard(0, state, None, notifier)
+    shard.metrics.resumes += 1
+    restarted = Shard(0, state, None, notifier)
+
+    assert restarted.metrics is shard.metrics
+    assert restarted.metrics.resumes == 1
+    assert Shard(1, state, None, notifier).metrics is not shard.metrics
+
+    restarted._export_metrics()
+
+    assert exported == [shard.metrics]
+
+
+@pytest.mark.asyncio
+async def test_failing_exports_are_logged(caplog):
+    def export(metrics: ShardMetrics) -> None:
+        raise RuntimeError
+
+    state = SimpleNamespace(options={'on_shard_metrics': export})
+    notifier = SimpleNamespace(manager=SimpleNamespace(metrics={}))
+    Shard(0, state, None, notifier)._export_metrics()
+
+    assert 'failed to export metrics' in caplog.text
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.state import State
+
+
+def _shard(id: int, session_id: str | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id,
+        session_id=session_id,
+        _sequence=42,
+        _resume_gateway_url='wss://resume.discord.gg',
+    )
+
+
+def _cluster(*shards: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(
+        shard_managers=[SimpleNamespace(amount=4, shards=list(shards))]
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(tmp_path):
+    state = State()
+    # clustered shards are only reachable through their cluster
+    state.shard_clusters.append(_cluster(_shard(0, 'session'), _shard(1, None)))
+    state.raw_user = {
+        'id': '1',
+        'username': 'bot',
+        'discriminator': '0',
+        'avatar': None,
+    }
+    await state.store.sift('guilds').save([], 10, {'name': 'guild'})
+
+    path = tmp_path / 'snapshot'
+    state.save_snapshot(str(path))
+
+    restored = State()
+    assert await restored.load_snapshot(str(path))
+
+    assert await restored.store.sift('guilds').get_one([], 10) == {'name': 'guild'}
+    assert restored.user.id == 1
+    assert restored._resumable_sessions == {
+        0: {
+            'shard_count': 4,
+            'session_id': 'session',
+            'sequence': 42,
+            'resume_gateway_url': 'wss://resume.discord.gg',
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_missing_snapshot(tmp_path):
+    assert not await State().load_snapshot(str(tmp_path / 'missing'))
+
+
+@pytest.mark.asyncio
+async def test_restored_users_are_interned(tmp_path):
+    state = State()
+    user = state.users.intern(
+        {'id': '2', 'username': 'user', 'discriminator': '0', 'avatar': None}
+    )
+    members = state.store.sift('members')
+    await members.save([10], 2, SimpleNamespace(user=user, roles=[]))
+    await members.save([20], 2, SimpleNamespace(user=user, roles=[]))
+
+    path = tmp_path / 'snapshot'
+    state.save_snapshot(str(path))
+
+    restored = State()
+    assert await restored.load_snapshot(str(path))
+
+    members = restored.store.sift('members')
+    first = await members.get_one([10], 2)
+    second = await members.get_one([20], 2)
+
+    assert first.user is not user
+    assert first.user is second.user is restored.users.get(2)
+    assert first.user.name == 'user'
@@ -0,0 +1,95 @@
+import pytest
+
+from pycord.state import SQLiteStore, State
+
+
+@pytest.mark.asyncio
+async def test_save_get_and_discard(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'cache.db'), 'guilds')
+
+    try:
+        assert await store.save([], 1, {'name': 'first'}) is None
+        assert await store.save([], 1, {'name': 'second'}) == {'name': 'first'}
+        assert await store.get_one([], 1) == {'name': 'second'}
+        assert len(store) == 1
+
+        assert await store.discard([], 1) == {'name': 'second'}
+        assert await store.get_one([], 1) is None
+        assert len(store) == 0
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_parents_and_indexes(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'cache.db'), 'channels')
+    store.add_index('type', lambda channel: channel['type'])
+
+    try:
+        await store.save_many(
+            [
+                ([10], 1, {'id': 1, 'type': 0}),
+                ([10], 2, {'id': 2, 'type': 2}),
+                ([20], 3, {'id': 3, 'type': 0}),
+            ]
+        )
+
+        assert sorted(await store.get_ids([10])) == [1, 2]
+        assert [c['id'] for c in await store.find('type', 0, [10])] == [1]
+
+        await store.delete_all_parent([10])
+
+        assert await store.get_ids() == [3]
+        assert [c['id'] for c in await store.find('type', 0)] == [3]
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_reopen(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    store = SQLiteStore(path, 'guilds', batch_size=100, flush_interval=60)
+    await store.save([], 1, {'name': 'guild'})
+    # closing commits the batched write
+    store.close()
+
+    store = SQLiteStore(path, 'guilds')
+
+    try:
+        assert await store.get_one([], 1) == {'name': 'guild'}
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_stores_share_a_file(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    guilds = SQLiteStore(path, 'guilds')
+    roles = SQLiteStore(path, 'roles')
+
+    try:
+        await guilds.save([], 1, {'name': 'guild'})
+        await roles.save([1], 2, {'name': 'role'})
+
+        assert await guilds.get_one([], 1) == {'name': 'guild'}
+        assert await roles.get_one([1], 2) == {'name': 'role'}
+    finally:
+        guilds.close()
+        roles.close()
+
+
+@pytest.mark.asyncio
+async def test_loaded_users_are_interned(tmp_path):
+    state = State()
+    user = state.users.intern(
+        {'id': '2', 'username': 'user', 'discriminator': '0', 'avatar': None}
+    )
+    store = SQLiteStore(str(tmp_path / 'cache.db'), 'members')
+    store.bind(state)
+
+    try:
+        await store.save([10], 2, {'user': user})
+
+        assert (await store.get_one([10], 2))['user'] is user
+    finally:
+        store.close()
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pycord.snowflake import Snowflake
+from pycord.state import Lazy, Store
+
+
+def _channel(id: int, type: int) -> SimpleNamespace:
+    return SimpleNamespace(id=id, type=type)
+
+
+@pytest.mark.asyncio
+async def test_find_indexes_built_lazy_entries():
+    store = Store()
+    store.add_index('type', lambda channel: channel.type)
+
+    lazy = Lazy(_channel, 1, 0)
+    lazy.resolve()
+    await store.save([10], 1, lazy)
+
+    assert [channel.id for channel in await store.find('type', 0)] == [1]
+
+
+@pytest.mark.asyncio
+async def test_find_indexes_unbuilt_lazy_entries_on_lookup():
+    store = Store()
+    store.add_index('type', lambda channel: channel.type)
+
+    lazy = Lazy(_channel, 1, 2)
+    await store.save([10], 1, lazy)
+
+    assert not lazy.built
+    assert [channel.id for channel in await store.find('type', 2, [10])] == [1]
+    assert await store.find('type', 2, [11]) == []
+
+
+@pytest.mark.asyncio
+async def test_snowflake_and_int_keys_resolve_to_the_same_entry():
+    store = Store()
+    await store.save([Snowflake(10)], Snowflake(1), 'first')
+
+    assert await store.get_one([10], 1) == 'first'
+    assert await store.save([10], 1, 'second') == 'first'
+    assert len(store) == 1
+    assert await store.get_one([Snowflake(10)], Snowflake(1)) == 'second'
+    assert await store.get_ids([Snowflake(10)]) == [1]
+
+    await store.discard([Snowflake(10)], 1)
+
+    assert await store.get_one([10], Snowflake(1)) is None